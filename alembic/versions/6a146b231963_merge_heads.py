@@ -1,7 +1,7 @@
 """merge heads
 
 Revision ID: 6a146b231963
-Revises: 11e2442262fc, f325d6bb53b5
+Revises: f325d6bb53b5
 Create Date: 2025-11-21 10:28:45.235071
 
 """
@@ -15,11 +15,16 @@ from pgvector.sqlalchemy import Vector
 
 # revision identifiers, used by Alembic.
 revision: str = '6a146b231963'
-down_revision: Union[str, Sequence[str], None] = ('11e2442262fc', 'f325d6bb53b5')
+down_revision: Union[str, Sequence[str], None] = 'f325d6bb53b5'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Formerly merged the 11e2442262fc and f325d6bb53b5 branches. The history is
+# now linear (8d0e1624c763 follows 11e2442262fc), so this is a plain no-op
+# step, kept so databases already stamped at this revision still resolve.
+
+
 def upgrade() -> None:
     """Upgrade schema."""
     pass
@@ -1,7 +1,7 @@
 """add bid synopsis requirements and ceigall data tables
 
 Revision ID: 8d0e1624c763
-Revises: 8510f89a1838
+Revises: 11e2442262fc
 Create Date: 2025-11-20 05:40:47.071346
 
 """
@@ -15,7 +15,7 @@ from pgvector.sqlalchemy import Vector
 
 # revision identifiers, used by Alembic.
 revision: str = '8d0e1624c763'
-down_revision: Union[str, Sequence[str], None] = '8510f89a1838'
+down_revision: Union[str, Sequence[str], None] = '11e2442262fc'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -0,0 +1,52 @@
+"""bid_synopsis_values server-side timestamps
+
+Revision ID: a8c2e6f1d540
+Revises: f6b1d4e7a203
+Create Date: 2025-11-24 16:27:19.572048
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2e6f1d540'
+down_revision: Union[str, Sequence[str], None] = 'f6b1d4e7a203'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values were written as naive UTC, so reinterpret them as UTC.
+    # Both columns change in one ALTER TABLE (one table rewrite, one lock).
+    op.execute("""
+        ALTER TABLE bid_synopsis_values
+            ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at SET DEFAULT now(),
+            ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+            ALTER COLUMN updated_at SET DEFAULT now()
+    """)
+    # Keep updated_at current on UPDATE without the application sending it
+    op.execute("CREATE EXTENSION IF NOT EXISTS moddatetime")
+    op.execute("""
+        CREATE TRIGGER bid_synopsis_values_set_updated_at
+            BEFORE UPDATE ON bid_synopsis_values
+            FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS bid_synopsis_values_set_updated_at ON bid_synopsis_values")
+    op.execute("""
+        ALTER TABLE bid_synopsis_values
+            ALTER COLUMN created_at DROP DEFAULT,
+            ALTER COLUMN created_at TYPE timestamp USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN updated_at DROP DEFAULT,
+            ALTER COLUMN updated_at TYPE timestamp USING updated_at AT TIME ZONE 'UTC'
+    """)
@@ -0,0 +1,55 @@
+"""bid synopsis composite lookup indexes
+
+Revision ID: b7e4c2a9d015
+Revises: 6a146b231963
+Create Date: 2025-11-24 09:12:31.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2a9d015'
+down_revision: Union[str, Sequence[str], None] = '6a146b231963'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, position column) for each bid synopsis table
+BID_SYNOPSIS_TABLES = [
+    ('bid_synopsis_requirements', 'requirement_index'),
+    ('bid_synopsis_ceigall_data', 'data_index'),
+    ('bid_synopsis_extracted_values', 'value_index'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replace the tender_id-only index with (tender_id, <index>) so both the
+    # "all rows for a tender" load and the per-item upsert lookup are served
+    # by a single range scan. The user_id indexes stay to back the FK.
+    for table, index_column in BID_SYNOPSIS_TABLES:
+        op.drop_index(op.f(f'ix_{table}_tender_id'), table_name=table)
+        op.create_index(
+            f'ix_{table}_lookup',
+            table,
+            ['tender_id', index_column],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in BID_SYNOPSIS_TABLES:
+        op.drop_index(f'ix_{table}_lookup', table_name=table)
+        op.create_index(
+            op.f(f'ix_{table}_tender_id'),
+            table,
+            ['tender_id'],
+            unique=False
+        )
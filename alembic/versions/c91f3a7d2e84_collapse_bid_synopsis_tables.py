@@ -0,0 +1,119 @@
+"""collapse bid synopsis tables into bid_synopsis_values
+
+Revision ID: c91f3a7d2e84
+Revises: b7e4c2a9d015
+Create Date: 2025-11-24 11:03:52.640117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c91f3a7d2e84'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c2a9d015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# kind -> (legacy table, position column, value column, original value column)
+LEGACY_TABLES = {
+    'requirement': ('bid_synopsis_requirements', 'requirement_index', 'edited_requirement', 'original_requirement'),
+    'ceigall': ('bid_synopsis_ceigall_data', 'data_index', 'ceigall_value', None),
+    'extracted_value': ('bid_synopsis_extracted_values', 'value_index', 'extracted_value', None),
+}
+
+bid_synopsis_kind = sa.Enum(*LEGACY_TABLES.keys(), name='bidsynopsiskind')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One table for all edited synopsis values, LIST-partitioned by kind so
+    # each kind keeps its own heap while the UI reads them in one query.
+    op.create_table(
+        'bid_synopsis_values',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('kind', bid_synopsis_kind, nullable=False),
+        sa.Column('tender_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=True),
+        sa.Column('ord', sa.Integer(), nullable=False),
+        sa.Column('original_value', sa.Text(), nullable=True),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', 'kind'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        postgresql_partition_by='LIST (kind)',
+    )
+    for kind in LEGACY_TABLES:
+        op.execute(
+            f"CREATE TABLE bid_synopsis_values_{kind} "
+            f"PARTITION OF bid_synopsis_values FOR VALUES IN ('{kind}')"
+        )
+    op.create_index(
+        'ix_bid_synopsis_values_lookup',
+        'bid_synopsis_values',
+        ['tender_id', 'kind', 'ord'],
+        unique=False
+    )
+    op.create_index(
+        op.f('ix_bid_synopsis_values_user_id'),
+        'bid_synopsis_values',
+        ['user_id'],
+        unique=False
+    )
+
+    # Copy existing edits. These tables only hold user edits (a few hundred
+    # rows per tender at most), so one INSERT ... SELECT per kind suffices.
+    for kind, (table, index_column, value_column, original_column) in LEGACY_TABLES.items():
+        op.execute(
+            f"INSERT INTO bid_synopsis_values "
+            f"(id, kind, tender_id, user_id, ord, original_value, value, created_at, updated_at) "
+            f"SELECT id, '{kind}', tender_id, user_id, {index_column}, "
+            f"{original_column or 'NULL'}, {value_column}, created_at, updated_at FROM {table}"
+        )
+        op.drop_table(table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for kind, (table, index_column, value_column, original_column) in LEGACY_TABLES.items():
+        columns = [
+            sa.Column('id', sa.UUID(), nullable=False),
+            sa.Column('tender_id', sa.String(), nullable=False),
+            sa.Column('user_id', sa.UUID(), nullable=True),
+            sa.Column(index_column, sa.Integer(), nullable=False),
+        ]
+        if original_column:
+            columns.append(sa.Column(original_column, sa.Text(), nullable=True))
+        columns += [
+            sa.Column(value_column, sa.Text(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+        ]
+        op.create_table(
+            table,
+            *columns,
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        )
+        op.create_index(f'ix_{table}_lookup', table, ['tender_id', index_column], unique=False)
+        op.create_index(op.f(f'ix_{table}_user_id'), table, ['user_id'], unique=False)
+
+        original_select = 'original_value, ' if original_column else ''
+        original_insert = f'{original_column}, ' if original_column else ''
+        op.execute(
+            f"INSERT INTO {table} "
+            f"(id, tender_id, user_id, {index_column}, {original_insert}{value_column}, created_at, updated_at) "
+            f"SELECT id, tender_id, user_id, ord, {original_select}value, created_at, updated_at "
+            f"FROM bid_synopsis_values WHERE kind = '{kind}'"
+        )
+
+    op.drop_index(op.f('ix_bid_synopsis_values_user_id'), table_name='bid_synopsis_values')
+    op.drop_index('ix_bid_synopsis_values_lookup', table_name='bid_synopsis_values')
+    op.drop_table('bid_synopsis_values')  # Drops the partitions with it
+    bid_synopsis_kind.drop(op.get_bind(), checkfirst=True)
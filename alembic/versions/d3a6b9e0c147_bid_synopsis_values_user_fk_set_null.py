@@ -0,0 +1,41 @@
+"""bid_synopsis_values user fk on delete set null
+
+Revision ID: d3a6b9e0c147
+Revises: c91f3a7d2e84
+Create Date: 2025-11-24 12:20:14.905331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a6b9e0c147'
+down_revision: Union[str, Sequence[str], None] = 'c91f3a7d2e84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # user_id is nullable, so deleting a user should just detach their edits.
+    # ix_bid_synopsis_values_user_id (leading on user_id) keeps the FK check
+    # on user delete/update an index scan instead of a child-table seq scan.
+    op.drop_constraint(op.f('bid_synopsis_values_user_id_fkey'), 'bid_synopsis_values', type_='foreignkey')
+    op.create_foreign_key(
+        op.f('bid_synopsis_values_user_id_fkey'), 'bid_synopsis_values', 'users',
+        ['user_id'], ['id'], ondelete='SET NULL', onupdate='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('bid_synopsis_values_user_id_fkey'), 'bid_synopsis_values', type_='foreignkey')
+    op.create_foreign_key(
+        op.f('bid_synopsis_values_user_id_fkey'), 'bid_synopsis_values', 'users',
+        ['user_id'], ['id']
+    )
@@ -0,0 +1,64 @@
+"""bid_synopsis_values time-ordered uuid v7 ids
+
+Revision ID: e5f0a2c8b391
+Revises: d3a6b9e0c147
+Create Date: 2025-11-24 13:41:07.218664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f0a2c8b391'
+down_revision: Union[str, Sequence[str], None] = 'd3a6b9e0c147'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The pgvector/pg17 image ships neither pg_uuidv7 nor a native uuidv7(),
+    # so define uuid_generate_v7() in SQL unless an extension already did:
+    # a v4 UUID whose first 48 bits are replaced by the Unix time in ms and
+    # whose version nibble is set to 7.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'uuid_generate_v7') THEN
+                CREATE FUNCTION uuid_generate_v7() RETURNS uuid AS $fn$
+                    SELECT encode(
+                        set_bit(
+                            set_bit(
+                                overlay(uuid_send(gen_random_uuid())
+                                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                                        FROM 1 FOR 6),
+                                52, 1),
+                            53, 1),
+                        'hex')::uuid;
+                $fn$ LANGUAGE sql VOLATILE;
+            END IF;
+        END
+        $$;
+    """)
+    # Time-ordered ids append to the right edge of the primary key btree
+    # instead of splitting random pages like uuid4 does.
+    op.alter_column(
+        'bid_synopsis_values', 'id',
+        existing_type=sa.UUID(),
+        server_default=sa.text('uuid_generate_v7()'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'bid_synopsis_values', 'id',
+        existing_type=sa.UUID(),
+        server_default=None,
+    )
+    # The function is left in place: it may predate this revision (extension).
@@ -0,0 +1,43 @@
+"""tender_analysis.bid_synopsis_json to jsonb
+
+Revision ID: f6b1d4e7a203
+Revises: e5f0a2c8b391
+Create Date: 2025-11-24 15:08:46.330912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b1d4e7a203'
+down_revision: Union[str, Sequence[str], None] = 'e5f0a2c8b391'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'tender_analysis', 'bid_synopsis_json',
+        existing_type=postgresql.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='bid_synopsis_json::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'tender_analysis', 'bid_synopsis_json',
+        existing_type=postgresql.JSONB(),
+        type_=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using='bid_synopsis_json::json',
+    )
@@ -1,26 +1,44 @@
+import importlib
+
 from fastapi import APIRouter
 from app.modules.health import health
-from app.modules.askai.router import router as askai_router
-from app.modules.auth.route import router as auth_router
-from app.modules.tenderiq.router import router as tenderiq_router
-from app.modules.dmsiq.route import router as dmsiq_router
-from app.modules.bidsynopsis.router import router as bidsynopsis_router
-from app.modules.analyze.router import router as analyze_router
 
 api_v1_router = APIRouter()
 
 # General v1 endpoints
 api_v1_router.include_router(health.router)
 
-# Feature module routers
-api_v1_router.include_router(auth_router, prefix="/auth")
-api_v1_router.include_router(askai_router, prefix="/askai")
-api_v1_router.include_router(tenderiq_router, prefix="/tenderiq")
-api_v1_router.include_router(dmsiq_router, prefix="/dms", tags=["DMS"])
-api_v1_router.include_router(bidsynopsis_router, prefix="/bidsynopsis", tags=["Bid Synopsis"])
-api_v1_router.include_router(analyze_router, prefix="/analyze", tags=["Analyze"])
+# Feature module routers: (module path, prefix, include_router kwargs).
+# These pull in LangChain, SentenceTransformers, Weaviate, etc., so they are
+# imported by include_feature_routers() when the app is built rather than
+# whenever this module is imported.
+FEATURE_ROUTERS = [
+    ("app.modules.auth.route", "/auth", {}),
+    ("app.modules.askai.router", "/askai", {}),
+    ("app.modules.tenderiq.router", "/tenderiq", {}),
+    ("app.modules.dmsiq.route", "/dms", {"tags": ["DMS"]}),
+    ("app.modules.bidsynopsis.router", "/bidsynopsis", {"tags": ["Bid Synopsis"]}),
+    ("app.modules.analyze.router", "/analyze", {"tags": ["Analyze"]}),
+]
+
+_feature_routers_mounted = False
+
+
+def _mount(app_router: APIRouter, module: str, prefix: str, attr: str = "router", **kwargs) -> None:
+    """Import a feature module and include its router under the given prefix."""
+    mod = importlib.import_module(module)
+    app_router.include_router(getattr(mod, attr), prefix=prefix, **kwargs)
+
+
+def include_feature_routers() -> APIRouter:
+    """Mount all feature module routers on api_v1_router (idempotent)."""
+    global _feature_routers_mounted
+    if not _feature_routers_mounted:
+        for module, prefix, kwargs in FEATURE_ROUTERS:
+            _mount(api_v1_router, module, prefix, **kwargs)
+        _feature_routers_mounted = True
+    return api_v1_router
 
 
 # In the future, you can add other module routers here:
-# from app.modules.dashboard.router import router as dashboard_router
-# api_v1_router.include_router(dashboard_router, prefix="/dashboard", tags=["Dashboard"])
+# ("app.modules.dashboard.router", "/dashboard", {"tags": ["Dashboard"]}),
@@ -1,16 +1,72 @@
 """
 Global Celery application instance.
 """
+import logging
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 celery_app = Celery(
     "worker",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND_URL,
-    include=["app.modules.tenderiq.analyze.tasks"]  # Auto-discover tasks from this module
+    include=["app.modules.tenderiq.tasks", "app.modules.analyze.tasks"]  # Auto-discover tasks from these modules
 )
 
 celery_app.conf.update(
     task_track_started=True,
+    # Serialization: task args/results are plain dicts and strings
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # Broker connections
+    broker_pool_limit=20,
+    broker_connection_retry_on_startup=True,
+    # Tasks are long-running; don't let one worker hoard prefetched messages
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # Result backend
+    result_backend_transport_options={"visibility_timeout": 3600, "global_keyprefix": "celery:"},
+    result_expires=3600,
+    # Recycle children periodically to bound memory growth from model/SDK clients
+    worker_max_tasks_per_child=200,
 )
+
+
+@worker_init.connect
+def _preload_models(**kwargs):
+    """
+    Load the embedding model and tokenizer in the parent worker process
+    before the pool forks, so children share them copy-on-write instead of
+    each loading their own copy on first use. The report renderers' styles
+    and font metrics are warmed the same way.
+    """
+    from app.core.ai_models import get_embedding_model, get_tokenizer
+    get_embedding_model()
+    get_tokenizer()
+
+    from app.modules.analyze.services.analysis_report_service import warm_up_renderers
+    warm_up_renderers()
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """
+    Per-child setup after fork: give the child its own Redis and PostgreSQL
+    connections, and build the Gemini client (it owns gRPC channels, which
+    must not cross a fork) before the first task rather than during it.
+    """
+    from app.db.redis_client import reset_redis_pool
+    from app.db.database import engine
+    reset_redis_pool()
+    # Forget (don't close) connections inherited from the parent process
+    engine.dispose(close=False)
+
+    from app.core.langchain_config import get_langchain_llm
+    try:
+        get_langchain_llm()
+    except ValueError as e:
+        logger.warning("Skipping LLM warm-up: %s", e)
@@ -0,0 +1,70 @@
+"""
+Process-wide AI model singletons.
+
+Kept separate from app.core.services so they can be loaded without the
+Gemini/Weaviate client setup that services performs at import time. The
+Celery worker loads them in the parent process before forking, so the
+read-only weights are shared copy-on-write by every pool child.
+"""
+import functools
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+TOKENIZER_ENCODING = "cl100k_base"
+MODEL_CACHE_DIR = "./model_cache"
+
+_embedding_model = None
+
+
+def _configure_torch_threads() -> None:
+    """
+    Size torch's CPU thread pools before the first forward pass. Without this
+    torch picks its own count, which is often far from the core count inside
+    containers; half the cores leaves room for the API/Celery event loop.
+    """
+    import torch
+    from app.config import settings
+
+    num_threads = settings.EMBED_NUM_THREADS or max(1, (os.cpu_count() or 1) // 2)
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Only allowed before any inter-op work has started in this process
+        logger.debug("torch inter-op thread count already fixed")
+    logger.info("Embedding model using %d torch threads", num_threads)
+
+
+def get_embedding_model():
+    """Lazy-load the SentenceTransformer embedding model (once per process tree)."""
+    global _embedding_model
+    if _embedding_model is None:
+        from app.config import settings
+        backend = settings.EMBED_BACKEND
+        print(f"Loading SentenceTransformer model ({backend} backend)...")
+        _configure_torch_threads()
+        from sentence_transformers import SentenceTransformer
+        # ONNX/OpenVINO run the same weights through an optimized graph; an
+        # explicit file selects a pre-exported (e.g. O4-optimized) variant.
+        model_kwargs = {"file_name": settings.EMBED_MODEL_FILE} if settings.EMBED_MODEL_FILE else None
+        # Weights are loaded from safetensors (mmap-backed) and the model is
+        # inference-only, so put it in eval mode once up front.
+        _embedding_model = SentenceTransformer(
+            EMBEDDING_MODEL_NAME,
+            cache_folder=MODEL_CACHE_DIR,
+            device="cpu",
+            backend=backend,
+            model_kwargs=model_kwargs,
+        ).eval()
+        print("✅ SentenceTransformer loaded")
+    return _embedding_model
+
+
+@functools.cache
+def get_tokenizer():
+    """Lazy-load the tiktoken BPE encoding (parsed once per process tree)."""
+    import tiktoken
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
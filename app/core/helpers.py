@@ -1,34 +1,60 @@
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+_NON_NUMERIC = re.compile(r"[^0-9.]")
+_STARTING_NUMBER = re.compile(r'^\d+\.')
+
+# Checked in order; the first unit found in the string wins.
+_CURRENCY_MULTIPLIERS = {
+    "crore": 10000000.0,
+    "lakh": 100000.0,
+    "thousand": 1000.0,
+}
+
+
 def get_number_from_currency_string(currency: str) -> float:
     """
     Convert currency string like "1 Crore", "10 Lakhs" to number
     """
     try:
-        if "crore" in currency.lower():
-            number_str = re.sub("[^0-9.]", "", currency)
-            return float(number_str) * 10000000
-        elif "lakh" in currency.lower():
-            number_str = re.sub("[^0-9.]", "", currency)
-            return float(number_str) * 100000
-        elif "thousand" in currency.lower():
-            number_str = re.sub("[^0-9.]", "", currency)
-            return float(number_str) * 1000
-        else:
-            currency = currency.split(".")[0]
-            regexed = re.sub("[^0-9.]", "", currency)
-            if regexed:
-                return float(regexed)
-            else:
-                return 0.0
-
-    except Exception as e:
-        print(e)
+        lowered = currency.lower()
+        multiplier = next((m for unit, m in _CURRENCY_MULTIPLIERS.items() if unit in lowered), None)
+        if multiplier is not None:
+            return float(_NON_NUMERIC.sub("", lowered)) * multiplier
+
+        regexed = _NON_NUMERIC.sub("", lowered.split(".")[0])
+        return float(regexed) if regexed else 0.0
+
+    except Exception:
+        logger.exception("Could not parse currency string %r", currency)
         return 0.0
 
+
+def parse_currency_series(values):
+    """
+    Vectorized get_number_from_currency_string for a pandas Series.
+
+    Unparseable values become 0.0, matching the scalar version.
+    """
+    import numpy as np
+    import pandas as pd
+
+    lowered = values.astype(str).str.lower()
+    multipliers = np.select(
+        [lowered.str.contains(unit, regex=False) for unit in _CURRENCY_MULTIPLIERS],
+        list(_CURRENCY_MULTIPLIERS.values()),
+        default=1.0,
+    )
+    has_unit = pd.Series(multipliers != 1.0, index=values.index)
+    source = lowered.where(has_unit, lowered.str.split(".", n=1).str[0])
+    numbers = pd.to_numeric(source.str.replace(_NON_NUMERIC, "", regex=True), errors="coerce")
+    return (numbers * multipliers).fillna(0.0)
+
 def remove_starting_numbers(text: str) -> str:
     """
     Removes starting numbers from a string
     Example: "1. This is a string" -> "This is a string"
     """
-    return re.sub(r'^\d+\.', '', text)
+    return _STARTING_NUMBER.sub('', text)
@@ -4,18 +4,32 @@ LangChain Configuration and Setup
 Phase 1: Foundation setup for LangChain integration
 """
 
+import os
+from functools import lru_cache
+
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from app.config import settings
 
+# fastembed runs an ONNX export of the same MiniLM weights on ONNX Runtime,
+# so vectors stay compatible with the ones SentenceTransformer writes to Weaviate.
+try:
+    from langchain_community.embeddings import FastEmbedEmbeddings
+    import fastembed  # noqa: F401
+    HAS_FASTEMBED = True
+except ImportError:
+    HAS_FASTEMBED = False
+
 print("🔗 Initializing LangChain configuration...")
 
 
 # ==================== LLM Configuration ====================
 
+@lru_cache(maxsize=1)
 def get_langchain_llm() -> ChatGoogleGenerativeAI:
-    """Initialize and return the LangChain ChatGoogleGenerativeAI model."""
+    """Initialize and return the LangChain ChatGoogleGenerativeAI model (cached per process)."""
     if not settings.GOOGLE_API_KEY:
         raise ValueError("GOOGLE_API_KEY not configured")
 
@@ -34,14 +48,28 @@ def get_langchain_llm() -> ChatGoogleGenerativeAI:
 
 # ==================== Embeddings Configuration ====================
 
-def get_langchain_embeddings() -> HuggingFaceEmbeddings:
-    """Initialize HuggingFace embeddings model (all-MiniLM-L6-v2)."""
+def get_langchain_embeddings() -> Embeddings:
+    """
+    Initialize the all-MiniLM-L6-v2 embeddings model.
+
+    Uses fastembed (ONNX Runtime) when installed and falls back to the
+    PyTorch-backed HuggingFaceEmbeddings otherwise.
+    """
+    if HAS_FASTEMBED:
+        embeddings = FastEmbedEmbeddings(
+            model_name="sentence-transformers/all-MiniLM-L6-v2",
+            threads=os.cpu_count(),
+            batch_size=64,
+        )
+        print("✅ LangChain Embeddings initialized (fastembed ONNX all-MiniLM-L6-v2)")
+        return embeddings
+
     embeddings = HuggingFaceEmbeddings(
         model_name="all-MiniLM-L6-v2",
         model_kwargs={"device": "cpu"},
         encode_kwargs={
-            "show_progress_bar": True,
-            "batch_size": 32,
+            "show_progress_bar": False,
+            "batch_size": 64,
         },
     )
 
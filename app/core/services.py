@@ -1,32 +1,21 @@
 from typing import Optional
 from google.generativeai.client import configure
 from google.generativeai.generative_models import GenerativeModel
-import tiktoken
 import weaviate
 import google.generativeai as genai
 from weaviate.client import WeaviateClient
 
 from app.config import settings
+from app.core.ai_models import get_embedding_model, get_tokenizer
 from app.modules.askai.models.document import UploadJob
 from app.db.vector_store import VectorStoreManager
 
 print("--- Initializing Core Services ---")
 
 # Lazy-loaded globals
-_embedding_model = None
 _pdf_processor = None
 _excel_processor = None
 
-def get_embedding_model():
-    """Lazy-load the embedding model only when needed"""
-    global _embedding_model
-    if _embedding_model is None:
-        print("Loading SentenceTransformer model...")
-        from sentence_transformers import SentenceTransformer
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2", cache_folder="./model_cache")
-        print("✅ SentenceTransformer loaded")
-    return _embedding_model
-
 def get_vector_store():
     """Lazy-load the vector store"""
     global vector_store
@@ -39,7 +28,7 @@ def get_pdf_processor():
     global _pdf_processor
     if _pdf_processor is None:
         from app.modules.askai.services.document_service import PDFProcessor
-        _pdf_processor = PDFProcessor(get_embedding_model(), tokenizer)
+        _pdf_processor = PDFProcessor(get_embedding_model(), get_tokenizer())
     return _pdf_processor
 
 def get_excel_processor():
@@ -47,7 +36,7 @@ def get_excel_processor():
     global _excel_processor
     if _excel_processor is None:
         from app.modules.askai.services.document_service import ExcelProcessor
-        _excel_processor = ExcelProcessor(get_embedding_model(), tokenizer)
+        _excel_processor = ExcelProcessor(get_embedding_model(), get_tokenizer())
     return _excel_processor
 
 try:
@@ -75,8 +64,6 @@ try:
         weaviate_client = None
         vector_store = None
     
-    tokenizer = tiktoken.get_encoding("cl100k_base")
-
     # pdf_processor and excel_processor will be loaded lazily
     pdf_processor = None  # Use get_pdf_processor() instead
     excel_processor = None  # Use get_excel_processor() instead
@@ -1,19 +1,59 @@
 """
 Reusable Redis client for the application.
 """
+from typing import Optional
+
 import redis
 from app.config import settings
 
+# Shared connection pool, created on first use. Celery resets it after fork
+# (see app.celery_app) so each worker process builds its own sockets.
+_pool: Optional[redis.ConnectionPool] = None
+
+
+def get_redis_pool() -> redis.ConnectionPool:
+    """
+    Returns the process-wide Redis connection pool, creating it lazily.
+    """
+    global _pool
+    if _pool is None:
+        _pool = redis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            decode_responses=True,  # Decode responses to strings by default
+            max_connections=50,
+            timeout=5,  # Seconds to wait for a free connection
+            # Fail fast when Redis is unreachable: callers treat RedisError as a
+            # cache miss, so a blackholed host must not hang requests until the
+            # OS TCP timeout
+            socket_connect_timeout=1,
+            socket_timeout=2,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _pool
+
+
+def reset_redis_pool() -> None:
+    """
+    Drop the current pool without closing its sockets. Call in a freshly
+    forked child so it never reuses connections owned by the parent.
+    """
+    global _pool
+    _pool = None
+
+
 def get_redis_client() -> redis.Redis:
     """
-    Returns a Redis client instance connected to the configured Redis server.
+    Returns a Redis client backed by the shared connection pool.
     """
-    return redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=settings.REDIS_DB,
-        decode_responses=True  # Decode responses to strings by default
-    )
-
-# A singleton instance for reuse across the application
-redis_client = get_redis_client()
+    return redis.Redis(connection_pool=get_redis_pool())
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from app.db.redis_client import redis_client`
+    # without opening a pool at import time.
+    if name == "redis_client":
+        return get_redis_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
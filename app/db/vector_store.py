@@ -1,21 +1,96 @@
+import asyncio
 import re
 import uuid
-import traceback
-from typing import List, Tuple, Dict
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple, Dict
 
+import numpy as np
 import weaviate
 import weaviate.classes.config as wvc
+from weaviate.classes.query import MetadataQuery
 from weaviate.client import WeaviateClient
 from weaviate.collections.collection import Collection
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Texts per encoder forward pass when embedding chunks
+EMBED_BATCH_SIZE = 32
+
+# Weaviate batch settings: objects per HTTP request and requests in flight
+INSERT_BATCH_SIZE = 100
+INSERT_CONCURRENT_REQUESTS = 4
+
+# HNSW graph parameters. Collections are small (one chat or tender each) and
+# RAG reads at most RAG_TOP_K neighbours, so a sparser graph and a fixed
+# search list keep traversal short without hurting recall at that size.
+HNSW_EF = 64
+HNSW_EF_CONSTRUCTION = 128
+HNSW_MAX_CONNECTIONS = 16
+
+# Characters not allowed in a Weaviate collection name
+_TENDER_ID_UNSAFE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Chroma metadata values / ids may only contain these characters
+_CHROMA_META_UNSAFE = re.compile(r'[^\w\s\-\.\,\/]')
+_CHROMA_ID_UNSAFE = re.compile(r'[^\w\-]')
+
+# Tender query callers only read the text (plus source/page for citations);
+# skip the other stored properties on the wire
+TENDER_RETURN_PROPERTIES = ["content", "document_name", "page_number"]
+
+# Max distinct query strings whose embeddings are kept in memory (~1.5 KB each at 384 dims)
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _encode_query(embedding_model, query: str) -> np.ndarray:
+    """
+    Embed a single query string, memoized per (model, query).
+
+    The model instance is part of the key, so swapping models never serves a
+    stale vector. Returned as a read-only 1-D array (passed straight to the
+    vector store, no per-float boxing) so the cached value can't be mutated.
+    Unit-normalized, like the stored chunk vectors.
+    """
+    vector = embedding_model.encode(query, show_progress_bar=False, convert_to_numpy=True,
+                                    normalize_embeddings=True)
+    vector.flags.writeable = False
+    return vector
+
+
+def _vector_index_config():
+    """
+    HNSW config shared by chat and tender collections. Distance is pinned to
+    cosine so `similarity = 1 - distance` in the query methods stays valid
+    regardless of server defaults.
+    """
+    return wvc.Configure.VectorIndex.hnsw(
+        distance_metric=wvc.VectorDistances.COSINE,
+        ef=max(HNSW_EF, settings.RAG_TOP_K),  # ef below the result limit would truncate results
+        ef_construction=HNSW_EF_CONSTRUCTION,
+        max_connections=HNSW_MAX_CONNECTIONS,
+    )
+
+
+def _tender_collection_name(tender_id: str) -> str:
+    """Weaviate collection name for a tender (must start with an uppercase letter)."""
+    return f"Tender_{_TENDER_ID_UNSAFE.sub('_', tender_id)}"
+
+
+def _object_uuid(*parts) -> uuid.UUID:
+    """Deterministic object UUID, so re-sending the same chunk overwrites instead of duplicating."""
+    return uuid.uuid5(uuid.NAMESPACE_OID, "\x1f".join(str(p) for p in parts))
+
+
 class VectorStoreManager:
     """Manages Weaviate collections"""
     
     def __init__(self, weaviate_client: WeaviateClient, embedding_model):
         self.client = weaviate_client
         self.embedding_model = embedding_model
-        print("✅ VectorStoreManager initialized")
+        logger.info("VectorStoreManager initialized")
     
     def similarity_search(self, collection_name: str, query_text: str, limit: int):
         if not self.client:
@@ -31,10 +106,10 @@ class VectorStoreManager:
         collection_name = f"Chat_{chat_id.replace('-', '')}"
         
         if self.client.collections.exists(collection_name):
-            print(f"📂 Retrieved Weaviate collection: {collection_name}")
+            logger.debug("Retrieved Weaviate collection: %s", collection_name)
             return self.client.collections.get(collection_name)
         
-        print(f"📂 Creating Weaviate collection: {collection_name}")
+        logger.info("Creating Weaviate collection: %s", collection_name)
         # Note: 'page' is stored as TEXT because it can be 'unknown'.
         return self.client.collections.create(
             name=collection_name,
@@ -47,81 +122,138 @@ class VectorStoreManager:
                 wvc.Property(name="type", data_type=wvc.DataType.TEXT),
             ],
             vectorizer_config=wvc.Configure.Vectorizer.none(),
+            vector_index_config=_vector_index_config(),
         )
     
-    def add_chunks(self, collection: Collection, chunks: List[Dict]) -> int:
-        """Add chunks to Weaviate collection"""
+    def _embed_documents(self, texts: List[str], show_progress_bar: bool = False):
+        """
+        Embed chunk texts in one call. SentenceTransformer.encode already sorts
+        the inputs by length before batching (and restores the original order),
+        so each batch is padded only to its own longest text; pass the full list
+        rather than pre-splitting it, or that sorting only sees one slice.
+        """
+        # Progress bar stays off by default: tqdm writes to stderr on every batch and
+        # can crash silently in non-interactive environments
+        return self.embedding_model.encode(texts, show_progress_bar=show_progress_bar,
+                                           batch_size=EMBED_BATCH_SIZE, convert_to_numpy=True,
+                                           normalize_embeddings=True)
+
+    def _batch_insert(self, collection: Collection, data_objects: List[Dict], vectors, uuids: List[uuid.UUID]) -> int:
+        """
+        Upload objects with fixed-size batches; objects that fail are retried once.
+        Returns the number of objects stored.
+        """
+        with collection.batch.fixed_size(batch_size=INSERT_BATCH_SIZE,
+                                         concurrent_requests=INSERT_CONCURRENT_REQUESTS) as batch:
+            for data_obj, vector, obj_uuid in zip(data_objects, vectors, uuids):
+                batch.add_object(properties=data_obj, vector=vector, uuid=obj_uuid)
+        failed = collection.batch.failed_objects
+
+        if failed:
+            logger.warning("Retrying %d failed objects for %s", len(failed), collection.name)
+            with collection.batch.fixed_size(batch_size=INSERT_BATCH_SIZE,
+                                             concurrent_requests=INSERT_CONCURRENT_REQUESTS) as batch:
+                for err in failed:
+                    batch.add_object(properties=err.object_.properties, vector=err.object_.vector,
+                                     uuid=err.object_.uuid)
+            failed = collection.batch.failed_objects
+            if failed:
+                logger.error("%d objects could not be stored in %s: %s", len(failed), collection.name, failed[0].message)
+
+        return len(data_objects) - len(failed)
+
+    def add_chunks(self, collection: Collection, chunks: List[Dict], verbose: bool = False) -> int:
+        """Add chunks to Weaviate collection (verbose=True shows the encode progress bar)"""
         if not self.client or not chunks:
             return 0
         
         try:
-            data_objects = []
+            data_objects, content_for_embedding = [], []
             for chunk in chunks:
-                properties = {
-                    "content": chunk["content"],
-                    "source": chunk["metadata"].get("source", "unknown"),
-                    "page": str(chunk["metadata"].get("page", "0")),
-                    "doc_id": chunk["metadata"].get("doc_id", "unknown"),
-                    "doc_type": chunk["metadata"].get("doc_type", "unknown"),
-                    "type": chunk["metadata"].get("type", "unknown"),
-                }
-                data_objects.append(properties)
+                metadata = chunk["metadata"]
+                content = chunk["content"]
+                content_for_embedding.append(content)
+                data_objects.append({
+                    "content": content,
+                    "source": metadata.get("source", "unknown"),
+                    "page": str(metadata.get("page", "0")),
+                    "doc_id": metadata.get("doc_id", "unknown"),
+                    "doc_type": metadata.get("doc_type", "unknown"),
+                    "type": metadata.get("type", "unknown"),
+                })
             
-            content_for_embedding = [obj["content"] for obj in data_objects]
-            # Disable progress bar to prevent silent crashes in non-interactive environments
-            vectors = self.embedding_model.encode(content_for_embedding, show_progress_bar=False, batch_size=32)
-
-            with collection.batch.dynamic() as batch:
-                for i, data_obj in enumerate(data_objects):
-                    batch.add_object(
-                        properties=data_obj,
-                        vector=vectors[i]
-                    )
+            vectors = self._embed_documents(content_for_embedding, show_progress_bar=verbose)
+            uuids = [_object_uuid(obj["doc_id"], i, obj["content"]) for i, obj in enumerate(data_objects)]
 
-            print(f"✅ Added {len(data_objects)} chunks to Weaviate collection {collection.name}")
-            return len(data_objects)
+            added = self._batch_insert(collection, data_objects, vectors, uuids)
+            logger.info("Added %d chunks to Weaviate collection %s", added, collection.name)
+            return added
 
-        except Exception as e:
-            print(f"❌ Error adding chunks to Weaviate: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error adding chunks to Weaviate")
             return 0
 
+    def _near_vector(self, collection: Collection, query_embedding, n_results: int,
+                     return_properties: Optional[List[str]] = None) -> List[Tuple]:
+        """
+        Run a near-vector search and return deduplicated (content, properties, similarity) tuples.
+        return_properties limits which stored properties are fetched (None = all).
+        """
+        response = collection.query.near_vector(
+            near_vector=query_embedding,
+            limit=n_results,
+            return_properties=return_properties,
+            return_metadata=MetadataQuery(distance=True),
+            include_vector=False
+        )
+        
+        results_list = []
+        seen_content = set()
+        
+        for obj in response.objects:
+            doc = obj.properties.get("content", "")
+            # Dedup on the full text: a prefix key dropped distinct chunks that share boilerplate headers
+            if doc in seen_content: continue
+            seen_content.add(doc)
+            
+            # Weaviate `distance` is cosine distance. Similarity = 1 - distance.
+            similarity = 0
+            if obj.metadata and obj.metadata.distance is not None:
+                similarity = 1 - obj.metadata.distance
+            
+            results_list.append((doc, obj.properties, similarity))
+
+        # Already in descending similarity: the store returns nearest first and dedup keeps order
+        return results_list
+
     def query(self, collection: Collection, query: str, n_results: int = settings.RAG_TOP_K) -> List[Tuple]:
         """Query Weaviate collection"""
         if not self.client:
             return []
             
         try:
-            query_embedding = self.embedding_model.encode([query]).tolist()
-            
-            response = collection.query.near_vector(
-                near_vector=query_embedding[0],
-                limit=n_results,
-                include_vector=False
-            )
+            query_embedding = _encode_query(self.embedding_model, query)
+            return self._near_vector(collection, query_embedding, n_results)
             
-            results_list = []
-            seen_content = set()
-            
-            for obj in response.objects:
-                doc = obj.properties.get("content", "")
-                content_hash = doc[:100]
-                if content_hash in seen_content: continue
-                seen_content.add(content_hash)
-                
-                # Weaviate `distance` is cosine distance. Similarity = 1 - distance.
-                similarity = 0
-                if obj.metadata and obj.metadata.distance is not None:
-                    similarity = 1 - obj.metadata.distance
-                
-                results_list.append((doc, obj.properties, similarity))
+        except Exception:
+            logger.exception("Weaviate query error")
+            return []
 
-            results_list.sort(key=lambda x: x[2], reverse=True)
-            return results_list
-            
-        except Exception as e:
-            print(f"❌ Weaviate query error: {e}")
-            traceback.print_exc()
+    async def aquery(self, collection: Collection, query: str, n_results: int = settings.RAG_TOP_K) -> List[Tuple]:
+        """
+        Async variant of query() for use from the event loop. The encoder
+        forward pass and the Weaviate round trip both run in worker threads,
+        so other requests keep being served while this one waits.
+        """
+        if not self.client:
+            return []
+
+        try:
+            query_embedding = await asyncio.to_thread(_encode_query, self.embedding_model, query)
+            return await asyncio.to_thread(self._near_vector, collection, query_embedding, n_results)
+
+        except Exception:
+            logger.exception("Weaviate query error")
             return []
     
     def delete_collection(self, chat_id: str):
@@ -132,9 +264,9 @@ class VectorStoreManager:
         try:
             if self.client.collections.exists(collection_name):
                 self.client.collections.delete(collection_name)
-                print(f"🗑️  Deleted Weaviate collection: {collection_name}")
+                logger.info("Deleted Weaviate collection: %s", collection_name)
         except Exception as e:
-            print(f"⚠️  Error deleting Weaviate collection: {e}")
+            logger.warning("Error deleting Weaviate collection %s: %s", collection_name, e)
 
     def create_tender_collection(self, tender_id: str) -> Collection:
         """
@@ -144,16 +276,13 @@ class VectorStoreManager:
         if not self.client:
             raise Exception("Weaviate client not initialized")
 
-        # Weaviate collection names must start with an uppercase letter.
-        # Sanitize tender_id to remove characters invalid in collection names.
-        sanitized_tender_id = re.sub(r'[^a-zA-Z0-9_]', '_', tender_id)
-        collection_name = f"Tender_{sanitized_tender_id}"
+        collection_name = _tender_collection_name(tender_id)
         
         if self.client.collections.exists(collection_name):
-            print(f"🗑️  Deleting existing Weaviate collection: {collection_name}")
+            logger.info("Deleting existing Weaviate collection: %s", collection_name)
             self.client.collections.delete(collection_name)
         
-        print(f"📂 Creating Weaviate collection for tender: {collection_name}")
+        logger.info("Creating Weaviate collection for tender: %s", collection_name)
         return self.client.collections.create(
             name=collection_name,
             properties=[
@@ -165,20 +294,24 @@ class VectorStoreManager:
                 wvc.Property(name="chunk_index", data_type=wvc.DataType.INT, description="Sequential index of the chunk within the document."),
             ],
             vectorizer_config=wvc.Configure.Vectorizer.none(),
+            vector_index_config=_vector_index_config(),
         )
 
-    def add_tender_chunks(self, collection: Collection, chunks: List[Dict]) -> int:
+    def add_tender_chunks(self, collection: Collection, chunks: List[Dict], verbose: bool = False) -> int:
         """
         Adds processed document chunks to a tender's specific Weaviate collection.
-        This method handles vectorization and batch insertion.
+        This method handles vectorization and batch insertion; verbose=True
+        shows the encode progress bar.
         """
         if not self.client or not chunks:
             return 0
 
         try:
-            data_objects = []
+            data_objects, content_for_embedding = [], []
             for chunk in chunks:
                 metadata = chunk.get("metadata", {})
+                content = chunk.get("content", "")
+                content_for_embedding.append(content)
                 
                 # Safely get and convert chunk index
                 chunk_idx_str = metadata.get("chunk_index", metadata.get("table_index", "0"))
@@ -188,7 +321,7 @@ class VectorStoreManager:
                     chunk_idx = 0
                 
                 properties = {
-                    "content": chunk.get("content", ""),
+                    "content": content,
                     "document_name": metadata.get("source", "unknown"),
                     "document_type": metadata.get("doc_type", "unknown"),
                     "chunk_type": metadata.get("type", "unknown"),
@@ -197,23 +330,18 @@ class VectorStoreManager:
                 }
                 data_objects.append(properties)
 
-            content_for_embedding = [obj["content"] for obj in data_objects]
-            # Disable progress bar to prevent silent crashes in non-interactive environments
-            vectors = self.embedding_model.encode(content_for_embedding, show_progress_bar=False, batch_size=32)
+            vectors = self._embed_documents(content_for_embedding, show_progress_bar=verbose)
+            uuids = [
+                _object_uuid(obj["document_name"], obj["chunk_type"], obj["chunk_index"], i, obj["content"])
+                for i, obj in enumerate(data_objects)
+            ]
 
-            with collection.batch.dynamic() as batch:
-                for i, data_obj in enumerate(data_objects):
-                    batch.add_object(
-                        properties=data_obj,
-                        vector=vectors[i]
-                    )
+            added = self._batch_insert(collection, data_objects, vectors, uuids)
+            logger.info("Added %d chunks to Weaviate collection %s", added, collection.name)
+            return added
 
-            print(f"✅ Added {len(data_objects)} chunks to Weaviate collection {collection.name}")
-            return len(data_objects)
-
-        except Exception as e:
-            print(f"❌ Error adding tender chunks to Weaviate: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error adding tender chunks to Weaviate")
             return 0
 
     def query_tender(self, tender_id: str, query: str, n_results: int = settings.RAG_TOP_K) -> List[Tuple]:
@@ -222,45 +350,19 @@ class VectorStoreManager:
             return []
 
         try:
-            # Sanitize tender_id to get the correct collection name
-            sanitized_tender_id = re.sub(r'[^a-zA-Z0-9_]', '_', tender_id)
-            collection_name = f"Tender_{sanitized_tender_id}"
+            collection_name = _tender_collection_name(tender_id)
 
             if not self.client.collections.exists(collection_name):
-                print(f"⚠️  Collection {collection_name} does not exist for querying.")
+                logger.warning("Collection %s does not exist for querying", collection_name)
                 return []
 
             collection = self.client.collections.get(collection_name)
             
-            query_embedding = self.embedding_model.encode([query]).tolist()
-            
-            response = collection.query.near_vector(
-                near_vector=query_embedding[0],
-                limit=n_results,
-                include_vector=False
-            )
-            
-            results_list = []
-            seen_content = set()
-            
-            for obj in response.objects:
-                doc = obj.properties.get("content", "")
-                content_hash = doc[:100]
-                if content_hash in seen_content: continue
-                seen_content.add(content_hash)
-                
-                similarity = 0
-                if obj.metadata and obj.metadata.distance is not None:
-                    similarity = 1 - obj.metadata.distance
-                
-                results_list.append((doc, obj.properties, similarity))
-
-            results_list.sort(key=lambda x: x[2], reverse=True)
-            return results_list
+            query_embedding = _encode_query(self.embedding_model, query)
+            return self._near_vector(collection, query_embedding, n_results, TENDER_RETURN_PROPERTIES)
             
-        except Exception as e:
-            print(f"❌ Weaviate tender query error: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Weaviate tender query error")
             return []
 
     def delete_tender_collection(self, tender_id: str):
@@ -269,15 +371,13 @@ class VectorStoreManager:
             return
             
         try:
-            # Sanitize tender_id to get the correct collection name
-            sanitized_tender_id = re.sub(r'[^a-zA-Z0-9_]', '_', tender_id)
-            collection_name = f"Tender_{sanitized_tender_id}"
+            collection_name = _tender_collection_name(tender_id)
             
             if self.client.collections.exists(collection_name):
                 self.client.collections.delete(collection_name)
-                print(f"🗑️  Deleted Weaviate collection: {collection_name}")
+                logger.info("Deleted Weaviate collection: %s", collection_name)
         except Exception as e:
-            print(f"⚠️  Error deleting Weaviate tender collection: {e}")
+            logger.warning("Error deleting Weaviate tender collection for %s: %s", tender_id, e)
     # --- Renamed ChromaDB Methods for Backup ---
     
     def get_or_create_collection_chroma(self, chat_id: str):
@@ -288,18 +388,18 @@ class VectorStoreManager:
         
         try:
             collection = self.client.get_collection(collection_name)
-            print(f"📂 Retrieved collection: {collection_name}")
+            logger.debug("Retrieved collection: %s", collection_name)
         except:
             collection = self.client.create_collection(
                 name=collection_name,
                 metadata={"chat_id": chat_id}
             )
-            print(f"📂 Created collection: {collection_name}")
+            logger.info("Created collection: %s", collection_name)
         
         # self.collections[chat_id] = collection # This line would now fail
         return collection
     
-    def add_chunks_chroma(self, collection, chunks: List[Dict]) -> int:
+    def add_chunks_chroma(self, collection, chunks: List[Dict], verbose: bool = False) -> int:
         """Add chunks to collection"""
         if not chunks:
             return 0
@@ -313,19 +413,20 @@ class VectorStoreManager:
                 cleaned_meta = {}
                 for k, v in meta.items():
                     str_val = str(v)
-                    str_val = re.sub(r'[^\w\s\-\.\,\/]', '_', str_val).strip()
+                    str_val = _CHROMA_META_UNSAFE.sub('_', str_val).strip()
                     cleaned_meta[k] = str_val if str_val else "unknown"
                 metadatas.append(cleaned_meta)
             
+            # One random suffix per call; the chunk index keeps ids unique within it
+            batch_suffix = uuid.uuid4().hex[:6]
             ids = []
             for i, chunk in enumerate(chunks):
                 doc_id = chunk['metadata'].get('doc_id', 'unknown')[:8]
-                safe_id = f"doc_{doc_id}_chunk_{i}_{uuid.uuid4().hex[:6]}"
-                safe_id = re.sub(r'[^\w\-]', '_', safe_id)
+                safe_id = f"doc_{doc_id}_chunk_{i}_{batch_suffix}"
+                safe_id = _CHROMA_ID_UNSAFE.sub('_', safe_id)
                 ids.append(safe_id)
 
-            # Disable progress bar to prevent silent crashes in non-interactive environments
-            embeddings = self.embedding_model.encode(documents, show_progress_bar=False, batch_size=32)
+            embeddings = self._embed_documents(documents, show_progress_bar=verbose)
             
             batch_size = 100
             for i in range(0, len(documents), batch_size):
@@ -337,22 +438,21 @@ class VectorStoreManager:
                     embeddings=embeddings[i:end_idx].tolist()
                 )
             
-            print(f"✅ Added {len(documents)} chunks to {collection.name}")
+            logger.info("Added %d chunks to %s", len(documents), collection.name)
             return len(documents)
             
-        except Exception as e:
-            print(f"❌ Error adding chunks: {e}")
-            if 'metadatas' in locals() and metadatas: print(f"   Sample metadata: {metadatas[0]}")
-            if 'ids' in locals() and ids: print(f"   Sample ID: {ids[0]}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error adding chunks")
+            if 'metadatas' in locals() and metadatas: logger.error("Sample metadata: %s", metadatas[0])
+            if 'ids' in locals() and ids: logger.error("Sample ID: %s", ids[0])
             return 0
     
     def query_chroma(self, collection, query: str, n_results: int = settings.RAG_TOP_K) -> List[Tuple]:
         """Query collection"""
         try:
-            query_embedding = self.embedding_model.encode([query])
+            query_embedding = _encode_query(self.embedding_model, query)
             results = collection.query(
-                query_embeddings=query_embedding.tolist(),
+                query_embeddings=[query_embedding],
                 n_results=n_results,
                 include=['documents', 'metadatas', 'distances']
             )
@@ -365,18 +465,18 @@ class VectorStoreManager:
             seen_content = set()
             
             for doc, meta, dist in zip(documents, metadatas, distances):
-                content_hash = doc[:100]
-                if content_hash in seen_content: continue
-                seen_content.add(content_hash)
+                # Dedup on the full text: a prefix key dropped distinct chunks that share boilerplate headers
+                if doc in seen_content: continue
+                seen_content.add(doc)
                 
                 similarity = 1 - (dist / 2)
                 results_list.append((doc, meta, similarity))
             
-            results_list.sort(key=lambda x: x[2], reverse=True)
+            # Already in descending similarity: the store returns nearest first and dedup keeps order
             return results_list
             
-        except Exception as e:
-            print(f"❌ Query error: {e}")
+        except Exception:
+            logger.exception("Query error")
             return []
     
     def delete_collection_chroma(self, chat_id: str):
@@ -386,6 +486,6 @@ class VectorStoreManager:
             self.client.delete_collection(collection_name)
             # if chat_id in self.collections: # This line would fail
             #     del self.collections[chat_id]
-            print(f"🗑️  Deleted collection: {collection_name}")
+            logger.info("Deleted collection: %s", collection_name)
         except Exception as e:
-            print(f"⚠️  Error deleting collection: {e}")
+            logger.warning("Error deleting collection: %s", e)
@@ -1,8 +1,9 @@
 import os
 import warnings
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1.router import api_v1_router
+from app.api.v1.router import include_feature_routers
 from app.config import settings
 from app.utils import ensure_directory_exists
 
@@ -37,6 +38,11 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     async def startup_event():
         print("--- Application Startup ---")
+
+        # Sync endpoints run in AnyIO's shared thread pool and mostly wait on
+        # PostgreSQL/Weaviate/Redis; the default 40 threads caps concurrency
+        # well below what those backends can serve.
+        to_thread.current_default_thread_limiter().total_tokens = settings.API_THREADPOOL_SIZE
         
         # Initialize database clients within the startup event
         from app.core import services
@@ -55,7 +61,9 @@ def create_app() -> FastAPI:
             print("Weaviate client closed.")
         print("--- Shutdown Complete ---")
 
-    app.include_router(api_v1_router, prefix="/api/v1")
+    # Feature routers are imported here, when the app is built, so importing
+    # app.api.v1.router alone (CLI tools, workers) stays cheap.
+    app.include_router(include_feature_routers(), prefix="/api/v1")
 
     return app
 
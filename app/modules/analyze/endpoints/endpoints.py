@@ -8,22 +8,136 @@ Provides APIs for retrieving tender analysis results including:
 - Data sheets
 - Document templates
 """
-from uuid import UUID
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+import hashlib
+import io
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import re
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db_session
-from app.modules.analyze.db.schema import TenderAnalysis
+from app.modules.analyze.db.schema import AnalysisDocumentTemplate, AnalysisStatusEnum, TenderAnalysis
 from app.modules.analyze.models.pydantic_models import TenderAnalysisResponse
 from app.modules.auth.services.auth_service import get_current_active_user
 from app.modules.analyze.repositories import repository as analyze_repo
 from app.modules.analyze.services import analysis_rfp_service as rfp_service
 from app.modules.analyze.services import analysis_template_service as template_service
+from app.modules.analyze.services import analysis_cache_service as analysis_cache
+from app.modules.analyze.services import report_cache_service as report_cache
+from app.modules.analyze.services import analysis_report_service as report_service
+from app.modules.analyze.tasks import analyze_tender_task, build_analysis_report_task
+from app.celery_app import celery_app
+from app.modules.tenderiq.db.schema import Tender
+
+from app.modules.analyze.services.analysis_report_service import HAS_DOCX, HAS_REPORTLAB
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+if HAS_REPORTLAB:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+if HAS_DOCX:
+    from docx import Document
+    from docx.shared import RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+# Canonical 8-4-4-4-12 hex form; anything else is treated as a tender reference number
+_UUID_RE = re.compile(r'[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}')
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Statuses of an analysis that is queued for or running in a worker
+ACTIVE_ANALYSIS_STATUSES = (
+    AnalysisStatusEnum.pending,
+    AnalysisStatusEnum.parsing,
+    AnalysisStatusEnum.processing,
+    AnalysisStatusEnum.analyzing,
+)
+
+
+def _parse_tender_uuid(tender_id: str) -> Optional[UUID]:
+    """Return the tender UUID if the path value is one, else None (a reference number)."""
+    return UUID(tender_id) if _UUID_RE.fullmatch(tender_id) else None
+
+
+def _iter_chunks(content: bytes, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+    """
+    Yield fixed-size, zero-copy slices of a rendered file for StreamingResponse.
+    (Iterating a BytesIO would split binary content on newline bytes.)
+    """
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def _iter_file(fileobj, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+    """Yield a rendered file in fixed-size chunks, closing it once sent."""
+    try:
+        while chunk := fileobj.read(chunk_size):
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match covers etag (weak validators compare equal)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _json_response(request: Request, payload: str) -> Response:
+    """
+    Serve serialized JSON with an ETag of its content, answering 304 when
+    the client already has it. no-cache makes clients revalidate each poll,
+    which costs a cache read and no body while nothing has changed.
+    """
+    etag = f'"{hashlib.md5(payload.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _analysis_in_progress(tender_ref: str, analysis_id) -> Dict[str, Any]:
+    """Trigger response for a tender whose analysis is already queued or running."""
+    return {
+        "status": "in_progress",
+        "message": f"Analysis for tender {tender_ref} is already queued or running",
+        "analysis_id": str(analysis_id) if analysis_id else None,
+    }
+
+
+def _find_analysis(db: Session, tender_id: str, response_only: bool = False) -> Optional[TenderAnalysis]:
+    """
+    Look up an analysis by tender UUID or by tender reference number, with
+    its RFP sections and document templates already loaded. response_only
+    skips the columns the GET response does not use.
+
+    The format is checked up front so the common case (a reference number
+    such as "51655667") goes straight to a single query instead of failing
+    a UUID lookup first.
+    """
+    tender_uuid = _parse_tender_uuid(tender_id)
+    if tender_uuid is not None:
+        return analyze_repo.get_by_id(db, tender_uuid, response_only)
+    return analyze_repo.get_by_tender_id(db, tender_id, response_only)
+
+
 
 @router.get(
     "/{tender_id}",
@@ -34,6 +148,7 @@ router = APIRouter()
 )
 def get_tender_analysis(
     tender_id: str,
+    request: Request,
     db: Session = Depends(get_db_session),
     current_user=Depends(get_current_active_user),
 ) -> TenderAnalysisResponse:
@@ -58,6 +173,9 @@ def get_tender_analysis(
         db: Database session
         current_user: Authenticated user
 
+    Responses carry an ETag; pollers sending If-None-Match get 304 with no
+    body until the analysis changes.
+
     Raises:
         HTTPException(404): If analysis not found
 
@@ -91,26 +209,26 @@ def get_tender_analysis(
         }
     """
     try:
-        # Fetch the analysis record from database
-        # Try both string and UUID to handle different input formats
-        analysis = None
-        try:
-            analysis = analyze_repo.get_by_id(db, tender_id)
-        except (ValueError, TypeError):
-            # If tender_id is not a valid UUID, search by tender_id string
-            analysis = db.query(TenderAnalysis).filter(
-                TenderAnalysis.tender_id == tender_id
-            ).first()
+        # Serve the serialized response from Redis when possible; UUIDs are
+        # normalized so every spelling of the same tender shares one entry
+        tender_uuid = _parse_tender_uuid(tender_id)
+        cache_ident = str(tender_uuid) if tender_uuid else tender_id
+        cached = analysis_cache.get_cached_analysis(cache_ident)
+        if cached is not None:
+            return _json_response(request, cached)
+
+        # Fetch the analysis record from database (tender UUID or reference number)
+        analysis = _find_analysis(db, tender_id, response_only=True)
 
         if not analysis:
-            logger.warning(f"Analysis not found for tender_id: {tender_id}")
+            logger.warning("Analysis not found for tender_id: %s", tender_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Analysis not found for tender {tender_id}",
             )
 
-        rfp_section = rfp_service.get_rfp_sections(db, analysis.id)
-        templates = template_service.get_templates(db, analysis.id)
+        rfp_section = rfp_service.build_rfp_sections(analysis.rfp_sections)
+        templates = template_service.build_templates(analysis.document_templates, analysis.id)
 
         # Build the response with whatever data is available
         # Null fields indicate the analysis hasn't reached that stage yet
@@ -131,15 +249,22 @@ def get_tender_analysis(
         )
 
         logger.info(
-            f"Retrieved analysis for tender_id: {tender_id}, status: {analysis.status.value}, progress: {analysis.progress}"
+            "Retrieved analysis for tender_id: %s, status: %s, progress: %s",
+            tender_id, analysis.status.value, analysis.progress,
+        )
+        payload = response.model_dump_json()
+        analysis_cache.cache_analysis(
+            cache_ident,
+            payload,
+            final=analysis.status in (AnalysisStatusEnum.completed, AnalysisStatusEnum.failed),
         )
-        return response
+        return _json_response(request, payload)
 
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Error retrieving analysis for tender_id {tender_id}: {e}", exc_info=True)
+        logger.error("Error retrieving analysis for tender_id %s: %s", tender_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error retrieving tender analysis",
@@ -166,42 +291,80 @@ def trigger_tender_analysis(
         current_user: Authenticated user
         
     Returns:
-        Status message
+        Status message. The analysis runs in a Celery worker; poll
+        GET /analyze/{tender_ref} for status and progress. If an analysis
+        is already queued or running, "in_progress" is returned and no
+        second job is queued.
     """
     try:
-        from app.modules.analyze.scripts.analyze_tender import analyze_tender
-        
-        # Check if tender exists
-        from app.modules.tenderiq.db.schema import Tender
-        tender = db.query(Tender).filter(Tender.tender_ref_number == tender_ref).first()
+        # Check if tender exists (only the key is needed)
+        tender = db.query(Tender.id).filter(Tender.tender_ref_number == tender_ref).first()
         if not tender:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Tender {tender_ref} not found"
             )
         
-        # Check if already analyzed
-        existing = db.query(TenderAnalysis).filter(TenderAnalysis.tender_id == tender_ref).first()
-        if existing and existing.status == AnalysisStatusEnum.COMPLETED:
+        # Check if already analyzed; fetch only (id, status) rather than the
+        # full row with its JSON result columns
+        existing = db.query(TenderAnalysis.id, TenderAnalysis.status).filter(
+            TenderAnalysis.tender_id == tender_ref
+        ).first()
+        if existing and existing.status == AnalysisStatusEnum.completed:
             return {
                 "status": "already_analyzed",
                 "message": f"Tender {tender_ref} is already analyzed",
                 "analysis_id": str(existing.id)
             }
-        
-        # Trigger analysis
-        logger.info(f"Triggering analysis for tender {tender_ref}")
-        analyze_tender(db, tender_ref)
+        # A second run on the same tender would drop the Weaviate collection
+        # the first is uploading to and duplicate its RFP sections/templates
+        if existing and existing.status in ACTIVE_ANALYSIS_STATUSES:
+            return _analysis_in_progress(tender_ref, existing.id)
+        
+        # Create (or reset) the record up front so the status endpoint can
+        # report "pending" while the job waits for a worker
+        queued_state = {
+            "status": AnalysisStatusEnum.pending,
+            "progress": 0,
+            "status_message": "Queued for analysis",
+            "error_message": None,
+        }
+        if existing is None:
+            analysis_id = uuid4()
+            db.add(TenderAnalysis(id=analysis_id, tender_id=tender_ref, **queued_state))
+            try:
+                db.commit()
+            except IntegrityError:
+                # A concurrent trigger created the record (tender_id is unique)
+                db.rollback()
+                other = db.query(TenderAnalysis.id).filter(TenderAnalysis.tender_id == tender_ref).first()
+                return _analysis_in_progress(tender_ref, other.id if other else None)
+        else:
+            analysis_id = existing.id
+            # Conditional reset: only one of several concurrent triggers wins
+            claimed = db.query(TenderAnalysis).filter(
+                TenderAnalysis.id == analysis_id,
+                TenderAnalysis.status.notin_(ACTIVE_ANALYSIS_STATUSES),
+            ).update(queued_state, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                return _analysis_in_progress(tender_ref, analysis_id)
+        analysis_cache.invalidate_analysis(tender_ref, tender.id)
+
+        # Queue analysis
+        logger.info("Queueing analysis for tender %s", tender_ref)
+        analyze_tender_task.delay(tender_ref)
         
         return {
-            "status": "success",
-            "message": f"Analysis triggered for tender {tender_ref}"
+            "status": "queued",
+            "message": f"Analysis queued for tender {tender_ref}",
+            "analysis_id": str(analysis_id)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error triggering analysis for {tender_ref}: {e}", exc_info=True)
+        logger.error("Error triggering analysis for %s: %s", tender_ref, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error triggering analysis: {str(e)}"
@@ -216,6 +379,7 @@ def trigger_tender_analysis(
 )
 def download_analysis_report(
     tender_id: str,
+    request: Request,
     format: str = "pdf",
     db: Session = Depends(get_db_session),
     current_user=Depends(get_current_active_user),
@@ -232,18 +396,10 @@ def download_analysis_report(
     Returns:
         File download response
     """
-    from fastapi.responses import StreamingResponse
-    import io
 
     try:
         # Fetch analysis data
-        analysis = None
-        try:
-            analysis = analyze_repo.get_by_id(db, tender_id)
-        except (ValueError, TypeError):
-            analysis = db.query(TenderAnalysis).filter(
-                TenderAnalysis.tender_id == tender_id
-            ).first()
+        analysis = _find_analysis(db, tender_id)
 
         if not analysis:
             raise HTTPException(
@@ -251,45 +407,141 @@ def download_analysis_report(
                 detail=f"Analysis not found for tender {tender_id}"
             )
 
-        # Fetch related data
-        rfp_sections = rfp_service.get_rfp_sections(db, analysis.id)
-        templates = template_service.get_templates(db, analysis.id)
+        report_format = report_service.normalize_report_format(format)
+
+        # Reports only change when the analysis does: revalidate or serve
+        # from the rendered-file cache before generating anything
+        version = report_cache.report_version(analysis)
+        etag = f'"{analysis.id}-{version}-{report_format}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        cached = report_cache.get_cached_report(analysis.id, version, report_format)
+        if cached is None:
+            # Not rendered ahead of time: render inline, then serve the cached copy
+            report_file, filename, media_type = report_service.render_report(analysis, report_format)
+            cached = report_cache.get_cached_report(analysis.id, version, report_format)
+            if cached is None:
+                # Cache not writable: stream the rendered file itself
+                size = report_file.seek(0, io.SEEK_END)
+                report_file.seek(0)
+                return StreamingResponse(
+                    _iter_file(report_file),
+                    media_type=media_type,
+                    headers={
+                        "Content-Disposition": f"attachment; filename={filename}",
+                        "Content-Length": str(size),
+                        **cache_headers,
+                    }
+                )
+            report_file.close()
+
+        path, filename = cached
+        return FileResponse(
+            path,
+            media_type=report_cache.REPORT_MEDIA_TYPES[report_format],
+            headers={"Content-Disposition": f"attachment; filename={filename}", **cache_headers},
+        )
 
-        # Generate file based on format
-        format_lower = format.lower()
-        if format_lower in ['excel', 'xlsx']:
-            file_content, filename, media_type = generate_excel_report(
-                analysis, rfp_sections, templates
-            )
-        elif format_lower in ['word', 'docx']:
-            file_content, filename, media_type = generate_word_report(
-                analysis, rfp_sections, templates
-            )
-        else:
-            # Default to PDF
-            file_content, filename, media_type = generate_pdf_report(
-                analysis, rfp_sections, templates
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error downloading report for %s: %s", tender_id, e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating report: {str(e)}"
+        )
+
+
+@router.post(
+    "/report/{tender_id}",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Prepare Analysis Report",
+    description="Render an analysis report in the background. Poll /report/status/{job_id}, then download it.",
+    tags=["Analyze"],
+)
+def prepare_analysis_report(
+    tender_id: str,
+    request: Request,
+    response: Response,
+    format: str = "pdf",
+    db: Session = Depends(get_db_session),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Queue rendering of an analysis report on the Celery workers.
+
+    Args:
+        tender_id: Tender reference number or tender UUID
+        format: Report format (pdf, excel, word) - defaults to pdf
+
+    Returns:
+        job_id and status_url while rendering is queued (202), or the
+        download_url straight away if the report is already rendered (200)
+    """
+    try:
+        analysis = _find_analysis(db, tender_id)
+        if not analysis:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Analysis not found for tender {tender_id}"
             )
 
-        # Return file as streaming response
-        return StreamingResponse(
-            io.BytesIO(file_content),
-            media_type=media_type,
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        report_format = report_service.normalize_report_format(format)
+        download_url = f"{request.url_for('download_analysis_report', tender_id=tender_id)}?format={report_format}"
+
+        version = report_cache.report_version(analysis)
+        if report_cache.get_cached_report(analysis.id, version, report_format):
+            response.status_code = status.HTTP_200_OK
+            return {"status": "ready", "download_url": download_url}
+
+        job = build_analysis_report_task.delay(str(analysis.id), report_format, tender_id)
+        logger.info("Queued %s report for %s as job %s", report_format, tender_id, job.id)
+        return {
+            "job_id": job.id,
+            "status": "queued",
+            "status_url": str(request.url_for('get_report_status', job_id=job.id)),
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error downloading report for {tender_id}: {e}", exc_info=True)
+        logger.error("Error queueing report for %s: %s", tender_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating report: {str(e)}"
+            detail=f"Error queueing report: {str(e)}"
         )
 
 
+@router.get(
+    "/report/status/{job_id}",
+    summary="Get Report Job Status",
+    description="Status of a background report job; includes the download URL once ready",
+    tags=["Analyze"],
+)
+def get_report_status(
+    job_id: str,
+    request: Request,
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Report job status: queued, running, ready (with download_url) or failed.
+    Unknown or expired job ids report as queued, matching Celery's PENDING.
+    """
+    result = celery_app.AsyncResult(job_id)
+    if result.successful():
+        report = result.result
+        download_url = f"{request.url_for('download_analysis_report', tender_id=report['tender_id'])}?format={report['format']}"
+        return {"job_id": job_id, "status": "ready", "download_url": download_url}
+    if result.failed():
+        return {"job_id": job_id, "status": "failed", "error": str(result.result)}
+    return {
+        "job_id": job_id,
+        "status": "running" if result.state == "STARTED" else "queued",
+    }
+
+
 @router.get(
     "/templates/download/{template_id}",
     summary="Download Template File",
@@ -315,9 +567,6 @@ def download_template(
     Returns:
         File download response
     """
-    from app.modules.analyze.db.schema import AnalysisDocumentTemplate
-    from fastapi.responses import StreamingResponse
-    import io
     
     try:
         # Fetch template from database
@@ -347,45 +596,75 @@ def download_template(
         
         # Return file as streaming response
         return StreamingResponse(
-            io.BytesIO(file_content),
+            _iter_chunks(file_content),
             media_type=media_type,
             headers={
-                "Content-Disposition": f"attachment; filename={filename}"
+                "Content-Disposition": f"attachment; filename={filename}",
+                "Content-Length": str(len(file_content)),
             }
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error downloading template {template_id}: {e}", exc_info=True)
+        logger.error("Error downloading template %s: %s", template_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating template: {str(e)}"
         )
 
 
+# Template styles are built once and shared by every generated file
+_XL_TEMPLATE_TITLE_FONT = Font(size=16, bold=True, color="1a56db")
+_XL_TEMPLATE_LABEL_FONT = Font(bold=True)
+_XL_TEMPLATE_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_XL_TEMPLATE_HEADER_FILL = PatternFill(start_color="1a56db", end_color="1a56db", fill_type="solid")
+_XL_TEMPLATE_HEADER_ALIGNMENT = Alignment(horizontal='center')
+
+
+@lru_cache(maxsize=None)
+def _pdf_template_styles() -> Dict[str, Any]:
+    """ReportLab styles for template PDFs, built on first use."""
+
+    styles = getSampleStyleSheet()
+    return {
+        'base': styles,
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            textColor=colors.HexColor('#1a56db'),
+            spaceAfter=30,
+        ),
+        'fields_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 1), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
+        ]),
+    }
+
+
 def generate_pdf_template(template):
     """Generate a PDF template file"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    import io
+    if not HAS_REPORTLAB:
+        raise RuntimeError("reportlab is not installed; PDF templates are unavailable")
     
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
+    pdf_styles = _pdf_template_styles()
+    styles = pdf_styles['base']
     story = []
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1a56db'),
-        spaceAfter=30,
-    )
+    title_style = pdf_styles['title']
     story.append(Paragraph(template.template_name, title_style))
     story.append(Spacer(1, 0.2 * inch))
     
@@ -418,19 +697,7 @@ def generate_pdf_template(template):
     ]
     
     table = Table(data, colWidths=[3*inch, 4*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
-    ]))
+    table.setStyle(pdf_styles['fields_table'])
     story.append(table)
     
     # Build PDF
@@ -442,35 +709,52 @@ def generate_pdf_template(template):
 
 def generate_excel_template(template):
     """Generate an Excel template file"""
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
-    import io
-    
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Template"
-    
+    # Write-only mode streams rows out instead of keeping a Cell object per cell
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Template")
+
+    def styled(value, font=None, fill=None, alignment=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        return cell
+
+    # Column widths must be set before the first row is written
+    ws.column_dimensions['A'].width = 20
+    ws.column_dimensions['B'].width = 30
+    ws.column_dimensions['C'].width = 30
+    ws.column_dimensions['D'].width = 15
+
     # Title
-    ws['A1'] = template.template_name
-    ws['A1'].font = Font(size=16, bold=True, color="1a56db")
-    ws.merge_cells('A1:D1')
-    
+    ws.append([styled(template.template_name, font=_XL_TEMPLATE_TITLE_FONT)])
+    ws.merged_cells.add('A1:D1')
+    ws.append([])
+
     # Description
     if template.description:
-        ws['A3'] = "Description:"
-        ws['A3'].font = Font(bold=True)
-        ws['B3'] = template.description
-        ws.merge_cells('B3:D3')
-    
-    # Headers
-    row_start = 6
+        ws.append([styled("Description:", font=_XL_TEMPLATE_LABEL_FONT), template.description])
+        ws.merged_cells.add('B3:D3')
+    else:
+        ws.append([])
+    ws.append([])
+    ws.append([])
+
+    # Headers (row 6)
     headers = ['Field Name', 'Value', 'Instructions', 'Mandatory']
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=row_start, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="1a56db", end_color="1a56db", fill_type="solid")
-        cell.alignment = Alignment(horizontal='center')
-    
+    ws.append([
+        styled(
+            header,
+            font=_XL_TEMPLATE_HEADER_FONT,
+            fill=_XL_TEMPLATE_HEADER_FILL,
+            alignment=_XL_TEMPLATE_HEADER_ALIGNMENT,
+        )
+        for header in headers
+    ])
+
     # Sample fields
     fields = [
         ['Company Name', '', 'Enter your company name', 'Yes'],
@@ -480,17 +764,10 @@ def generate_excel_template(template):
         ['Phone', '', 'Contact number', 'Yes'],
         ['Date', '', 'Submission date', 'Yes'],
     ]
-    
-    for idx, field_data in enumerate(fields, start=row_start+1):
-        for col, value in enumerate(field_data, start=1):
-            ws.cell(row=idx, column=col, value=value)
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 20
-    ws.column_dimensions['B'].width = 30
-    ws.column_dimensions['C'].width = 30
-    ws.column_dimensions['D'].width = 15
-    
+
+    for field_data in fields:
+        ws.append(field_data)
+
     buffer = io.BytesIO()
     wb.save(buffer)
     buffer.seek(0)
@@ -501,10 +778,8 @@ def generate_excel_template(template):
 
 def generate_word_template(template):
     """Generate a Word template file"""
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    import io
+    if not HAS_DOCX:
+        raise RuntimeError("python-docx is not installed; Word templates are unavailable")
     
     doc = Document()
     
@@ -554,940 +829,3 @@ def generate_word_template(template):
     
     filename = f"{template.template_name.replace(' ', '_')}.docx"
     return buffer.getvalue(), filename, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-
-# ============================================================================
-# ANALYSIS REPORT GENERATION FUNCTIONS
-# ============================================================================
-
-def generate_pdf_report(analysis, rfp_sections, templates):
-    """Generate a comprehensive PDF report of the tender analysis"""
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    import io
-    from datetime import datetime
-    import html
-
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        rightMargin=0.75*inch
-    )
-    styles = getSampleStyleSheet()
-    story = []
-
-    # Custom styles with proper spacing
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a56db'),
-        spaceAfter=30,
-        spaceBefore=0,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=28
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1a56db'),
-        spaceAfter=16,
-        spaceBefore=24,
-        fontName='Helvetica-Bold',
-        leading=20,
-        keepWithNext=True
-    )
-
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#333333'),
-        spaceAfter=10,
-        spaceBefore=14,
-        fontName='Helvetica-Bold',
-        leading=16,
-        keepWithNext=True
-    )
-
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=10,
-        spaceAfter=8,
-        spaceBefore=0,
-        leading=14,
-        alignment=TA_JUSTIFY,
-        wordWrap='LTR'
-    )
-    
-    # Cover Page
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph("TENDER ANALYSIS REPORT", title_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph(f"Tender ID: {analysis.tender_id}", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-    if analysis.analysis_completed_at:
-        story.append(Paragraph(f"Analysis Date: {analysis.analysis_completed_at.strftime('%B %d, %Y')}", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(f"Status: {analysis.status.value.upper()}", styles['Normal']))
-    story.append(PageBreak())
-    
-    # ONE PAGER
-    if analysis.one_pager_json:
-        story.append(Paragraph("1. EXECUTIVE SUMMARY (ONE PAGER)", heading_style))
-        one_pager = analysis.one_pager_json
-        
-        if one_pager.get('project_overview'):
-            story.append(Paragraph("<b>Project Overview:</b>", subheading_style))
-            story.append(Paragraph(one_pager['project_overview'], body_style))
-            story.append(Spacer(1, 0.2*inch))
-
-        if one_pager.get('financial_requirements'):
-            story.append(Paragraph("<b>Financial Requirements:</b>", subheading_style))
-            for req in one_pager['financial_requirements']:
-                story.append(Paragraph(f"• {req}", body_style))
-            story.append(Spacer(1, 0.2*inch))
-
-        if one_pager.get('eligibility_highlights'):
-            story.append(Paragraph("<b>Eligibility Highlights:</b>", subheading_style))
-            for highlight in one_pager['eligibility_highlights']:
-                story.append(Paragraph(f"• {highlight}", body_style))
-            story.append(Spacer(1, 0.2*inch))
-
-        if one_pager.get('important_dates'):
-            story.append(Paragraph("<b>Important Dates:</b>", subheading_style))
-            for date in one_pager['important_dates']:
-                story.append(Paragraph(f"• {date}", body_style))
-            story.append(Spacer(1, 0.2*inch))
-
-        if one_pager.get('risk_analysis'):
-            risk = one_pager['risk_analysis']
-            story.append(Paragraph("<b>Risk Analysis:</b>", subheading_style))
-            if risk.get('summary'):
-                story.append(Paragraph(risk['summary'], body_style))
-        
-        story.append(PageBreak())
-    
-    # SCOPE OF WORK
-    if analysis.scope_of_work_json:
-        story.append(Paragraph("2. SCOPE OF WORK", heading_style))
-        scope = analysis.scope_of_work_json
-        
-        if scope.get('project_details'):
-            details = scope['project_details']
-            story.append(Paragraph("<b>Project Details:</b>", subheading_style))
-            details_data = []
-            if details.get('project_name'):
-                details_data.append(['Project Name', details['project_name']])
-            if details.get('location'):
-                details_data.append(['Location', details['location']])
-            if details.get('duration'):
-                details_data.append(['Duration', details['duration']])
-            if details.get('contract_value'):
-                details_data.append(['Contract Value', details['contract_value']])
-            
-            if details_data:
-                table = Table(details_data, colWidths=[2*inch, 4.5*inch])
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ]))
-                story.append(table)
-                story.append(Spacer(1, 0.2*inch))
-        
-        if scope.get('work_packages'):
-            story.append(Paragraph("<b>Work Packages:</b>", subheading_style))
-            for i, package in enumerate(scope['work_packages'], 1):
-                story.append(Paragraph(f"<b>{i}. {package.get('name', 'Work Package')}</b>", body_style))
-                if package.get('description'):
-                    story.append(Paragraph(package['description'], body_style))
-                story.append(Spacer(1, 0.1*inch))
-        
-        story.append(PageBreak())
-    
-    # DATA SHEET
-    if analysis.data_sheet_json:
-        story.append(Paragraph("3. DATA SHEET", heading_style))
-        datasheet = analysis.data_sheet_json
-        
-        sections = [
-            ('Project Information', datasheet.get('project_information', [])),
-            ('Contract Details', datasheet.get('contract_details', [])),
-            ('Financial Details', datasheet.get('financial_details', [])),
-            ('Technical Summary', datasheet.get('technical_summary', [])),
-            ('Important Dates', datasheet.get('important_dates', []))
-        ]
-        
-        for section_name, items in sections:
-            if items:
-                story.append(Paragraph(f"<b>{section_name}:</b>", subheading_style))
-                data = [[item['label'], item['value']] for item in items]
-                if data:
-                    table = Table(data, colWidths=[2.5*inch, 4*inch])
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
-                        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('TOPPADDING', (0, 0), (-1, -1), 6),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                    ]))
-                    story.append(table)
-                    story.append(Spacer(1, 0.2*inch))
-        
-        story.append(PageBreak())
-    
-    # RFP SECTIONS
-    if rfp_sections and rfp_sections.sections:
-        story.append(Paragraph("4. RFP SECTIONS ANALYSIS", heading_style))
-        for section in rfp_sections.sections:
-            story.append(Paragraph(f"<b>{section.section_name}: {section.section_title}</b>", subheading_style))
-            if section.summary:
-                story.append(Paragraph(section.summary, body_style))
-
-            if section.key_requirements:
-                story.append(Paragraph("<b>Key Requirements:</b>", body_style))
-                for req in section.key_requirements[:5]:  # Limit to 5 for space
-                    story.append(Paragraph(f"• {req}", body_style))
-
-            story.append(Spacer(1, 0.15*inch))
-
-        story.append(PageBreak())
-
-    # TEMPLATES
-    if templates:
-        story.append(Paragraph("5. REQUIRED TEMPLATES", heading_style))
-        all_templates = []
-        all_templates.extend(templates.bid_submission_forms or [])
-        all_templates.extend(templates.financial_formats or [])
-        all_templates.extend(templates.technical_documents or [])
-        all_templates.extend(templates.compliance_formats or [])
-
-        if all_templates:
-            story.append(Paragraph(f"<b>Total Templates: {len(all_templates)}</b>", body_style))
-            story.append(Spacer(1, 0.1*inch))
-
-            template_data = [['Template Name', 'Format', 'Mandatory']]
-            for template in all_templates:
-                template_data.append([
-                    template.name,
-                    template.format.upper(),
-                    'Yes' if template.mandatory else 'No'
-                ])
-
-            table = Table(template_data, colWidths=[3.5*inch, 1.5*inch, 1.5*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            story.append(table)
-
-    # Build PDF
-    doc.build(story)
-    
-    filename = f"Tender_Analysis_{analysis.tender_id}_{datetime.now().strftime('%Y%m%d')}.pdf"
-    return buffer.getvalue(), filename, "application/pdf"
-
-
-def generate_excel_report(analysis, rfp_sections, templates):
-    """Generate a comprehensive Excel report of the tender analysis"""
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from datetime import datetime
-    import io
-    
-    wb = Workbook()
-    
-    # Remove default sheet
-    if 'Sheet' in wb.sheetnames:
-        wb.remove(wb['Sheet'])
-    
-    # Header styles
-    header_fill = PatternFill(start_color="1a56db", end_color="1a56db", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    title_font = Font(bold=True, size=16, color="1a56db")
-    subheader_font = Font(bold=True, size=11)
-    normal_font = Font(size=10)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # SUMMARY SHEET
-    ws_summary = wb.create_sheet("Summary")
-    ws_summary['A1'] = "TENDER ANALYSIS REPORT"
-    ws_summary['A1'].font = title_font
-    ws_summary.merge_cells('A1:D1')
-    
-    row = 3
-    ws_summary[f'A{row}'] = "Tender ID:"
-    ws_summary[f'A{row}'].font = subheader_font
-    ws_summary[f'B{row}'] = analysis.tender_id
-    row += 1
-    
-    ws_summary[f'A{row}'] = "Status:"
-    ws_summary[f'A{row}'].font = subheader_font
-    ws_summary[f'B{row}'] = analysis.status.value
-    row += 1
-    
-    if analysis.analysis_completed_at:
-        ws_summary[f'A{row}'] = "Analysis Date:"
-        ws_summary[f'A{row}'].font = subheader_font
-        ws_summary[f'B{row}'] = analysis.analysis_completed_at.strftime('%Y-%m-%d %H:%M')
-        row += 1
-    
-    ws_summary.column_dimensions['A'].width = 20
-    ws_summary.column_dimensions['B'].width = 40
-    
-    # ONE PAGER SHEET - ENHANCED
-    if analysis.one_pager_json:
-        ws_one_pager = wb.create_sheet("One Pager")
-        one_pager = analysis.one_pager_json
-        row = 1
-        
-        ws_one_pager[f'A{row}'] = "EXECUTIVE SUMMARY"
-        ws_one_pager[f'A{row}'].font = title_font
-        ws_one_pager.merge_cells(f'A{row}:C{row}')
-        row += 2
-        
-        # Project Overview
-        if one_pager.get('project_overview'):
-            ws_one_pager[f'A{row}'] = "Project Overview"
-            ws_one_pager[f'A{row}'].font = subheader_font
-            row += 1
-            ws_one_pager[f'A{row}'] = one_pager['project_overview']
-            ws_one_pager[f'A{row}'].alignment = Alignment(wrap_text=True)
-            ws_one_pager.merge_cells(f'A{row}:C{row}')
-            row += 2
-        
-        # Eligibility Highlights
-        if one_pager.get('eligibility_highlights'):
-            ws_one_pager[f'A{row}'] = "Eligibility Highlights"
-            ws_one_pager[f'A{row}'].font = subheader_font
-            row += 1
-            for highlight in one_pager['eligibility_highlights']:
-                ws_one_pager[f'A{row}'] = f"• {highlight}"
-                ws_one_pager[f'A{row}'].alignment = Alignment(wrap_text=True)
-                ws_one_pager.merge_cells(f'A{row}:C{row}')
-                row += 1
-            row += 1
-        
-        # Important Dates
-        if one_pager.get('important_dates'):
-            ws_one_pager[f'A{row}'] = "Important Dates"
-            ws_one_pager[f'A{row}'].font = subheader_font
-            row += 1
-            for date_info in one_pager['important_dates']:
-                ws_one_pager[f'A{row}'] = f"• {date_info}"
-                row += 1
-            row += 1
-        
-        # Financial Requirements
-        if one_pager.get('financial_requirements'):
-            ws_one_pager[f'A{row}'] = "Financial Requirements"
-            ws_one_pager[f'A{row}'].font = subheader_font
-            row += 1
-            for req in one_pager['financial_requirements']:
-                ws_one_pager[f'A{row}'] = f"• {req}"
-                row += 1
-            row += 1
-        
-        # Risk Analysis
-        if one_pager.get('risk_analysis'):
-            risk = one_pager['risk_analysis']
-            ws_one_pager[f'A{row}'] = "Risk Analysis"
-            ws_one_pager[f'A{row}'].font = subheader_font
-            row += 1
-            
-            if risk.get('summary'):
-                ws_one_pager[f'A{row}'] = risk['summary']
-                ws_one_pager[f'A{row}'].alignment = Alignment(wrap_text=True)
-                ws_one_pager.merge_cells(f'A{row}:C{row}')
-                row += 2
-            
-            if risk.get('high_risk_factors'):
-                ws_one_pager[f'A{row}'] = "High Risk Factors:"
-                ws_one_pager[f'A{row}'].font = Font(bold=True, size=10, color="FF0000")
-                row += 1
-                for factor in risk['high_risk_factors']:
-                    ws_one_pager[f'A{row}'] = f"• {factor}"
-                    row += 1
-                row += 1
-            
-            if risk.get('low_risk_areas'):
-                ws_one_pager[f'A{row}'] = "Low Risk Areas:"
-                ws_one_pager[f'A{row}'].font = Font(bold=True, size=10, color="00AA00")
-                row += 1
-                for area in risk['low_risk_areas']:
-                    ws_one_pager[f'A{row}'] = f"• {area}"
-                    row += 1
-                row += 1
-            
-            if risk.get('compliance_concerns'):
-                ws_one_pager[f'A{row}'] = "Compliance Concerns:"
-                ws_one_pager[f'A{row}'].font = Font(bold=True, size=10, color="FFA500")
-                row += 1
-                for concern in risk['compliance_concerns']:
-                    ws_one_pager[f'A{row}'] = f"• {concern}"
-                    row += 1
-                row += 1
-        
-        ws_one_pager.column_dimensions['A'].width = 100
-        ws_one_pager.column_dimensions['B'].width = 20
-        ws_one_pager.column_dimensions['C'].width = 20
-    
-    # SCOPE OF WORK SHEET - NEW
-    if analysis.scope_of_work_json:
-        ws_scope = wb.create_sheet("Scope of Work")
-        scope = analysis.scope_of_work_json
-        row = 1
-        
-        ws_scope[f'A{row}'] = "SCOPE OF WORK"
-        ws_scope[f'A{row}'].font = title_font
-        ws_scope.merge_cells(f'A{row}:D{row}')
-        row += 2
-        
-        # Project Details
-        if scope.get('project_details'):
-            details = scope['project_details']
-            ws_scope[f'A{row}'] = "Project Details"
-            ws_scope[f'A{row}'].font = subheader_font
-            ws_scope[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-            ws_scope.merge_cells(f'A{row}:B{row}')
-            row += 1
-            
-            for key, value in details.items():
-                if value:
-                    label = key.replace('_', ' ').title()
-                    ws_scope[f'A{row}'] = label
-                    ws_scope[f'B{row}'] = str(value)
-                    ws_scope[f'A{row}'].border = border
-                    ws_scope[f'B{row}'].border = border
-                    row += 1
-            row += 1
-        
-        # Work Packages
-        if scope.get('work_packages'):
-            ws_scope[f'A{row}'] = "Work Packages"
-            ws_scope[f'A{row}'].font = subheader_font
-            ws_scope[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-            ws_scope.merge_cells(f'A{row}:D{row}')
-            row += 1
-            
-            # Headers for work packages
-            headers = ['Package ID', 'Name', 'Description', 'Duration']
-            for col, header in enumerate(headers, start=1):
-                cell = ws_scope.cell(row=row, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = border
-            row += 1
-            
-            for package in scope['work_packages']:
-                ws_scope[f'A{row}'] = package.get('id', '')
-                ws_scope[f'B{row}'] = package.get('name', '')
-                ws_scope[f'C{row}'] = package.get('description', '')
-                ws_scope[f'D{row}'] = package.get('estimated_duration', '')
-                
-                for col in range(1, 5):
-                    cell = ws_scope.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = Alignment(wrap_text=True)
-                row += 1
-                
-                # Components sub-table
-                if package.get('components'):
-                    ws_scope[f'B{row}'] = "Components:"
-                    ws_scope[f'B{row}'].font = Font(bold=True, size=9)
-                    row += 1
-                    for component in package['components']:
-                        comp_text = f"• {component.get('item', '')}"
-                        if component.get('quantity') and component.get('unit'):
-                            comp_text += f" ({component['quantity']} {component['unit']})"
-                        ws_scope[f'B{row}'] = comp_text
-                        ws_scope[f'B{row}'].alignment = Alignment(wrap_text=True)
-                        ws_scope.merge_cells(f'B{row}:D{row}')
-                        row += 1
-                row += 1
-            row += 1
-        
-        # Technical Specifications
-        if scope.get('technical_specifications'):
-            tech = scope['technical_specifications']
-            ws_scope[f'A{row}'] = "Technical Specifications"
-            ws_scope[f'A{row}'].font = subheader_font
-            ws_scope[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-            ws_scope.merge_cells(f'A{row}:D{row}')
-            row += 1
-            
-            if tech.get('standards'):
-                ws_scope[f'A{row}'] = "Standards:"
-                ws_scope[f'A{row}'].font = Font(bold=True, size=10)
-                row += 1
-                for std in tech['standards']:
-                    ws_scope[f'A{row}'] = f"• {std}"
-                    ws_scope.merge_cells(f'A{row}:D{row}')
-                    row += 1
-                row += 1
-            
-            if tech.get('quality_requirements'):
-                ws_scope[f'A{row}'] = "Quality Requirements:"
-                ws_scope[f'A{row}'].font = Font(bold=True, size=10)
-                row += 1
-                for req in tech['quality_requirements']:
-                    ws_scope[f'A{row}'] = f"• {req}"
-                    ws_scope.merge_cells(f'A{row}:D{row}')
-                    row += 1
-                row += 1
-        
-        # Deliverables
-        if scope.get('deliverables'):
-            ws_scope[f'A{row}'] = "Deliverables"
-            ws_scope[f'A{row}'].font = subheader_font
-            ws_scope[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-            ws_scope.merge_cells(f'A{row}:C{row}')
-            row += 1
-            
-            headers = ['Item', 'Description', 'Timeline']
-            for col, header in enumerate(headers, start=1):
-                cell = ws_scope.cell(row=row, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = border
-            row += 1
-            
-            for deliverable in scope['deliverables']:
-                ws_scope[f'A{row}'] = deliverable.get('item', '')
-                ws_scope[f'B{row}'] = deliverable.get('description', '')
-                ws_scope[f'C{row}'] = deliverable.get('timeline', '')
-                for col in range(1, 4):
-                    ws_scope.cell(row=row, column=col).border = border
-                row += 1
-            row += 1
-        
-        # Exclusions
-        if scope.get('exclusions'):
-            ws_scope[f'A{row}'] = "Exclusions"
-            ws_scope[f'A{row}'].font = subheader_font
-            ws_scope[f'A{row}'].fill = PatternFill(start_color="FFE0E0", end_color="FFE0E0", fill_type="solid")
-            ws_scope.merge_cells(f'A{row}:D{row}')
-            row += 1
-            for exclusion in scope['exclusions']:
-                ws_scope[f'A{row}'] = f"• {exclusion}"
-                ws_scope.merge_cells(f'A{row}:D{row}')
-                row += 1
-        
-        ws_scope.column_dimensions['A'].width = 25
-        ws_scope.column_dimensions['B'].width = 40
-        ws_scope.column_dimensions['C'].width = 40
-        ws_scope.column_dimensions['D'].width = 20
-    
-    # DATA SHEET - ENHANCED
-    if analysis.data_sheet_json:
-        ws_datasheet = wb.create_sheet("Data Sheet")
-        datasheet = analysis.data_sheet_json
-        row = 1
-        
-        ws_datasheet[f'A{row}'] = "DATA SHEET"
-        ws_datasheet[f'A{row}'].font = title_font
-        ws_datasheet.merge_cells(f'A{row}:B{row}')
-        row += 2
-        
-        sections = [
-            ('Project Information', datasheet.get('project_information', [])),
-            ('Contract Details', datasheet.get('contract_details', [])),
-            ('Financial Details', datasheet.get('financial_details', [])),
-            ('Technical Summary', datasheet.get('technical_summary', [])),
-            ('Important Dates', datasheet.get('important_dates', []))
-        ]
-        
-        for section_name, items in sections:
-            if items:
-                ws_datasheet[f'A{row}'] = section_name
-                ws_datasheet[f'A{row}'].font = subheader_font
-                ws_datasheet[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-                ws_datasheet.merge_cells(f'A{row}:B{row}')
-                row += 1
-                
-                for item in items:
-                    ws_datasheet[f'A{row}'] = item.get('label', '')
-                    ws_datasheet[f'B{row}'] = item.get('value', '')
-                    ws_datasheet[f'A{row}'].border = border
-                    ws_datasheet[f'B{row}'].border = border
-                    
-                    # Highlight important items
-                    if item.get('highlight'):
-                        ws_datasheet[f'A{row}'].font = Font(bold=True)
-                        ws_datasheet[f'B{row}'].font = Font(bold=True)
-                        ws_datasheet[f'B{row}'].fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
-                    
-                    row += 1
-                row += 1
-        
-        ws_datasheet.column_dimensions['A'].width = 35
-        ws_datasheet.column_dimensions['B'].width = 60
-
-    # RFP SECTIONS SHEET - NEW
-    if rfp_sections:
-        ws_rfp = wb.create_sheet("RFP Sections")
-        row = 1
-        
-        ws_rfp[f'A{row}'] = "RFP SECTION ANALYSIS"
-        ws_rfp[f'A{row}'].font = title_font
-        ws_rfp.merge_cells(f'A{row}:E{row}')
-        row += 2
-        
-        # Headers
-        headers = ['Section #', 'Title', 'Summary', 'Key Requirements', 'Compliance Issues']
-        for col, header in enumerate(headers, start=1):
-            cell = ws_rfp.cell(row=row, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', wrap_text=True)
-            cell.border = border
-        row += 1
-        
-        for section in rfp_sections:
-            start_row = row
-            ws_rfp[f'A{row}'] = section.section_number or ''
-            ws_rfp[f'B{row}'] = section.section_title or ''
-            ws_rfp[f'C{row}'] = section.summary or ''
-            
-            # Key requirements
-            if section.key_requirements:
-                reqs = '\n'.join([f"• {req}" for req in section.key_requirements])
-                ws_rfp[f'D{row}'] = reqs
-            
-            # Compliance issues
-            if section.compliance_issues:
-                issues = '\n'.join([f"• {issue}" for issue in section.compliance_issues])
-                ws_rfp[f'E{row}'] = issues
-            
-            # Apply borders and alignment
-            for col in range(1, 6):
-                cell = ws_rfp.cell(row=row, column=col)
-                cell.border = border
-                cell.alignment = Alignment(wrap_text=True, vertical='top')
-            
-            row += 1
-        
-        ws_rfp.column_dimensions['A'].width = 12
-        ws_rfp.column_dimensions['B'].width = 35
-        ws_rfp.column_dimensions['C'].width = 45
-        ws_rfp.column_dimensions['D'].width = 40
-        ws_rfp.column_dimensions['E'].width = 40
-    
-    # BID SYNOPSIS / QUALIFICATIONS SHEET - NEW
-    if analysis.bid_synopsis_json:
-        ws_bid = wb.create_sheet("Qualifications")
-        bid_synopsis = analysis.bid_synopsis_json
-        row = 1
-        
-        ws_bid[f'A{row}'] = "QUALIFICATION CRITERIA"
-        ws_bid[f'A{row}'].font = title_font
-        ws_bid.merge_cells(f'A{row}:C{row}')
-        row += 2
-        
-        # Iterate through qualification categories
-        for category, criteria in bid_synopsis.items():
-            if criteria and isinstance(criteria, (list, dict)):
-                ws_bid[f'A{row}'] = category.replace('_', ' ').title()
-                ws_bid[f'A{row}'].font = subheader_font
-                ws_bid[f'A{row}'].fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-                ws_bid.merge_cells(f'A{row}:C{row}')
-                row += 1
-                
-                if isinstance(criteria, list):
-                    for item in criteria:
-                        if isinstance(item, dict):
-                            for key, value in item.items():
-                                ws_bid[f'A{row}'] = key.replace('_', ' ').title()
-                                ws_bid[f'B{row}'] = str(value)
-                                ws_bid[f'A{row}'].border = border
-                                ws_bid[f'B{row}'].border = border
-                                row += 1
-                        else:
-                            ws_bid[f'A{row}'] = f"• {item}"
-                            ws_bid.merge_cells(f'A{row}:C{row}')
-                            row += 1
-                elif isinstance(criteria, dict):
-                    for key, value in criteria.items():
-                        ws_bid[f'A{row}'] = key.replace('_', ' ').title()
-                        ws_bid[f'B{row}'] = str(value)
-                        ws_bid[f'A{row}'].border = border
-                        ws_bid[f'B{row}'].border = border
-                        row += 1
-                row += 1
-        
-        ws_bid.column_dimensions['A'].width = 40
-        ws_bid.column_dimensions['B'].width = 60
-        ws_bid.column_dimensions['C'].width = 30
-
-    # TEMPLATES SHEET - IMPROVED
-    if templates:
-        ws_templates = wb.create_sheet("Document Templates")
-        row = 1
-
-        ws_templates[f'A{row}'] = "REQUIRED DOCUMENT TEMPLATES"
-        ws_templates[f'A{row}'].font = title_font
-        ws_templates.merge_cells(f'A{row}:E{row}')
-        row += 2
-
-        # Headers
-        headers = ['Template Name', 'Category', 'Format', 'Mandatory', 'Description']
-        for col, header in enumerate(headers, start=1):
-            cell = ws_templates.cell(row=row, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = border
-        row += 1
-
-        # Data from templates object
-        categories = [
-            ('Bid Submission Forms', templates.bid_submission_forms or []),
-            ('Financial Formats', templates.financial_formats or []),
-            ('Technical Documents', templates.technical_documents or []),
-            ('Compliance Formats', templates.compliance_formats or [])
-        ]
-
-        for category_name, items in categories:
-            for template in items:
-                ws_templates[f'A{row}'] = template.name
-                ws_templates[f'B{row}'] = category_name
-                ws_templates[f'C{row}'] = template.format.upper() if template.format else 'N/A'
-                ws_templates[f'D{row}'] = 'Yes' if template.mandatory else 'No'
-                ws_templates[f'E{row}'] = template.description or ''
-                
-                for col in range(1, 6):
-                    cell = ws_templates.cell(row=row, column=col)
-                    cell.border = border
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
-                
-                # Highlight mandatory templates
-                if template.mandatory:
-                    ws_templates.cell(row=row, column=4).fill = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
-                
-                row += 1
-
-        ws_templates.column_dimensions['A'].width = 45
-        ws_templates.column_dimensions['B'].width = 25
-        ws_templates.column_dimensions['C'].width = 12
-        ws_templates.column_dimensions['D'].width = 12
-        ws_templates.column_dimensions['E'].width = 60
-
-    buffer = io.BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    
-    filename = f"Tender_Analysis_{analysis.tender_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    return buffer.getvalue(), filename, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-
-
-def generate_word_report(analysis, rfp_sections, templates):
-    """Generate a comprehensive Word report of the tender analysis"""
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from datetime import datetime
-    import io
-    
-    doc = Document()
-    
-    # Title Page
-    title = doc.add_heading('TENDER ANALYSIS REPORT', level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.runs[0]
-    title_run.font.size = Pt(28)
-    title_run.font.color.rgb = RGBColor(26, 86, 219)
-    
-    doc.add_paragraph()
-    doc.add_paragraph()
-    
-    info_para = doc.add_paragraph()
-    info_para.add_run(f"Tender ID: {analysis.tender_id}\n").bold = True
-    info_para.add_run(f"Status: {analysis.status.value}\n")
-    if analysis.analysis_completed_at:
-        info_para.add_run(f"Analysis Date: {analysis.analysis_completed_at.strftime('%B %d, %Y')}")
-    info_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    doc.add_page_break()
-    
-    # ONE PAGER
-    if analysis.one_pager_json:
-        doc.add_heading('1. EXECUTIVE SUMMARY (ONE PAGER)', level=1)
-        one_pager = analysis.one_pager_json
-        
-        if one_pager.get('project_overview'):
-            doc.add_heading('Project Overview', level=2)
-            doc.add_paragraph(one_pager['project_overview'])
-        
-        if one_pager.get('financial_requirements'):
-            doc.add_heading('Financial Requirements', level=2)
-            for req in one_pager['financial_requirements']:
-                doc.add_paragraph(req, style='List Bullet')
-        
-        if one_pager.get('eligibility_highlights'):
-            doc.add_heading('Eligibility Highlights', level=2)
-            for highlight in one_pager['eligibility_highlights']:
-                doc.add_paragraph(highlight, style='List Bullet')
-        
-        if one_pager.get('important_dates'):
-            doc.add_heading('Important Dates', level=2)
-            for date in one_pager['important_dates']:
-                doc.add_paragraph(date, style='List Bullet')
-        
-        if one_pager.get('risk_analysis'):
-            risk = one_pager['risk_analysis']
-            doc.add_heading('Risk Analysis', level=2)
-            if risk.get('summary'):
-                doc.add_paragraph(risk['summary'])
-        
-        doc.add_page_break()
-    
-    # SCOPE OF WORK
-    if analysis.scope_of_work_json:
-        doc.add_heading('2. SCOPE OF WORK', level=1)
-        scope = analysis.scope_of_work_json
-        
-        if scope.get('project_details'):
-            details = scope['project_details']
-            doc.add_heading('Project Details', level=2)
-            
-            table = doc.add_table(rows=1, cols=2)
-            table.style = 'Light Grid Accent 1'
-            
-            if details.get('project_name'):
-                row = table.add_row()
-                row.cells[0].text = 'Project Name'
-                row.cells[1].text = details['project_name']
-            if details.get('location'):
-                row = table.add_row()
-                row.cells[0].text = 'Location'
-                row.cells[1].text = details['location']
-            if details.get('duration'):
-                row = table.add_row()
-                row.cells[0].text = 'Duration'
-                row.cells[1].text = details['duration']
-            if details.get('contract_value'):
-                row = table.add_row()
-                row.cells[0].text = 'Contract Value'
-                row.cells[1].text = details['contract_value']
-        
-        if scope.get('work_packages'):
-            doc.add_heading('Work Packages', level=2)
-            for i, package in enumerate(scope['work_packages'], 1):
-                doc.add_heading(f"{i}. {package.get('name', 'Work Package')}", level=3)
-                if package.get('description'):
-                    doc.add_paragraph(package['description'])
-        
-        doc.add_page_break()
-    
-    # DATA SHEET
-    if analysis.data_sheet_json:
-        doc.add_heading('3. DATA SHEET', level=1)
-        datasheet = analysis.data_sheet_json
-        
-        sections = [
-            ('Project Information', datasheet.get('project_information', [])),
-            ('Contract Details', datasheet.get('contract_details', [])),
-            ('Financial Details', datasheet.get('financial_details', [])),
-            ('Technical Summary', datasheet.get('technical_summary', [])),
-            ('Important Dates', datasheet.get('important_dates', []))
-        ]
-        
-        for section_name, items in sections:
-            if items:
-                doc.add_heading(section_name, level=2)
-                table = doc.add_table(rows=1, cols=2)
-                table.style = 'Light Grid Accent 1'
-                
-                hdr_cells = table.rows[0].cells
-                hdr_cells[0].text = 'Field'
-                hdr_cells[1].text = 'Value'
-                
-                for item in items:
-                    row = table.add_row()
-                    row.cells[0].text = item['label']
-                    row.cells[1].text = item['value']
-        
-        doc.add_page_break()
-    
-    # RFP SECTIONS
-    if rfp_sections and rfp_sections.sections:
-        doc.add_heading('4. RFP SECTIONS ANALYSIS', level=1)
-        for section in rfp_sections.sections:
-            doc.add_heading(f"{section.section_name}: {section.section_title}", level=2)
-            if section.summary:
-                doc.add_paragraph(section.summary)
-            
-            if section.key_requirements:
-                doc.add_heading('Key Requirements', level=3)
-                for req in section.key_requirements[:10]:
-                    doc.add_paragraph(req, style='List Bullet')
-        
-        doc.add_page_break()
-
-    # TEMPLATES
-    if templates:
-        doc.add_heading('5. REQUIRED TEMPLATES', level=1)
-        all_templates = []
-        all_templates.extend(templates.bid_submission_forms or [])
-        all_templates.extend(templates.financial_formats or [])
-        all_templates.extend(templates.technical_documents or [])
-        all_templates.extend(templates.compliance_formats or [])
-
-        if all_templates:
-            doc.add_paragraph(f"Total Templates: {len(all_templates)}")
-
-            table = doc.add_table(rows=1, cols=3)
-            table.style = 'Light Grid Accent 1'
-
-            hdr_cells = table.rows[0].cells
-            hdr_cells[0].text = 'Template Name'
-            hdr_cells[1].text = 'Format'
-            hdr_cells[2].text = 'Mandatory'
-
-            for template in all_templates:
-                row = table.add_row()
-                row.cells[0].text = template.name
-                row.cells[1].text = template.format.upper()
-                row.cells[2].text = 'Yes' if template.mandatory else 'No'
-
-    buffer = io.BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-
-    filename = f"Tender_Analysis_{analysis.tender_id}_{datetime.now().strftime('%Y%m%d')}.docx"
-    return buffer.getvalue(), filename, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
@@ -3,7 +3,8 @@ Repository for TenderIQ analysis data access operations.
 """
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session, defer, joinedload, selectinload
 
 from app.modules.analyze.models.pydantic_models import RFPSectionSchema
 from app.modules.tenderiq.db.schema import Tender
@@ -14,29 +15,57 @@ def get_wishlisted_tenders(db: Session) -> List[Tender]:
     wishlisted = db.query(Tender).filter(Tender.is_wishlisted == True).all()
     return wishlisted
 
-def get_by_tender_id(db: Session, tender_id: str) -> Optional[TenderAnalysis]:
+def _with_related(query, response_only: bool = False):
+    """
+    Eager-load RFP sections and document templates with the analysis.
+    Sections are joined into the analysis query; templates come in one
+    batched IN query (joining both collections would multiply the rows).
+
+    With response_only, columns the analysis API response never reads
+    (the bid synopsis JSONB and the error text) are deferred so they are
+    not fetched unless accessed.
+    """
+    options = [
+        joinedload(TenderAnalysis.rfp_sections),
+        selectinload(TenderAnalysis.document_templates),
+    ]
+    if response_only:
+        options += [
+            defer(TenderAnalysis.bid_synopsis_json),
+            defer(TenderAnalysis.error_message),
+        ]
+    return query.options(*options)
+
+def get_by_tender_id(db: Session, tender_id: str, response_only: bool = False) -> Optional[TenderAnalysis]:
     """
     Retrieves a tender analysis record by the tender_id,
     eagerly loading related data.
     tender_id is the unique tender number eg. 51655667, 51702878 etc.
     """
-    return (
-        db.query(TenderAnalysis)
-        .filter_by(tender_id=tender_id)
-        .options(
-            joinedload(TenderAnalysis.rfp_sections),
-            joinedload(TenderAnalysis.document_templates)
-        )
-        .first()
-    )
+    return _with_related(
+        db.query(TenderAnalysis).filter_by(tender_id=tender_id), response_only
+    ).first()
 
-def get_by_id(db: Session, tender_id: UUID) -> Optional[TenderAnalysis]:
-    """Retrieves a tender analysis record by its own ID."""
-    tender = db.query(Tender).filter_by(id=tender_id).first()
-    if not tender:
-        return None
+def get_by_id(db: Session, tender_id: UUID, response_only: bool = False) -> Optional[TenderAnalysis]:
+    """
+    Retrieves the tender analysis for a tender, given the tender's UUID,
+    eagerly loading related data.
+    """
+    return _with_related(
+        db.query(TenderAnalysis)
+        .join(Tender, Tender.tender_ref_number == TenderAnalysis.tender_id)
+        .filter(Tender.id == tender_id),
+        response_only,
+    ).first()
 
-    return db.query(TenderAnalysis).filter_by(tender_id=tender.tender_ref_number).first()
+def get_by_analysis_id(db: Session, analysis_id: UUID) -> Optional[TenderAnalysis]:
+    """
+    Retrieves a tender analysis record by its own id,
+    eagerly loading related data.
+    """
+    return _with_related(
+        db.query(TenderAnalysis).filter(TenderAnalysis.id == analysis_id)
+    ).first()
 
 def create_for_tender(db: Session, tender_id: str, user_id: Optional[UUID]) -> TenderAnalysis:
     """
@@ -60,27 +89,36 @@ def update(db: Session, analysis: TenderAnalysis, updates: dict) -> TenderAnalys
 
 def tender_is_analyzed(db: Session, tender_id: str) -> Optional[TenderAnalysis]:
     """Checks if a tender has been analyzed."""
-    return (
-        db.query(TenderAnalysis)
-        .filter_by(tender_id=tender_id)
-        .options(
-            joinedload(TenderAnalysis.rfp_sections),
-            joinedload(TenderAnalysis.document_templates)
-        )
-        .first()
-    )
+    return get_by_tender_id(db, tender_id)
 
-def get_rfp_sections(db: Session, analysis_id: UUID) -> List[AnalysisRFPSection]:
-    return (
-        db.query(AnalysisRFPSection)
-        .filter_by(analysis_id=analysis_id)
-        .all()
-    )
+def get_rfp_sections(db: Session, analysis_id: UUID) -> List[Row]:
+    """
+    Fetch the RFP sections of an analysis as plain rows holding only the
+    columns the RFP response is built from (no ORM objects, no identity map).
+    """
+    return db.execute(
+        select(
+            AnalysisRFPSection.section_number,
+            AnalysisRFPSection.section_title,
+            AnalysisRFPSection.summary,
+            AnalysisRFPSection.key_requirements,
+            AnalysisRFPSection.compliance_issues,
+            AnalysisRFPSection.page_references,
+        ).where(AnalysisRFPSection.analysis_id == analysis_id)
+    ).all()
 
-def get_document_templates(db: Session, analysis_id: UUID) -> List[AnalysisDocumentTemplate]:
-    """Fetch all document templates for a given analysis."""
-    return (
-        db.query(AnalysisDocumentTemplate)
-        .filter_by(analysis_id=analysis_id)
-        .all()
-    )
+def get_document_templates(db: Session, analysis_id: UUID) -> List[Row]:
+    """
+    Fetch all document templates for a given analysis as plain rows holding
+    only the columns the templates response is built from.
+    """
+    return db.execute(
+        select(
+            AnalysisDocumentTemplate.id,
+            AnalysisDocumentTemplate.template_name,
+            AnalysisDocumentTemplate.description,
+            AnalysisDocumentTemplate.required_format,
+            AnalysisDocumentTemplate.file_reference,
+            AnalysisDocumentTemplate.page_references,
+        ).where(AnalysisDocumentTemplate.analysis_id == analysis_id)
+    ).all()
@@ -9,8 +9,11 @@ from typing import List, Optional
 from uuid import uuid4
 from functools import wraps
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
 from app.modules.scraper.db.schema import ScrapedTender, ScrapedTenderFile
@@ -23,6 +26,8 @@ from app.modules.analyze.models.pydantic_models import (
 )
 from app.core.services import llm_model, vector_store, pdf_processor
 from app.modules.askai.services.document_service import DocumentService
+from app.modules.analyze.services.analysis_cache_service import invalidate_analysis
+from app.modules.analyze.services import llm_result_cache_service as llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,11 @@ MAX_CONTEXT_CHARS = 50000  # Max characters to send to LLM in context
 REQUEST_TIMEOUT = 30  # Seconds to wait for HTTP requests
 MAX_RETRIES = 3  # Number of times to retry failed operations
 RETRY_DELAY = 1.0  # Base delay in seconds between retries (exponential backoff)
+MAX_DOWNLOAD_WORKERS = 16  # Tender files downloaded concurrently (network-bound, so threads)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes written per read while streaming a download to disk
+
+# Progress parameters
+PROGRESS_COMMIT_STEP = 5  # Per-file progress is committed once it has advanced this many points
 
 
 # ============================================================================
@@ -163,6 +173,7 @@ def analyze_tender(db: Session, tdr: str):
     # Initialize temp_dir and analysis variables so they're available in finally block
     temp_dir = None
     analysis = None
+    tender = None
 
     # Memory optimization: Force garbage collection and check memory
     gc.collect()
@@ -175,30 +186,36 @@ def analyze_tender(db: Session, tdr: str):
         # ====================================================================
         logger.info(f"[{tdr}] Starting analysis with memory optimization")
 
-        # Optimize: Single eager-loaded query instead of 3 separate queries
-        # This reduces database round-trips from 3 to 1
-        scraped_tender = (
-            db.query(ScrapedTender)
+        # One round-trip for the scraped tender (with its files), the tenderiq
+        # tender and any existing analysis; the three tables share only the
+        # reference number, so they are outer-joined on it
+        row = db.execute(
+            select(ScrapedTender, Tender, TenderAnalysis)
+            .outerjoin(Tender, Tender.tender_ref_number == ScrapedTender.tender_id_str)
+            .outerjoin(TenderAnalysis, TenderAnalysis.tender_id == ScrapedTender.tender_id_str)
             .options(joinedload(ScrapedTender.files))
-            .filter(ScrapedTender.tender_id_str == tdr)
-            .first()
-        )
-
-        # Also get tender from tenderiq module (separate query is OK here)
-        tender = db.query(Tender).filter(Tender.tender_ref_number == tdr).first()
+            .where(ScrapedTender.tender_id_str == tdr)
+            .limit(1)
+        ).unique().first()
+        scraped_tender, tender, analysis = row if row else (None, None, None)
 
         # Validate that we have the required data
         if not tender or not scraped_tender:
             logger.error(f"[{tdr}] Tender not found in database")
+            # Fail the record the trigger queued; the trigger refuses to
+            # re-queue a tender whose analysis still looks pending
+            failed = db.query(TenderAnalysis).filter(TenderAnalysis.tender_id == tdr).update(
+                {"status": AnalysisStatusEnum.failed, "error_message": "Tender not found in database"},
+                synchronize_session=False,
+            )
+            db.commit()
+            if failed:
+                invalidate_analysis(tdr, tender.id if tender else None)
             return
 
         logger.info(f"[{tdr}] Found tender: {scraped_tender.tender_name}")
 
-        # Get or create analysis record
-        analysis = db.query(TenderAnalysis).filter(
-            TenderAnalysis.tender_id == tdr
-        ).first()
-
+        # Create the analysis record if this tender has never been analyzed
         if not analysis:
             print(f"🆕 Creating new analysis record...")
             analysis = TenderAnalysis(
@@ -285,6 +302,7 @@ def analyze_tender(db: Session, tdr: str):
         total_chunks_created = 0
         files_processed = 0
         base_progress = 20  # Start file processing at 20%
+        committed_progress = 0
 
         # Process each downloaded file with comprehensive DocumentService
         # Supports PDF, Excel, HTML, and archive files
@@ -321,7 +339,7 @@ def analyze_tender(db: Session, tdr: str):
                 current_progress = int(base_progress + (files_processed * file_progress_increment))
                 analysis.progress = min(current_progress, 70)  # Cap at 70%
                 analysis.status_message = f"Processing files: {files_processed}/{total_files} ({total_chunks_created} chunks)"
-                db.commit()
+                committed_progress = _maybe_commit(db, analysis, committed_progress, force=files_processed == total_files)
 
             except ValueError as e:
                 logger.warning(f"[{tdr}] Skipping unsupported file: {file_path.name} - {e}")
@@ -417,51 +435,46 @@ def analyze_tender(db: Session, tdr: str):
 
         tender_context = _build_tender_context(tender, scraped_tender, all_text)
 
-        logger.info(f"[{tdr}] Starting sequential LLM analysis")
+        logger.info(f"[{tdr}] Starting concurrent LLM analysis")
 
         # ====================================================================
-        # Generate analyses sequentially (one after another)
-        # Each call processes: 1) Executive summary, 2) Scope of work, 3) Data sheet
+        # Generate the three structured analyses concurrently
+        # 1) Executive summary, 2) Scope of work, 3) Data sheet
+        # Each is an independent LLM call on the same context that touches
+        # no database state, so they overlap on threads; results are applied
+        # to the analysis row here, on the session's own thread. Results for
+        # an unchanged context are reused from the LLM result cache.
         # ====================================================================
-
-        # Step 1: Generate executive summary (OnePager)
-        logger.info(f"[{tdr}] Generating executive summary (OnePager)")
-        analysis.progress = 70
-        analysis.status_message = "Generating executive summary"
-        db.commit()
-
-        one_pager = _generate_executive_summary(tender_context, tdr)
-        if one_pager:
-            analysis.one_pager_json = one_pager
-            logger.info(f"[{tdr}] Executive summary generated successfully")
-        else:
-            logger.warning(f"[{tdr}] Failed to generate executive summary")
-
-        # Step 2: Generate scope of work
-        logger.info(f"[{tdr}] Generating scope of work details")
-        analysis.progress = 80
-        analysis.status_message = "Generating scope of work"
-        db.commit()
-
-        scope_of_work = _generate_scope_of_work_details(tender_context, scraped_tender, tdr)
-        if scope_of_work:
-            analysis.scope_of_work_json = scope_of_work
-            logger.info(f"[{tdr}] Scope of work generated successfully")
-        else:
-            logger.warning(f"[{tdr}] Failed to generate scope of work")
-
-        # Step 3: Generate comprehensive datasheet
-        logger.info(f"[{tdr}] Generating comprehensive datasheet")
-        analysis.progress = 90
-        analysis.status_message = "Generating datasheet"
+        # Tracked locally: reading analysis.progress after a commit would reload the row
+        llm_progress = 70
+        analysis.progress = llm_progress
+        analysis.status_message = "Generating executive summary, scope of work and datasheet"
         db.commit()
 
-        data_sheet = _generate_comprehensive_datasheet(tender_context, scraped_tender, tdr)
-        if data_sheet:
-            analysis.data_sheet_json = data_sheet
-            logger.info(f"[{tdr}] Data sheet generated successfully")
-        else:
-            logger.warning(f"[{tdr}] Failed to generate datasheet")
+        llm_steps = {
+            "one_pager_json": ("Executive summary", _generate_executive_summary, (tender_context, tdr)),
+            "scope_of_work_json": ("Scope of work", _generate_scope_of_work_details, (tender_context, scraped_tender, tdr)),
+            "data_sheet_json": ("Data sheet", _generate_comprehensive_datasheet, (tender_context, scraped_tender, tdr)),
+        }
+        context_digest = llm_cache.context_digest(tender_context)
+        with ThreadPoolExecutor(max_workers=len(llm_steps)) as executor:
+            futures = {
+                executor.submit(_run_cached_llm_step, field, generate, args, context_digest, tdr): (field, label)
+                for field, (label, generate, args) in llm_steps.items()
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                field, label = futures[future]
+                result = future.result()
+                if result:
+                    setattr(analysis, field, result)
+                    logger.info(f"[{tdr}] {label} generated successfully")
+                else:
+                    logger.warning(f"[{tdr}] Failed to generate {label.lower()}")
+                llm_progress += 7
+                analysis.progress = llm_progress
+                # The last result goes out with the status change below
+                if completed < len(futures):
+                    db.commit()
 
         # ====================================================================
         # STEP 5.1: GENERATE RFP SECTIONS ANALYSIS
@@ -490,12 +503,9 @@ def analyze_tender(db: Session, tdr: str):
         try:
             from app.modules.bidsynopsis.bid_synopsis_generator import generate_and_save_bid_synopsis
             
-            # Get scraped tender (ScrapedTender already imported at module level)
-            scraped_tender_for_synopsis = db.query(ScrapedTender).filter_by(tender_id_str=analysis.tender_id).first()
-            
-            # Generate and save bid synopsis
+            # Generate and save bid synopsis (scraped_tender was loaded in step 1)
             import asyncio
-            bid_synopsis = asyncio.run(generate_and_save_bid_synopsis(analysis, scraped_tender_for_synopsis, db))
+            bid_synopsis = asyncio.run(generate_and_save_bid_synopsis(analysis, scraped_tender, db))
             logger.info(f"[{tdr}] Generated bid synopsis with {len(bid_synopsis.get('qualification_criteria', []))} criteria")
         except Exception as bid_error:
             logger.warning(f"[{tdr}] Failed to generate bid synopsis: {bid_error}")
@@ -509,6 +519,7 @@ def analyze_tender(db: Session, tdr: str):
         analysis.status_message = "Analysis completed successfully"
         analysis.analysis_completed_at = datetime.utcnow()
         db.commit()
+        invalidate_analysis(tdr, tender.id)
 
         logger.info(f"[{tdr}] Analysis pipeline completed successfully")
 
@@ -519,6 +530,7 @@ def analyze_tender(db: Session, tdr: str):
             analysis.status = AnalysisStatusEnum.failed
             analysis.error_message = f"Analysis failed: {str(e)[:500]}"  # Truncate to DB limit
             db.commit()
+            invalidate_analysis(tdr, tender.id if tender else None)
 
     finally:
         # ====================================================================
@@ -537,6 +549,29 @@ def analyze_tender(db: Session, tdr: str):
         logger.info(f"[{tdr}] Analysis cleanup complete")
 
 
+# ============================================================================
+# HELPER FUNCTIONS - PROGRESS
+# ============================================================================
+
+def _maybe_commit(db: Session, analysis: TenderAnalysis, committed_progress: int, force: bool = False) -> int:
+    """
+    Commit the analysis row's pending progress if it has advanced at least
+    PROGRESS_COMMIT_STEP points past `committed_progress`, or if `force` is set.
+
+    Smaller steps stay pending in the session and are written by the next
+    commit, so a tender with many small files does not pay one database
+    round-trip per file.
+
+    Returns:
+        The progress value now committed to the database
+    """
+    progress = analysis.progress  # read before commit() expires the instance
+    if force or progress - committed_progress >= PROGRESS_COMMIT_STEP:
+        db.commit()
+        return progress
+    return committed_progress
+
+
 # ============================================================================
 # HELPER FUNCTIONS - DATA FETCHING & PROCESSING
 # ============================================================================
@@ -548,6 +583,7 @@ def _download_files_with_retry(
     Download files from URLs with retry logic for transient failures.
 
     This function implements robust file downloading with:
+    - Concurrent downloads over one pooled, keep-alive HTTP session
     - Retry logic for transient network failures
     - Graceful handling of partial failures (if 1 file fails, others proceed)
     - Logging of each download attempt
@@ -558,28 +594,56 @@ def _download_files_with_retry(
         tdr: Tender ID for logging
 
     Returns:
-        List of successfully downloaded file paths (may be partial list if some failed)
+        List of successfully downloaded file paths, in the order of `files`
+        (may be partial list if some failed)
     """
-    downloaded_files = []
+    if not files:
+        return []
 
-    for file in files:
-        try:
-            # Download with retry decorator for transient failures
-            file_path = _download_single_file_with_retry(file, temp_dir)
-            downloaded_files.append(file_path)
-            logger.info(f"[{tdr}] Downloaded: {file.file_name}")
-        except Exception as e:
-            # Log failure but continue with other files
-            # This prevents 1 bad file from stopping the entire analysis
-            logger.error(f"[{tdr}] Failed to download {file.file_name}: {e}")
+    workers = min(len(files), MAX_DOWNLOAD_WORKERS)
+    downloaded = {}
+
+    # One session for every download and retry, so connections to the same
+    # host are reused instead of re-handshaking per file
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # File names are scraped page text and can repeat within a tender; give
+        # every download its own path so concurrent writers never share a file
+        target_names = set()
+        targets = []
+        for index, file in enumerate(files):
+            name = file.file_name
+            if name in target_names:
+                name = f"{index}_{name}"
+            target_names.add(name)
+            targets.append(temp_dir / name)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_download_single_file_with_retry, session, file, targets[index]): (index, file)
+                for index, file in enumerate(files)
+            }
+            for future in as_completed(futures):
+                index, file = futures[future]
+                try:
+                    downloaded[index] = future.result()
+                    logger.info(f"[{tdr}] Downloaded: {file.file_name}")
+                except Exception as e:
+                    # Log failure but continue with other files
+                    # This prevents 1 bad file from stopping the entire analysis
+                    logger.error(f"[{tdr}] Failed to download {file.file_name}: {e}")
 
-    return downloaded_files
+    return [downloaded[index] for index in sorted(downloaded)]
 
 
 @retry_with_backoff(max_attempts=MAX_RETRIES, base_delay=RETRY_DELAY)
-def _download_single_file_with_retry(file: ScrapedTenderFile, temp_dir: Path) -> Path:
+def _download_single_file_with_retry(session: requests.Session, file: ScrapedTenderFile, file_path: Path) -> Path:
     """
-    Download a single file with automatic retry on failure.
+    Download a single file with automatic retry on failure, streaming the
+    body to disk instead of holding it in memory.
 
     The @retry_with_backoff decorator handles:
     - Network timeouts
@@ -587,18 +651,20 @@ def _download_single_file_with_retry(file: ScrapedTenderFile, temp_dir: Path) ->
     - Rate limiting from servers
 
     Args:
+        session: Shared HTTP session
         file: ScrapedTenderFile object
-        temp_dir: Directory to save the file
+        file_path: Path to save the file to (unique per download)
 
     Returns:
         Path to downloaded file
     """
-    response = requests.get(file.file_url, timeout=REQUEST_TIMEOUT)
-    response.raise_for_status()  # Raise exception if status is not 200-299
+    with session.get(file.file_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()  # Raise exception if status is not 200-299
 
-    file_path = temp_dir / file.file_name
-    with open(file_path, "wb") as f:
-        f.write(response.content)
+        with open(file_path, "wb") as f:
+            # iter_content (not response.raw) so gzip/deflate transfer encoding is decoded
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
     return file_path
 
@@ -660,6 +726,22 @@ EXTRACTED DOCUMENT CONTENT:
     return context
 
 
+def _run_cached_llm_step(step: str, generate, args: tuple, context_digest: str, tdr: str) -> Optional[dict]:
+    """
+    Run one LLM analysis step, reusing its cached result when the tender
+    context is unchanged; successful results are cached for next time.
+    """
+    cached = llm_cache.get_cached_result(step, context_digest)
+    if cached is not None:
+        logger.info(f"[{tdr}] Reusing cached {step} for unchanged tender context")
+        return cached
+
+    result = generate(*args)
+    if result:
+        llm_cache.cache_result(step, context_digest, result)
+    return result
+
+
 @retry_with_backoff(max_attempts=MAX_RETRIES, base_delay=RETRY_DELAY)
 def _generate_executive_summary(context: str, tdr: str) -> Optional[dict]:
     """
@@ -0,0 +1,55 @@
+"""
+Redis cache for serialized tender analysis responses.
+
+GET /analyze/{tender_id} is polled while an analysis runs and re-read many
+times once it completes. The fully serialized response is cached under the
+identifier the client used (tender reference number or tender UUID):
+briefly while the analysis is in progress so progress updates still show,
+longer once it has completed or failed. Redis errors are logged and treated
+as a cache miss so the endpoint keeps working without Redis.
+"""
+import logging
+from typing import Optional
+
+import redis
+
+from app.db.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CACHE_PREFIX = "analysis:v1:"
+FINAL_TTL_SECONDS = 300  # completed / failed analyses only change on re-trigger, which invalidates
+IN_PROGRESS_TTL_SECONDS = 5  # keeps polled progress at most a few seconds stale
+
+
+def _key(ident: str) -> str:
+    return f"{ANALYSIS_CACHE_PREFIX}{ident}"
+
+
+def get_cached_analysis(ident: str) -> Optional[str]:
+    """Return the cached response JSON for an identifier, or None on miss."""
+    try:
+        return get_redis_client().get(_key(ident))
+    except redis.RedisError as e:
+        logger.warning("Analysis cache read failed for %s: %s", ident, e)
+        return None
+
+
+def cache_analysis(ident: str, payload: str, final: bool) -> None:
+    """Store a serialized response; `final` selects the long TTL."""
+    ttl = FINAL_TTL_SECONDS if final else IN_PROGRESS_TTL_SECONDS
+    try:
+        get_redis_client().setex(_key(ident), ttl, payload)
+    except redis.RedisError as e:
+        logger.warning("Analysis cache write failed for %s: %s", ident, e)
+
+
+def invalidate_analysis(*idents) -> None:
+    """Drop cached responses for every given identifier (None values are skipped)."""
+    keys = [_key(str(ident)) for ident in idents if ident is not None]
+    if not keys:
+        return
+    try:
+        get_redis_client().delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Analysis cache invalidation failed for %s: %s", idents, e)
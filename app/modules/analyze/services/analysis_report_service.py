@@ -0,0 +1,1097 @@
+"""
+Rendering of complete tender analysis reports (PDF, Excel, Word).
+
+Used by the report download endpoint and by the background report task,
+which renders ahead of the download so the request only streams the file.
+Rendered files are kept in the report cache keyed by analysis version.
+"""
+import html
+import logging
+import re
+import tempfile
+import zipfile
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import column_index_from_string
+from openpyxl.writer.excel import ExcelWriter
+
+from app.modules.analyze.db.schema import TenderAnalysis
+from app.modules.analyze.services import analysis_rfp_service as rfp_service
+from app.modules.analyze.services import analysis_template_service as template_service
+from app.modules.analyze.services import report_cache_service as report_cache
+
+logger = logging.getLogger(__name__)
+
+# PDF and Word output depend on optional libraries
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    HAS_REPORTLAB = True
+
+    # PDF report geometry, in points
+    _PDF_MARGIN = 0.75 * inch
+    _PDF_DETAILS_COL_WIDTHS = (2 * inch, 4.5 * inch)
+    _PDF_DATASHEET_COL_WIDTHS = (2.5 * inch, 4 * inch)
+    _PDF_TEMPLATES_COL_WIDTHS = (3.5 * inch, 1.5 * inch, 1.5 * inch)
+except ImportError:
+    HAS_REPORTLAB = False
+    logger.warning("reportlab not installed. PDF reports disabled. Install with: pip install reportlab")
+
+try:
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    HAS_DOCX = True
+except ImportError:
+    HAS_DOCX = False
+    logger.warning("python-docx not installed. Word reports disabled. Install with: pip install python-docx")
+
+
+def warm_up_renderers() -> None:
+    """
+    Build the PDF styles, load the standard font metrics the reports use and
+    open python-docx's default template once, so the first report rendered
+    in a process doesn't pay for it. Safe to call before forking.
+    """
+    if HAS_REPORTLAB:
+        _pdf_report_styles()
+        for font_name in ('Helvetica', 'Helvetica-Bold'):
+            pdfmetrics.getFont(font_name)
+    if HAS_DOCX:
+        Document()
+
+
+def normalize_report_format(format: str) -> str:
+    """Map a requested format (pdf, excel/xlsx, word/docx) to a report format; defaults to pdf."""
+    format_lower = format.lower()
+    if format_lower in ['excel', 'xlsx']:
+        return 'excel'
+    if format_lower in ['word', 'docx']:
+        return 'word'
+    return 'pdf'
+
+
+# Rendered reports stay in memory up to this size, then spill to a temp file
+REPORT_SPOOL_MAX_SIZE = 512 * 1024
+
+
+# zlib level for .xlsx members: 1 is roughly twice as fast but ~15% larger.
+# Reports are rendered once and served from the cache, so size wins by default.
+EXCEL_COMPRESSLEVEL = 6
+
+
+def _report_buffer() -> BinaryIO:
+    return tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_SIZE)
+
+
+def _save_workbook(wb: Workbook, buffer: BinaryIO, compresslevel: int) -> None:
+    """Workbook.save() with a chosen deflate level (openpyxl always uses the zlib default)."""
+    wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    archive = zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel)
+    ExcelWriter(wb, archive).save()
+
+
+def available_report_formats() -> List[str]:
+    """Report formats whose rendering libraries are installed in this process."""
+    formats = ['excel']
+    if HAS_REPORTLAB:
+        formats.append('pdf')
+    if HAS_DOCX:
+        formats.append('word')
+    return formats
+
+
+def render_report(analysis: TenderAnalysis, report_format: str) -> Tuple[BinaryIO, str, str]:
+    """
+    Render a report for an analysis loaded with its RFP sections and
+    templates, and store it in the report cache.
+
+    Returns:
+        (rendered file positioned at the start, filename, media type);
+        the caller closes the file
+    """
+    if _is_empty_analysis(analysis):
+        # Nothing extracted yet (e.g. still pending): the report is just the cover page
+        rfp_sections, templates = None, None
+    else:
+        rfp_sections = rfp_service.build_rfp_sections(analysis.rfp_sections)
+        templates = template_service.build_templates(analysis.document_templates, analysis.id)
+
+    if report_format == 'excel':
+        report_file, filename, media_type = generate_excel_report(analysis, rfp_sections, templates)
+    elif report_format == 'word':
+        report_file, filename, media_type = generate_word_report(analysis, rfp_sections, templates)
+    else:
+        report_file, filename, media_type = generate_pdf_report(analysis, rfp_sections, templates)
+
+    report_cache.store_report(
+        analysis.id, report_cache.report_version(analysis), report_format, report_file, filename
+    )
+    logger.info("Rendered %s report for analysis %s", report_format, analysis.id)
+    return report_file, filename, media_type
+
+
+# ============================================================================
+# SHARED STYLES
+# ============================================================================
+
+# openpyxl style objects are immutable and shared by the cells they are
+# assigned to, so one instance per style serves every report
+_XL_HEADER_FILL = PatternFill(start_color="1a56db", end_color="1a56db", fill_type="solid")
+_XL_SECTION_FILL = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
+_XL_HIGHLIGHT_FILL = PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")
+_XL_RISK_FILL = PatternFill(start_color="FFE0E0", end_color="FFE0E0", fill_type="solid")
+_XL_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+_XL_TITLE_FONT = Font(bold=True, size=16, color="1a56db")
+_XL_SUBHEADER_FONT = Font(bold=True, size=11)
+_XL_NORMAL_FONT = Font(size=10)
+_XL_BOLD_FONT = Font(bold=True)
+_XL_LABEL_FONT = Font(bold=True, size=10)
+_XL_SMALL_LABEL_FONT = Font(bold=True, size=9)
+_XL_HIGH_RISK_FONT = Font(bold=True, size=10, color="FF0000")
+_XL_LOW_RISK_FONT = Font(bold=True, size=10, color="00AA00")
+_XL_COMPLIANCE_FONT = Font(bold=True, size=10, color="FFA500")
+_XL_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_XL_WRAP = Alignment(wrap_text=True)
+_XL_WRAP_TOP = Alignment(wrap_text=True, vertical='top')
+_XL_CENTER = Alignment(horizontal='center')
+_XL_CENTER_WRAP = Alignment(horizontal='center', wrap_text=True)
+# NamedStyles bind to one workbook, so each report registers its own under this name
+_XL_TABLE_HEADER_STYLE = 'report_table_header'
+
+# Data sheet groups in report order: (heading, data_sheet_json key)
+_DATASHEET_KEYS = (
+    ('Project Information', 'project_information'),
+    ('Contract Details', 'contract_details'),
+    ('Financial Details', 'financial_details'),
+    ('Technical Summary', 'technical_summary'),
+    ('Important Dates', 'important_dates'),
+)
+
+
+def _iter_datasheet_sections(datasheet: Dict[str, Any]):
+    """Yield (heading, items) for each non-empty data sheet group."""
+    for name, key in _DATASHEET_KEYS:
+        items = datasheet.get(key)
+        if items:
+            yield name, items
+
+
+def _is_empty_analysis(analysis) -> bool:
+    """True when an analysis has none of the content a report is made of yet."""
+    return not (
+        analysis.one_pager_json
+        or analysis.scope_of_work_json
+        or analysis.data_sheet_json
+        or analysis.bid_synopsis_json
+        or analysis.rfp_sections
+        or analysis.document_templates
+    )
+
+
+def _report_filename(analysis, stamp_format: str, extension: str) -> str:
+    """
+    Download filename for a report, stamped with when the analysis completed
+    (or was last updated) rather than the render time, so re-rendering the
+    same analysis version yields the same name.
+    """
+    stamp = analysis.analysis_completed_at or analysis.updated_at or datetime.now()
+    return f"Tender_Analysis_{analysis.tender_id}_{stamp.strftime(stamp_format)}.{extension}"
+
+
+def _not_available_text(analysis) -> str:
+    """Cover-page notice for an analysis with no content yet."""
+    if analysis.status_message:
+        return f"Analysis not yet available: {analysis.status_message}"
+    return "Analysis not yet available."
+
+
+def _all_templates(templates) -> List[Any]:
+    """All document templates of a TemplatesResponse, in report order."""
+    return list(chain(
+        templates.bid_submission_forms or (),
+        templates.financial_formats or (),
+        templates.technical_documents or (),
+        templates.compliance_formats or (),
+    ))
+
+
+@lru_cache(maxsize=None)
+def _pdf_report_styles() -> Dict[str, Any]:
+    """
+    ReportLab paragraph and table styles for the PDF report, built on first
+    use and reused.
+    """
+
+    styles = getSampleStyleSheet()
+
+    def label_table_style(font_size, padding):
+        return TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), padding),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ])
+
+    return {
+        'base': styles,
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a56db'),
+            spaceAfter=30,
+            spaceBefore=0,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold',
+            leading=28
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#1a56db'),
+            spaceAfter=16,
+            spaceBefore=24,
+            fontName='Helvetica-Bold',
+            leading=20,
+            keepWithNext=True
+        ),
+        'subheading': ParagraphStyle(
+            'CustomSubHeading',
+            parent=styles['Heading3'],
+            fontSize=12,
+            textColor=colors.HexColor('#333333'),
+            spaceAfter=10,
+            spaceBefore=14,
+            fontName='Helvetica-Bold',
+            leading=16,
+            keepWithNext=True
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=10,
+            spaceAfter=8,
+            spaceBefore=0,
+            leading=14,
+            alignment=TA_JUSTIFY,
+            wordWrap='LTR'
+        ),
+        'details_table': label_table_style(10, 8),
+        'datasheet_table': label_table_style(9, 6),
+        'templates_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a56db')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]),
+    }
+
+
+def _esc(value) -> str:
+    """Escape analysis text for ReportLab's Paragraph markup parser (&, <, > break it)."""
+    return html.escape(str(value), quote=False)
+
+
+def _bullet_paragraph(items, style):
+    """
+    One Paragraph holding a whole bullet list, one item per line, so
+    ReportLab lays out a single flowable instead of one per bullet.
+    """
+    return Paragraph("<br/>".join(f"• {_esc(item)}" for item in items), style)
+
+
+# Longest text handed to a single Paragraph; longer blocks are cut at a space
+PARAGRAPH_MAX_CHARS = 8000
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
+def _text_paragraphs(text, style) -> List[Any]:
+    """
+    Escaped Paragraphs for a long free-text field, one per blank-line
+    separated block, so ReportLab never parses and wraps one huge flowable.
+    """
+    paragraphs = []
+    for block in _BLANK_LINES_RE.split(str(text)):
+        block = block.strip()
+        while len(block) > PARAGRAPH_MAX_CHARS:
+            cut = block.rfind(' ', 0, PARAGRAPH_MAX_CHARS)
+            if cut <= 0:
+                cut = PARAGRAPH_MAX_CHARS
+            paragraphs.append(Paragraph(_esc(block[:cut]), style))
+            block = block[cut:].lstrip()
+        if block:
+            paragraphs.append(Paragraph(_esc(block), style))
+    return paragraphs
+
+
+# ============================================================================
+# ANALYSIS REPORT GENERATION FUNCTIONS
+# ============================================================================
+
+def generate_pdf_report(analysis, rfp_sections, templates):
+    """Generate a comprehensive PDF report of the tender analysis"""
+    if not HAS_REPORTLAB:
+        raise RuntimeError("reportlab is not installed; PDF reports are unavailable")
+
+    buffer = _report_buffer()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        topMargin=_PDF_MARGIN,
+        bottomMargin=_PDF_MARGIN,
+        leftMargin=_PDF_MARGIN,
+        rightMargin=_PDF_MARGIN
+    )
+    pdf_styles = _pdf_report_styles()
+    styles = pdf_styles['base']
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
+    subheading_style = pdf_styles['subheading']
+    body_style = pdf_styles['body']
+    story = []
+    # Spacers only carry a size, so one instance is appended wherever that gap is needed
+    small_gap = Spacer(1, 0.1*inch)
+    section_gap = Spacer(1, 0.2*inch)
+
+    # Cover Page
+    story.append(Spacer(1, 2*inch))
+    story.append(Paragraph("TENDER ANALYSIS REPORT", title_style))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph(f"Tender ID: {_esc(analysis.tender_id)}", styles['Normal']))
+    story.append(section_gap)
+    if analysis.analysis_completed_at:
+        story.append(Paragraph(f"Analysis Date: {analysis.analysis_completed_at.strftime('%B %d, %Y')}", styles['Normal']))
+    story.append(section_gap)
+    story.append(Paragraph(f"Status: {analysis.status.value.upper()}", styles['Normal']))
+    if _is_empty_analysis(analysis):
+        story.append(section_gap)
+        story.append(Paragraph(_esc(_not_available_text(analysis)), styles['Normal']))
+    else:
+        story.append(PageBreak())
+    
+    # ONE PAGER
+    if analysis.one_pager_json:
+        story.append(Paragraph("1. EXECUTIVE SUMMARY (ONE PAGER)", heading_style))
+        one_pager = analysis.one_pager_json
+        
+        if one_pager.get('project_overview'):
+            story.append(Paragraph("<b>Project Overview:</b>", subheading_style))
+            story.extend(_text_paragraphs(one_pager['project_overview'], body_style))
+            story.append(section_gap)
+
+        if one_pager.get('financial_requirements'):
+            story.append(Paragraph("<b>Financial Requirements:</b>", subheading_style))
+            story.append(_bullet_paragraph(one_pager['financial_requirements'], body_style))
+            story.append(section_gap)
+
+        if one_pager.get('eligibility_highlights'):
+            story.append(Paragraph("<b>Eligibility Highlights:</b>", subheading_style))
+            story.append(_bullet_paragraph(one_pager['eligibility_highlights'], body_style))
+            story.append(section_gap)
+
+        if one_pager.get('important_dates'):
+            story.append(Paragraph("<b>Important Dates:</b>", subheading_style))
+            story.append(_bullet_paragraph(one_pager['important_dates'], body_style))
+            story.append(section_gap)
+
+        if one_pager.get('risk_analysis'):
+            risk = one_pager['risk_analysis']
+            story.append(Paragraph("<b>Risk Analysis:</b>", subheading_style))
+            if risk.get('summary'):
+                story.extend(_text_paragraphs(risk['summary'], body_style))
+        
+        story.append(PageBreak())
+    
+    # SCOPE OF WORK
+    if analysis.scope_of_work_json:
+        story.append(Paragraph("2. SCOPE OF WORK", heading_style))
+        scope = analysis.scope_of_work_json
+        
+        if scope.get('project_details'):
+            details = scope['project_details']
+            story.append(Paragraph("<b>Project Details:</b>", subheading_style))
+            details_data = []
+            if details.get('project_name'):
+                details_data.append(['Project Name', details['project_name']])
+            if details.get('location'):
+                details_data.append(['Location', details['location']])
+            if details.get('duration'):
+                details_data.append(['Duration', details['duration']])
+            if details.get('contract_value'):
+                details_data.append(['Contract Value', details['contract_value']])
+            
+            if details_data:
+                table = Table(details_data, colWidths=_PDF_DETAILS_COL_WIDTHS)
+                table.setStyle(pdf_styles['details_table'])
+                story.append(table)
+                story.append(section_gap)
+        
+        if scope.get('work_packages'):
+            story.append(Paragraph("<b>Work Packages:</b>", subheading_style))
+            for i, package in enumerate(scope['work_packages'], 1):
+                story.append(Paragraph(f"<b>{i}. {_esc(package.get('name', 'Work Package'))}</b>", body_style))
+                if package.get('description'):
+                    story.append(Paragraph(_esc(package['description']), body_style))
+                story.append(small_gap)
+        
+        story.append(PageBreak())
+    
+    # DATA SHEET
+    if analysis.data_sheet_json:
+        story.append(Paragraph("3. DATA SHEET", heading_style))
+        datasheet = analysis.data_sheet_json
+        
+        for section_name, items in _iter_datasheet_sections(datasheet):
+            story.append(Paragraph(f"<b>{section_name}:</b>", subheading_style))
+            data = [[item['label'], item['value']] for item in items]
+            if data:
+                table = Table(data, colWidths=_PDF_DATASHEET_COL_WIDTHS)
+                table.setStyle(pdf_styles['datasheet_table'])
+                story.append(table)
+                story.append(section_gap)
+        
+        story.append(PageBreak())
+    
+    # RFP SECTIONS
+    if rfp_sections and rfp_sections.sections:
+        story.append(Paragraph("4. RFP SECTIONS ANALYSIS", heading_style))
+        for section in rfp_sections.sections:
+            story.append(Paragraph(f"<b>{_esc(section.section_name)}: {_esc(section.section_title)}</b>", subheading_style))
+            if section.summary:
+                story.extend(_text_paragraphs(section.summary, body_style))
+
+            if section.key_requirements:
+                story.append(Paragraph("<b>Key Requirements:</b>", body_style))
+                story.append(_bullet_paragraph(section.key_requirements[:5], body_style))  # Limit to 5 for space
+
+            story.append(Spacer(1, 0.15*inch))
+
+        story.append(PageBreak())
+
+    # TEMPLATES
+    if templates:
+        story.append(Paragraph("5. REQUIRED TEMPLATES", heading_style))
+        all_templates = _all_templates(templates)
+
+        if all_templates:
+            story.append(Paragraph(f"<b>Total Templates: {len(all_templates)}</b>", body_style))
+            story.append(small_gap)
+
+            template_data = [['Template Name', 'Format', 'Mandatory']]
+            for template in all_templates:
+                template_data.append([
+                    template.name,
+                    template.format.upper(),
+                    'Yes' if template.mandatory else 'No'
+                ])
+
+            table = Table(template_data, colWidths=_PDF_TEMPLATES_COL_WIDTHS)
+            table.setStyle(pdf_styles['templates_table'])
+            story.append(table)
+
+    # Build PDF
+    doc.build(story)
+    buffer.seek(0)
+    
+    filename = _report_filename(analysis, '%Y%m%d', 'pdf')
+    return buffer, filename, "application/pdf"
+
+
+class _SheetWriter:
+    """
+    Row-by-row writer over a write-only worksheet. Cells for the current row
+    are placed by column letter and flushed in order by next_row(), so the
+    sheet is streamed out instead of held as a grid of Cell objects.
+    """
+
+    def __init__(self, wb, title, widths):
+        self.ws = wb.create_sheet(title)
+        # Column widths must be set before the first row is written
+        for col, width in widths.items():
+            self.ws.column_dimensions[col].width = width
+        self.row = 1
+        self._cells = {}
+
+    def set(self, col, value=None, font=None, fill=None, alignment=None, border=None, style=None):
+        cell = WriteOnlyCell(self.ws, value=value)
+        if style:
+            cell.style = style
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        if border:
+            cell.border = border
+        self._cells[column_index_from_string(col)] = cell
+
+    def merge(self, first_col, last_col):
+        self.ws.merged_cells.add(f"{first_col}{self.row}:{last_col}{self.row}")
+
+    def next_row(self, count=1):
+        """Write out the current row, plus count - 1 blank rows after it."""
+        if self._cells:
+            self.ws.append([self._cells.get(col) for col in range(1, max(self._cells) + 1)])
+        else:
+            self.ws.append([])
+        self._cells = {}
+        for _ in range(count - 1):
+            self.ws.append([])
+        self.row += count
+
+    def close(self):
+        if self._cells:
+            self.next_row()
+
+
+def generate_excel_report(analysis, rfp_sections, templates, compresslevel: int = EXCEL_COMPRESSLEVEL):
+    """
+    Generate a comprehensive Excel report of the tender analysis.
+    compresslevel is the zlib level (1-9) used for the .xlsx archive.
+    """
+    
+    # Write-only mode streams each sheet's rows out as they are added
+    wb = Workbook(write_only=True)
+    # Table header cells share one registered style instead of four per-cell attributes
+    wb.add_named_style(NamedStyle(
+        name=_XL_TABLE_HEADER_STYLE,
+        font=_XL_HEADER_FONT,
+        fill=_XL_HEADER_FILL,
+        alignment=_XL_CENTER,
+        border=_XL_THIN_BORDER,
+    ))
+    
+    # Header styles
+    title_font = _XL_TITLE_FONT
+    subheader_font = _XL_SUBHEADER_FONT
+    border = _XL_THIN_BORDER
+    
+    # SUMMARY SHEET
+    ws_summary = _SheetWriter(wb, "Summary", {'A': 20, 'B': 40})
+    ws_summary.set('A', "TENDER ANALYSIS REPORT", font=title_font)
+    ws_summary.merge('A', 'D')
+    ws_summary.next_row(2)
+    
+    ws_summary.set('A', "Tender ID:", font=subheader_font)
+    ws_summary.set('B', analysis.tender_id)
+    ws_summary.next_row()
+    
+    ws_summary.set('A', "Status:", font=subheader_font)
+    ws_summary.set('B', analysis.status.value)
+    ws_summary.next_row()
+    
+    if analysis.analysis_completed_at:
+        ws_summary.set('A', "Analysis Date:", font=subheader_font)
+        ws_summary.set('B', analysis.analysis_completed_at.strftime('%Y-%m-%d %H:%M'))
+        ws_summary.next_row()
+
+    if _is_empty_analysis(analysis):
+        ws_summary.next_row()
+        ws_summary.set('A', _not_available_text(analysis))
+        ws_summary.next_row()
+    ws_summary.close()
+    
+    # ONE PAGER SHEET - ENHANCED
+    if analysis.one_pager_json:
+        ws_one_pager = _SheetWriter(wb, "One Pager", {'A': 100, 'B': 20, 'C': 20})
+        one_pager = analysis.one_pager_json
+        
+        ws_one_pager.set('A', "EXECUTIVE SUMMARY", font=title_font)
+        ws_one_pager.merge('A', 'C')
+        ws_one_pager.next_row(2)
+        
+        # Project Overview
+        if one_pager.get('project_overview'):
+            ws_one_pager.set('A', "Project Overview", font=subheader_font)
+            ws_one_pager.next_row()
+            ws_one_pager.set('A', one_pager['project_overview'], alignment=_XL_WRAP)
+            ws_one_pager.merge('A', 'C')
+            ws_one_pager.next_row(2)
+        
+        # Eligibility Highlights
+        if one_pager.get('eligibility_highlights'):
+            ws_one_pager.set('A', "Eligibility Highlights", font=subheader_font)
+            ws_one_pager.next_row()
+            for highlight in one_pager['eligibility_highlights']:
+                ws_one_pager.set('A', f"• {highlight}", alignment=_XL_WRAP)
+                ws_one_pager.merge('A', 'C')
+                ws_one_pager.next_row()
+            ws_one_pager.next_row()
+        
+        # Important Dates
+        if one_pager.get('important_dates'):
+            ws_one_pager.set('A', "Important Dates", font=subheader_font)
+            ws_one_pager.next_row()
+            for date_info in one_pager['important_dates']:
+                ws_one_pager.set('A', f"• {date_info}")
+                ws_one_pager.next_row()
+            ws_one_pager.next_row()
+        
+        # Financial Requirements
+        if one_pager.get('financial_requirements'):
+            ws_one_pager.set('A', "Financial Requirements", font=subheader_font)
+            ws_one_pager.next_row()
+            for req in one_pager['financial_requirements']:
+                ws_one_pager.set('A', f"• {req}")
+                ws_one_pager.next_row()
+            ws_one_pager.next_row()
+        
+        # Risk Analysis
+        if one_pager.get('risk_analysis'):
+            risk = one_pager['risk_analysis']
+            ws_one_pager.set('A', "Risk Analysis", font=subheader_font)
+            ws_one_pager.next_row()
+            
+            if risk.get('summary'):
+                ws_one_pager.set('A', risk['summary'], alignment=_XL_WRAP)
+                ws_one_pager.merge('A', 'C')
+                ws_one_pager.next_row(2)
+            
+            for key, label, font in (
+                ('high_risk_factors', "High Risk Factors:", _XL_HIGH_RISK_FONT),
+                ('low_risk_areas', "Low Risk Areas:", _XL_LOW_RISK_FONT),
+                ('compliance_concerns', "Compliance Concerns:", _XL_COMPLIANCE_FONT),
+            ):
+                if risk.get(key):
+                    ws_one_pager.set('A', label, font=font)
+                    ws_one_pager.next_row()
+                    for entry in risk[key]:
+                        ws_one_pager.set('A', f"• {entry}")
+                        ws_one_pager.next_row()
+                    ws_one_pager.next_row()
+        ws_one_pager.close()
+    
+    # SCOPE OF WORK SHEET - NEW
+    if analysis.scope_of_work_json:
+        ws_scope = _SheetWriter(wb, "Scope of Work", {'A': 25, 'B': 40, 'C': 40, 'D': 20})
+        scope = analysis.scope_of_work_json
+        
+        ws_scope.set('A', "SCOPE OF WORK", font=title_font)
+        ws_scope.merge('A', 'D')
+        ws_scope.next_row(2)
+        
+        # Project Details
+        if scope.get('project_details'):
+            details = scope['project_details']
+            ws_scope.set('A', "Project Details", font=subheader_font, fill=_XL_SECTION_FILL)
+            ws_scope.merge('A', 'B')
+            ws_scope.next_row()
+            
+            for key, value in details.items():
+                if value:
+                    label = key.replace('_', ' ').title()
+                    ws_scope.set('A', label, border=border)
+                    ws_scope.set('B', str(value), border=border)
+                    ws_scope.next_row()
+            ws_scope.next_row()
+        
+        # Work Packages
+        if scope.get('work_packages'):
+            ws_scope.set('A', "Work Packages", font=subheader_font, fill=_XL_SECTION_FILL)
+            ws_scope.merge('A', 'D')
+            ws_scope.next_row()
+            
+            # Headers for work packages
+            for col, header in zip('ABCD', ['Package ID', 'Name', 'Description', 'Duration']):
+                ws_scope.set(col, header, style=_XL_TABLE_HEADER_STYLE)
+            ws_scope.next_row()
+            
+            for package in scope['work_packages']:
+                values = [
+                    package.get('id', ''),
+                    package.get('name', ''),
+                    package.get('description', ''),
+                    package.get('estimated_duration', ''),
+                ]
+                for col, value in zip('ABCD', values):
+                    ws_scope.set(col, value, border=border, alignment=_XL_WRAP)
+                ws_scope.next_row()
+                
+                # Components sub-table
+                if package.get('components'):
+                    ws_scope.set('B', "Components:", font=_XL_SMALL_LABEL_FONT)
+                    ws_scope.next_row()
+                    for component in package['components']:
+                        comp_text = f"• {component.get('item', '')}"
+                        if component.get('quantity') and component.get('unit'):
+                            comp_text += f" ({component['quantity']} {component['unit']})"
+                        ws_scope.set('B', comp_text, alignment=_XL_WRAP)
+                        ws_scope.merge('B', 'D')
+                        ws_scope.next_row()
+                ws_scope.next_row()
+            ws_scope.next_row()
+        
+        # Technical Specifications
+        if scope.get('technical_specifications'):
+            tech = scope['technical_specifications']
+            ws_scope.set('A', "Technical Specifications", font=subheader_font, fill=_XL_SECTION_FILL)
+            ws_scope.merge('A', 'D')
+            ws_scope.next_row()
+            
+            for key, label in (('standards', "Standards:"), ('quality_requirements', "Quality Requirements:")):
+                if tech.get(key):
+                    ws_scope.set('A', label, font=_XL_LABEL_FONT)
+                    ws_scope.next_row()
+                    for entry in tech[key]:
+                        ws_scope.set('A', f"• {entry}")
+                        ws_scope.merge('A', 'D')
+                        ws_scope.next_row()
+                    ws_scope.next_row()
+        
+        # Deliverables
+        if scope.get('deliverables'):
+            ws_scope.set('A', "Deliverables", font=subheader_font, fill=_XL_SECTION_FILL)
+            ws_scope.merge('A', 'C')
+            ws_scope.next_row()
+            
+            for col, header in zip('ABC', ['Item', 'Description', 'Timeline']):
+                ws_scope.set(col, header, style=_XL_TABLE_HEADER_STYLE)
+            ws_scope.next_row()
+            
+            for deliverable in scope['deliverables']:
+                ws_scope.set('A', deliverable.get('item', ''), border=border)
+                ws_scope.set('B', deliverable.get('description', ''), border=border)
+                ws_scope.set('C', deliverable.get('timeline', ''), border=border)
+                ws_scope.next_row()
+            ws_scope.next_row()
+        
+        # Exclusions
+        if scope.get('exclusions'):
+            ws_scope.set('A', "Exclusions", font=subheader_font, fill=_XL_RISK_FILL)
+            ws_scope.merge('A', 'D')
+            ws_scope.next_row()
+            for exclusion in scope['exclusions']:
+                ws_scope.set('A', f"• {exclusion}")
+                ws_scope.merge('A', 'D')
+                ws_scope.next_row()
+        ws_scope.close()
+    
+    # DATA SHEET - ENHANCED
+    if analysis.data_sheet_json:
+        ws_datasheet = _SheetWriter(wb, "Data Sheet", {'A': 35, 'B': 60})
+        datasheet = analysis.data_sheet_json
+        
+        ws_datasheet.set('A', "DATA SHEET", font=title_font)
+        ws_datasheet.merge('A', 'B')
+        ws_datasheet.next_row(2)
+        
+        for section_name, items in _iter_datasheet_sections(datasheet):
+            ws_datasheet.set('A', section_name, font=subheader_font, fill=_XL_SECTION_FILL)
+            ws_datasheet.merge('A', 'B')
+            ws_datasheet.next_row()
+            
+            for item in items:
+                # Highlight important items
+                highlight = item.get('highlight')
+                font = _XL_BOLD_FONT if highlight else None
+                ws_datasheet.set('A', item.get('label', ''), font=font, border=border)
+                ws_datasheet.set(
+                    'B', item.get('value', ''),
+                    font=font, fill=_XL_HIGHLIGHT_FILL if highlight else None, border=border,
+                )
+                ws_datasheet.next_row()
+            ws_datasheet.next_row()
+        ws_datasheet.close()
+
+    # RFP SECTIONS SHEET - NEW
+    if rfp_sections and rfp_sections.sections:
+        ws_rfp = _SheetWriter(wb, "RFP Sections", {'A': 12, 'B': 35, 'C': 45, 'D': 40, 'E': 40})
+        
+        ws_rfp.set('A', "RFP SECTION ANALYSIS", font=title_font)
+        ws_rfp.merge('A', 'E')
+        ws_rfp.next_row(2)
+        
+        # Headers
+        headers = ['Section #', 'Title', 'Summary', 'Key Requirements', 'Compliance Issues']
+        for col, header in zip('ABCDE', headers):
+            ws_rfp.set(col, header, style=_XL_TABLE_HEADER_STYLE, alignment=_XL_CENTER_WRAP)
+        ws_rfp.next_row()
+        
+        for section in rfp_sections.sections:
+            values = [
+                section.section_name or '',
+                section.section_title or '',
+                section.summary or '',
+                # Key requirements
+                '\n'.join(f"• {req}" for req in section.key_requirements) if section.key_requirements else None,
+                # Compliance issues
+                '\n'.join(f"• {issue}" for issue in section.compliance_issues) if section.compliance_issues else None,
+            ]
+            for col, value in zip('ABCDE', values):
+                ws_rfp.set(col, value, border=border, alignment=_XL_WRAP_TOP)
+            ws_rfp.next_row()
+        ws_rfp.close()
+    
+    # BID SYNOPSIS / QUALIFICATIONS SHEET - NEW
+    if analysis.bid_synopsis_json:
+        ws_bid = _SheetWriter(wb, "Qualifications", {'A': 40, 'B': 60, 'C': 30})
+        bid_synopsis = analysis.bid_synopsis_json
+        
+        ws_bid.set('A', "QUALIFICATION CRITERIA", font=title_font)
+        ws_bid.merge('A', 'C')
+        ws_bid.next_row(2)
+        
+        def write_pairs(pairs):
+            for key, value in pairs:
+                ws_bid.set('A', key.replace('_', ' ').title(), border=border)
+                ws_bid.set('B', str(value), border=border)
+                ws_bid.next_row()
+        
+        # Iterate through qualification categories
+        for category, criteria in bid_synopsis.items():
+            if criteria and isinstance(criteria, (list, dict)):
+                ws_bid.set('A', category.replace('_', ' ').title(), font=subheader_font, fill=_XL_SECTION_FILL)
+                ws_bid.merge('A', 'C')
+                ws_bid.next_row()
+                
+                if isinstance(criteria, list):
+                    for item in criteria:
+                        if isinstance(item, dict):
+                            write_pairs(item.items())
+                        else:
+                            ws_bid.set('A', f"• {item}")
+                            ws_bid.merge('A', 'C')
+                            ws_bid.next_row()
+                elif isinstance(criteria, dict):
+                    write_pairs(criteria.items())
+                ws_bid.next_row()
+        ws_bid.close()
+
+    # TEMPLATES SHEET - IMPROVED
+    if templates:
+        ws_templates = _SheetWriter(wb, "Document Templates", {'A': 45, 'B': 25, 'C': 12, 'D': 12, 'E': 60})
+
+        ws_templates.set('A', "REQUIRED DOCUMENT TEMPLATES", font=title_font)
+        ws_templates.merge('A', 'E')
+        ws_templates.next_row(2)
+
+        # Headers
+        headers = ['Template Name', 'Category', 'Format', 'Mandatory', 'Description']
+        for col, header in zip('ABCDE', headers):
+            ws_templates.set(col, header, style=_XL_TABLE_HEADER_STYLE)
+        ws_templates.next_row()
+
+        # Data from templates object
+        categories = [
+            ('Bid Submission Forms', templates.bid_submission_forms or ()),
+            ('Financial Formats', templates.financial_formats or ()),
+            ('Technical Documents', templates.technical_documents or ()),
+            ('Compliance Formats', templates.compliance_formats or ())
+        ]
+
+        for category_name, items in categories:
+            for template in items:
+                values = [
+                    template.name,
+                    category_name,
+                    template.format.upper() if template.format else 'N/A',
+                    'Yes' if template.mandatory else 'No',
+                    template.description or '',
+                ]
+                for col, value in zip('ABCDE', values):
+                    # Highlight mandatory templates
+                    fill = _XL_HIGHLIGHT_FILL if col == 'D' and template.mandatory else None
+                    ws_templates.set(col, value, fill=fill, border=border, alignment=_XL_WRAP_TOP)
+                ws_templates.next_row()
+        ws_templates.close()
+
+    buffer = _report_buffer()
+    _save_workbook(wb, buffer, compresslevel)
+    buffer.seek(0)
+    
+    filename = _report_filename(analysis, '%Y%m%d_%H%M%S', 'xlsx')
+    return buffer, filename, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def generate_word_report(analysis, rfp_sections, templates):
+    """Generate a comprehensive Word report of the tender analysis"""
+    if not HAS_DOCX:
+        raise RuntimeError("python-docx is not installed; Word reports are unavailable")
+    
+    doc = Document()
+    
+    # Title Page
+    title = doc.add_heading('TENDER ANALYSIS REPORT', level=0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_run = title.runs[0]
+    title_run.font.size = Pt(28)
+    title_run.font.color.rgb = RGBColor(26, 86, 219)
+    
+    doc.add_paragraph()
+    doc.add_paragraph()
+    
+    info_para = doc.add_paragraph()
+    info_para.add_run(f"Tender ID: {analysis.tender_id}\n").bold = True
+    info_para.add_run(f"Status: {analysis.status.value}\n")
+    if analysis.analysis_completed_at:
+        info_para.add_run(f"Analysis Date: {analysis.analysis_completed_at.strftime('%B %d, %Y')}")
+    info_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    if _is_empty_analysis(analysis):
+        doc.add_paragraph(_not_available_text(analysis)).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    else:
+        doc.add_page_break()
+    
+    # ONE PAGER
+    if analysis.one_pager_json:
+        doc.add_heading('1. EXECUTIVE SUMMARY (ONE PAGER)', level=1)
+        one_pager = analysis.one_pager_json
+        
+        if one_pager.get('project_overview'):
+            doc.add_heading('Project Overview', level=2)
+            doc.add_paragraph(one_pager['project_overview'])
+        
+        if one_pager.get('financial_requirements'):
+            doc.add_heading('Financial Requirements', level=2)
+            for req in one_pager['financial_requirements']:
+                doc.add_paragraph(req, style='List Bullet')
+        
+        if one_pager.get('eligibility_highlights'):
+            doc.add_heading('Eligibility Highlights', level=2)
+            for highlight in one_pager['eligibility_highlights']:
+                doc.add_paragraph(highlight, style='List Bullet')
+        
+        if one_pager.get('important_dates'):
+            doc.add_heading('Important Dates', level=2)
+            for date in one_pager['important_dates']:
+                doc.add_paragraph(date, style='List Bullet')
+        
+        if one_pager.get('risk_analysis'):
+            risk = one_pager['risk_analysis']
+            doc.add_heading('Risk Analysis', level=2)
+            if risk.get('summary'):
+                doc.add_paragraph(risk['summary'])
+        
+        doc.add_page_break()
+    
+    # SCOPE OF WORK
+    if analysis.scope_of_work_json:
+        doc.add_heading('2. SCOPE OF WORK', level=1)
+        scope = analysis.scope_of_work_json
+        
+        if scope.get('project_details'):
+            details = scope['project_details']
+            doc.add_heading('Project Details', level=2)
+            
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Light Grid Accent 1'
+            
+            if details.get('project_name'):
+                row = table.add_row()
+                row.cells[0].text = 'Project Name'
+                row.cells[1].text = details['project_name']
+            if details.get('location'):
+                row = table.add_row()
+                row.cells[0].text = 'Location'
+                row.cells[1].text = details['location']
+            if details.get('duration'):
+                row = table.add_row()
+                row.cells[0].text = 'Duration'
+                row.cells[1].text = details['duration']
+            if details.get('contract_value'):
+                row = table.add_row()
+                row.cells[0].text = 'Contract Value'
+                row.cells[1].text = details['contract_value']
+        
+        if scope.get('work_packages'):
+            doc.add_heading('Work Packages', level=2)
+            for i, package in enumerate(scope['work_packages'], 1):
+                doc.add_heading(f"{i}. {package.get('name', 'Work Package')}", level=3)
+                if package.get('description'):
+                    doc.add_paragraph(package['description'])
+        
+        doc.add_page_break()
+    
+    # DATA SHEET
+    if analysis.data_sheet_json:
+        doc.add_heading('3. DATA SHEET', level=1)
+        datasheet = analysis.data_sheet_json
+        
+        for section_name, items in _iter_datasheet_sections(datasheet):
+            doc.add_heading(section_name, level=2)
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Light Grid Accent 1'
+            
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = 'Field'
+            hdr_cells[1].text = 'Value'
+            
+            for item in items:
+                row = table.add_row()
+                row.cells[0].text = item['label']
+                row.cells[1].text = item['value']
+        
+        doc.add_page_break()
+    
+    # RFP SECTIONS
+    if rfp_sections and rfp_sections.sections:
+        doc.add_heading('4. RFP SECTIONS ANALYSIS', level=1)
+        for section in rfp_sections.sections:
+            doc.add_heading(f"{section.section_name}: {section.section_title}", level=2)
+            if section.summary:
+                doc.add_paragraph(section.summary)
+            
+            if section.key_requirements:
+                doc.add_heading('Key Requirements', level=3)
+                for req in section.key_requirements[:10]:
+                    doc.add_paragraph(req, style='List Bullet')
+        
+        doc.add_page_break()
+
+    # TEMPLATES
+    if templates:
+        doc.add_heading('5. REQUIRED TEMPLATES', level=1)
+        all_templates = _all_templates(templates)
+
+        if all_templates:
+            doc.add_paragraph(f"Total Templates: {len(all_templates)}")
+
+            table = doc.add_table(rows=1, cols=3)
+            table.style = 'Light Grid Accent 1'
+
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = 'Template Name'
+            hdr_cells[1].text = 'Format'
+            hdr_cells[2].text = 'Mandatory'
+
+            for template in all_templates:
+                row = table.add_row()
+                row.cells[0].text = template.name
+                row.cells[1].text = template.format.upper()
+                row.cells[2].text = 'Yes' if template.mandatory else 'No'
+
+    buffer = _report_buffer()
+    doc.save(buffer)
+    buffer.seek(0)
+
+    filename = _report_filename(analysis, '%Y%m%d', 'docx')
+    return buffer, filename, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
@@ -1,7 +1,9 @@
 import json
+from typing import List
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from app.modules.analyze.db.schema import AnalysisRFPSection
 from app.modules.analyze.models.pydantic_models import (
     RFPSectionSchema,
     RFPSectionsResponseSchema,
@@ -11,8 +13,11 @@ from app.modules.analyze.repositories import repository as analyze_repo
 
 
 def get_rfp_sections(db: Session, analysis_id: UUID) -> RFPSectionsResponseSchema:
-    analysis_rfp_sections = analyze_repo.get_rfp_sections(db, analysis_id)
+    return build_rfp_sections(analyze_repo.get_rfp_sections(db, analysis_id))
 
+
+def build_rfp_sections(analysis_rfp_sections: List[AnalysisRFPSection]) -> RFPSectionsResponseSchema:
+    """Build the RFP sections response from already-loaded section rows."""
     total_requirements = sum(
         len(section.compliance_issues or []) for section in analysis_rfp_sections
     )
@@ -1,8 +1,10 @@
 """Service for fetching and transforming document templates."""
 import logging
+from typing import List
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from app.modules.analyze.db.schema import AnalysisDocumentTemplate
 from app.modules.analyze.models.pydantic_models import DocumentTemplateSchema, TemplatesResponseSchema
 from app.modules.analyze.repositories import repository as analyze_repo
 
@@ -51,10 +53,21 @@ def get_templates(db: Session, analysis_id: UUID) -> TemplatesResponseSchema:
     Returns:
         TemplatesResponseSchema with templates grouped by category
     """
-    try:
-        # Fetch all templates from database
-        templates = analyze_repo.get_document_templates(db, analysis_id)
+    return build_templates(analyze_repo.get_document_templates(db, analysis_id), analysis_id)
+
+
+def build_templates(templates: List[AnalysisDocumentTemplate], analysis_id: UUID) -> TemplatesResponseSchema:
+    """
+    Group already-loaded document templates by category.
+
+    Args:
+        templates: Template rows for the analysis
+        analysis_id: UUID of the tender analysis (for logging)
 
+    Returns:
+        TemplatesResponseSchema with templates grouped by category
+    """
+    try:
         # Initialize categorized lists
         categorized = {
             'bid_submission_forms': [],
@@ -0,0 +1,51 @@
+"""
+Redis cache for the structured LLM analyses of a tender.
+
+The executive summary, scope of work and data sheet are each one Gemini
+call on the tender context. Re-analysing a tender whose documents have not
+changed (e.g. a re-trigger after a later step failed) rebuilds the exact
+same context, so each result is cached under a hash of that context and
+reused instead of calling the LLM again. Only validated results are stored.
+Redis errors are logged and treated as a cache miss.
+"""
+import hashlib
+import json
+import logging
+from typing import Optional
+
+import redis
+
+from app.db.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Bump when a prompt or output schema changes so stale results are not reused
+LLM_CACHE_PREFIX = "analysis-llm:v1:"
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+
+def context_digest(context: str) -> str:
+    """Stable key for a tender context."""
+    return hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+
+def _key(step: str, digest: str) -> str:
+    return f"{LLM_CACHE_PREFIX}{step}:{digest}"
+
+
+def get_cached_result(step: str, digest: str) -> Optional[dict]:
+    """Return the cached result of an analysis step, or None on miss."""
+    try:
+        payload = get_redis_client().get(_key(step, digest))
+    except redis.RedisError as e:
+        logger.warning("LLM result cache read failed for %s: %s", step, e)
+        return None
+    return json.loads(payload) if payload else None
+
+
+def cache_result(step: str, digest: str, result: dict) -> None:
+    """Store the validated result of an analysis step."""
+    try:
+        get_redis_client().setex(_key(step, digest), LLM_CACHE_TTL_SECONDS, json.dumps(result))
+    except redis.RedisError as e:
+        logger.warning("LLM result cache write failed for %s: %s", step, e)
@@ -0,0 +1,69 @@
+"""
+On-disk cache for rendered analysis reports (PDF / Excel / Word).
+
+A report only changes when its analysis row does, so rendered files are
+stored per (analysis id, analysis updated_at, format) and served again
+until the analysis is updated. Older versions for the same analysis and
+format are removed when a newer one is written.
+"""
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_DIR: Path = settings.DATA_DIR / "report_cache"
+
+REPORT_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "word": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def report_version(analysis) -> str:
+    """Version tag for an analysis: changes whenever the analysis row is updated."""
+    updated_at = analysis.updated_at or analysis.created_at
+    return str(int(updated_at.timestamp() * 1_000_000)) if updated_at else "0"
+
+
+def _entry_dir(analysis_id, version: str, fmt: str) -> Path:
+    return REPORT_CACHE_DIR / str(analysis_id) / f"{fmt}-{version}"
+
+
+def get_cached_report(analysis_id, version: str, fmt: str) -> Optional[Tuple[Path, str]]:
+    """Return (path, filename) of the cached report, or None on miss."""
+    entry = _entry_dir(analysis_id, version, fmt)
+    try:
+        path = next(entry.iterdir(), None)
+    except FileNotFoundError:
+        return None
+    return (path, path.name) if path else None
+
+
+def store_report(analysis_id, version: str, fmt: str, source: BinaryIO, filename: str) -> None:
+    """
+    Copy a rendered report file into the cache and drop older versions of
+    it; `source` is rewound afterwards. Failures are logged, not raised.
+    """
+    entry = _entry_dir(analysis_id, version, fmt)
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a concurrent reader never sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(source, f)
+        os.replace(tmp_path, entry / filename.replace(os.sep, "_"))
+
+        for old in entry.parent.glob(f"{fmt}-*"):
+            if old != entry:
+                shutil.rmtree(old, ignore_errors=True)
+    except OSError as e:
+        logger.warning("Could not cache %s report for analysis %s: %s", fmt, analysis_id, e)
+    finally:
+        source.seek(0)
@@ -0,0 +1,75 @@
+"""
+Celery tasks for the Analyze module.
+
+Tender analysis downloads documents, embeds and uploads every chunk and runs
+several LLM passes; it runs here so the trigger endpoint can return as soon
+as the job is queued. Progress is written to the TenderAnalysis row and read
+back through GET /analyze/{tender_id}.
+
+Report rendering (ReportLab / openpyxl / python-docx) is CPU-bound and also
+runs here; the rendered file lands in the report cache and is streamed by
+the download endpoint. Every format is rendered as soon as an analysis
+completes, so downloads normally find the file already there.
+"""
+
+import logging
+from uuid import UUID
+
+from app.celery_app import celery_app
+from app.db.database import SessionLocal
+from app.modules.analyze.db.schema import AnalysisStatusEnum, TenderAnalysis
+from app.modules.analyze.repositories import repository as analyze_repo
+from app.modules.analyze.services.analysis_report_service import available_report_formats, render_report
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="analyze_tender")
+def analyze_tender_task(tender_ref: str):
+    """
+    Run the full analysis pipeline for one tender, then queue rendering of
+    its reports.
+
+    analyze_tender records its own failures on the TenderAnalysis row, so the
+    task is not retried.
+    """
+    # Imported here, not at module level: analyze_tender pulls in
+    # app.core.services, which connects Weaviate and configures Gemini (gRPC)
+    # at import time, and this module is loaded in the worker parent before
+    # the pool forks
+    from app.modules.analyze.scripts.analyze_tender import analyze_tender
+
+    db = SessionLocal()
+    try:
+        logger.info("Starting analysis task for tender %s", tender_ref)
+        analyze_tender(db, tender_ref)
+
+        analysis = db.query(TenderAnalysis.id, TenderAnalysis.status).filter(
+            TenderAnalysis.tender_id == tender_ref
+        ).first()
+        if analysis and analysis.status == AnalysisStatusEnum.completed:
+            # One task per format so workers render them in parallel
+            for report_format in available_report_formats():
+                build_analysis_report_task.delay(str(analysis.id), report_format, tender_ref)
+    finally:
+        db.close()
+
+
+@celery_app.task(name="build_analysis_report")
+def build_analysis_report_task(analysis_id: str, report_format: str, tender_id: str):
+    """
+    Render one analysis report into the report cache.
+
+    Returns the identifiers the status endpoint needs to point the client at
+    the download URL.
+    """
+    db = SessionLocal()
+    try:
+        analysis = analyze_repo.get_by_analysis_id(db, UUID(analysis_id))
+        if analysis is None:
+            raise ValueError(f"Analysis {analysis_id} not found")
+        report_file, filename, _ = render_report(analysis, report_format)
+        report_file.close()
+        return {"tender_id": tender_id, "format": report_format, "filename": filename}
+    finally:
+        db.close()
@@ -7,12 +7,19 @@ import traceback
 import time
 from pathlib import Path
 from enum import Enum
+import functools
 import logging
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
+# Pages OCR'd at once by the Tesseract fallback. pytesseract runs the tesseract
+# binary as a subprocess, so threads give real parallelism here.
+OCR_WORKERS = min(4, os.cpu_count() or 1)
+
 # PDF Processing
 try:
     from llama_parse import LlamaParse, ResultType
@@ -40,10 +47,38 @@ try:
 except ImportError:
     HAS_HTML_LIBS = False
 
+# lxml (libxml2) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # Import from your app
 from app.config import settings
 from app.core.global_stores import upload_jobs
 from app.modules.askai.models.document import ProcessingStage
+from app.core.ai_models import TOKENIZER_ENCODING
+
+# Break on paragraphs, then lines, then sentences before falling back to words
+CHUNK_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+
+@functools.cache
+def _get_text_splitter():
+    """Token-aware splitter sized by settings.CHUNK_SIZE / CHUNK_OVERLAP (tokens)."""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name=TOKENIZER_ENCODING,
+        chunk_size=settings.CHUNK_SIZE,
+        chunk_overlap=settings.CHUNK_OVERLAP,
+        separators=CHUNK_SEPARATORS,
+    )
+
+
+def split_text(text: str) -> List[str]:
+    """Split text into overlapping chunks of at most CHUNK_SIZE tokens."""
+    return _get_text_splitter().split_text(text)
 
 
 # ============================================================================
@@ -106,44 +141,29 @@ class PDFProcessor:
             upload_jobs[self.job_id].progress = progress
     
     def create_smart_chunks(self, text: str, curr_page_no: int, no_of_pages: int, metadata: Dict) -> List[Dict]:
-        """Create overlapping chunks with metadata"""
-        words = text.split()
-        chunks = []
-        no_of_words = len(words)
-        
-        if len(words) <= settings.CHUNK_SIZE:
+        """Create overlapping token-sized chunks with metadata"""
+        pieces = split_text(text)
+        if len(pieces) <= 1:
             return [{
                 "content": text,
                 "metadata": self._clean_metadata(metadata),
-                "word_count": len(words)
+                "word_count": len(text.split())
             }]
         
-        chunk_index = 0
-        start = 0
-        
-        while start < len(words):
+        chunks = []
+        for chunk_index, chunk_text in enumerate(pieces):
             progress_from_previous_pages = (curr_page_no - 1) / no_of_pages
-            progress_on_current_page = (start / no_of_words) * (1 / no_of_pages)
+            progress_on_current_page = (chunk_index / len(pieces)) * (1 / no_of_pages)
             self.update_progress(ProcessingStage.CREATING_CHUNKS, (progress_from_previous_pages + progress_on_current_page) * 100)
             
-            end = min(start + settings.CHUNK_SIZE, len(words))
-            chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
-            
             chunk_meta = metadata.copy()
             chunk_meta["chunk_index"] = chunk_index
             
             chunks.append({
                 "content": chunk_text,
                 "metadata": self._clean_metadata(chunk_meta),
-                "word_count": len(chunk_words)
+                "word_count": len(chunk_text.split())
             })
-            
-            chunk_index += 1
-            start = end - settings.CHUNK_OVERLAP
-            
-            if start >= len(words) - settings.CHUNK_OVERLAP:
-                break
         
         return chunks
     
@@ -202,20 +222,36 @@ class PDFProcessor:
         return page_texts
     
     def extract_with_tesseract(self, pdf_path: str) -> Dict[int, str]:
-        """Final fallback OCR using Tesseract"""
+        """
+        Final fallback OCR using Tesseract. Pages are rendered one at a time
+        (a fitz Document is not thread-safe) and OCR'd on OCR_WORKERS threads,
+        with at most two pages per worker rendered ahead to bound memory.
+        """
         page_texts = {}
         try:
             print(f"🔎 Tesseract OCR processing...")
             self.update_progress(ProcessingStage.TESSERACT_LOADING, 0)
             doc = fitz.open(pdf_path)
             no_of_pages = doc.page_count
-            for i, page in enumerate(doc):
-                self.update_progress(ProcessingStage.EXTRACTING_CONTENT, (i / no_of_pages) * 100)
-                pix = page.get_pixmap(dpi=200)
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                text = pytesseract.image_to_string(img)
+            pending = deque()
+
+            def collect_oldest():
+                page_num, future = pending.popleft()
+                self.update_progress(ProcessingStage.EXTRACTING_CONTENT, (page_num / no_of_pages) * 100)
+                text = future.result()
                 if text and text.strip():
-                    page_texts[i + 1] = self.clean_text(text)
+                    page_texts[page_num] = self.clean_text(text)
+
+            with ThreadPoolExecutor(max_workers=OCR_WORKERS) as executor:
+                for i, page in enumerate(doc):
+                    pix = page.get_pixmap(dpi=200)
+                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                    pending.append((i + 1, executor.submit(pytesseract.image_to_string, img)))
+                    if len(pending) >= OCR_WORKERS * 2:
+                        collect_oldest()
+                while pending:
+                    collect_oldest()
+            doc.close()
             print(f"✅ Tesseract OCR extracted {len(page_texts)} pages.")
         except Exception as e:
             print(f"❌ Tesseract OCR error: {e}")
@@ -347,28 +383,20 @@ class ExcelProcessor:
             upload_jobs[self.job_id].progress = progress
     
     def create_smart_chunks(self, text: str, curr_sheet_idx: int, no_of_sheets: int, metadata: Dict) -> List[Dict]:
-        """Create overlapping chunks with metadata"""
-        words = text.split()
-        chunks = []
-        no_of_words = len(words)
-        
-        if len(words) <= settings.CHUNK_SIZE:
+        """Create overlapping token-sized chunks with metadata"""
+        pieces = split_text(text)
+        if len(pieces) <= 1:
             return [{
                 "content": text,
                 "metadata": self._clean_metadata(metadata),
-                "word_count": len(words)
+                "word_count": len(text.split())
             }]
         
-        chunk_index = 0
-        start = 0
-        
-        while start < len(words):
+        chunks = []
+        for chunk_index, chunk_text in enumerate(pieces):
             progress_from_previous_sheets = curr_sheet_idx / no_of_sheets if no_of_sheets > 0 else 0
-            progress_on_current_sheet = (start / no_of_words) * (1 / no_of_sheets) if no_of_sheets > 0 else 0
+            progress_on_current_sheet = (chunk_index / len(pieces)) * (1 / no_of_sheets) if no_of_sheets > 0 else 0
             self.update_progress(ProcessingStage.CREATING_CHUNKS, (progress_from_previous_sheets + progress_on_current_sheet) * 100)
-            end = min(start + settings.CHUNK_SIZE, len(words))
-            chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
             
             chunk_meta = metadata.copy()
             chunk_meta["chunk_index"] = chunk_index
@@ -376,14 +404,8 @@ class ExcelProcessor:
             chunks.append({
                 "content": chunk_text,
                 "metadata": self._clean_metadata(chunk_meta),
-                "word_count": len(chunk_words)
+                "word_count": len(chunk_text.split())
             })
-            
-            chunk_index += 1
-            start = end - settings.CHUNK_OVERLAP
-            
-            if start >= len(words) - settings.CHUNK_OVERLAP:
-                break
         
         return chunks
     
@@ -825,45 +847,29 @@ class HTMLProcessor:
         return self.clean_text(text)
     
     def create_smart_chunks(self, text: str, curr_section_idx: int, no_of_sections: int, metadata: Dict) -> List[Dict]:
-        """Create overlapping chunks with metadata"""
-        words = text.split()
-        chunks = []
-        
-        no_of_words = len(words)
-        
-        if len(words) <= settings.CHUNK_SIZE:
+        """Create overlapping token-sized chunks with metadata"""
+        pieces = split_text(text)
+        if len(pieces) <= 1:
             return [{
                 "content": text,
                 "metadata": self._clean_metadata(metadata),
-                "word_count": len(words)
+                "word_count": len(text.split())
             }]
         
-        chunk_index = 0
-        start = 0
-        
-        while start < len(words):
+        chunks = []
+        for chunk_index, chunk_text in enumerate(pieces):
             progress_from_previous = curr_section_idx / no_of_sections if no_of_sections > 0 else 0
-            progress_on_current = (start / no_of_words) * (1 / no_of_sections) if no_of_sections > 0 else 0
+            progress_on_current = (chunk_index / len(pieces)) * (1 / no_of_sections) if no_of_sections > 0 else 0
             self.update_progress(ProcessingStage.CREATING_CHUNKS, (progress_from_previous + progress_on_current) * 100)
             
-            end = min(start + settings.CHUNK_SIZE, len(words))
-            chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
-            
             chunk_meta = metadata.copy()
             chunk_meta["chunk_index"] = chunk_index
             
             chunks.append({
                 "content": chunk_text,
                 "metadata": self._clean_metadata(chunk_meta),
-                "word_count": len(chunk_words)
+                "word_count": len(chunk_text.split())
             })
-            
-            chunk_index += 1
-            start = end - settings.CHUNK_OVERLAP
-            
-            if start >= len(words) - settings.CHUNK_OVERLAP:
-                break
         
         return chunks
     
@@ -880,7 +886,7 @@ class HTMLProcessor:
                 with open(html_path, 'r', encoding='iso-8859-1') as f:
                     content = f.read()
         
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
         return soup, content
     
     def process_html(self, job_id: str, html_path: str, doc_id: str, filename: str) -> Tuple[List[Dict], Dict]:
@@ -7,7 +7,7 @@ This module provides a WeaviateRetriever that wraps the existing
 Weaviate vector store and exposes it through LangChain's retriever interface.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from uuid import UUID
 
 from pydantic import ConfigDict
@@ -70,38 +70,7 @@ class WeaviateRetriever(BaseRetriever):
                 query,
                 n_results=self.top_k
             )
-
-            if not results:
-                print(f"📭 No documents found for query: {query}")
-                return []
-
-            # Convert results to LangChain Document objects
-            documents = []
-            for idx, (doc_content, metadata, score) in enumerate(results):
-                # Parse metadata from Weaviate
-                source = metadata.get("source", "Unknown")
-                page = metadata.get("page", "0")
-                doc_id = metadata.get("doc_id", "unknown")
-                doc_type = metadata.get("doc_type", "unknown")
-                content_type = metadata.get("type", "text")
-
-                # Create Document with preserved metadata
-                document = Document(
-                    page_content=doc_content,
-                    metadata={
-                        "source": source,
-                        "page": page,
-                        "doc_id": doc_id,
-                        "doc_type": doc_type,
-                        "content_type": content_type,
-                        "relevance_score": float(score),
-                        "result_index": idx + 1,  # 1-indexed for prompts
-                    }
-                )
-                documents.append(document)
-
-            print(f"✅ Retrieved {len(documents)} documents for query: {query}")
-            return documents
+            return self._to_documents(results, query)
 
         except Exception as e:
             print(f"❌ Error retrieving documents: {e}")
@@ -117,7 +86,8 @@ class WeaviateRetriever(BaseRetriever):
         """
         Async retrieval from Weaviate.
 
-        Currently delegates to sync implementation.
+        Embedding and the Weaviate query run off the event loop via
+        VectorStoreManager.aquery.
 
         Args:
             query: The query string
@@ -127,9 +97,55 @@ class WeaviateRetriever(BaseRetriever):
         Returns:
             List of LangChain Document objects
         """
-        # For now, use sync implementation
-        # TODO: Implement true async Weaviate queries in Phase 3
-        return self._get_relevant_documents(query, run_manager=run_manager, **kwargs)
+        if not self.vector_store or not self.collection:
+            print("⚠️  Vector store or collection not initialized")
+            return []
+
+        try:
+            results = await self.vector_store.aquery(
+                self.collection,
+                query,
+                n_results=self.top_k
+            )
+            return self._to_documents(results, query)
+
+        except Exception as e:
+            print(f"❌ Error retrieving documents: {e}")
+            return []
+
+    @staticmethod
+    def _to_documents(results: List[Tuple], query: str) -> List[Document]:
+        """Convert VectorStoreManager results to LangChain Document objects."""
+        if not results:
+            print(f"📭 No documents found for query: {query}")
+            return []
+
+        documents = []
+        for idx, (doc_content, metadata, score) in enumerate(results):
+            # Parse metadata from Weaviate
+            source = metadata.get("source", "Unknown")
+            page = metadata.get("page", "0")
+            doc_id = metadata.get("doc_id", "unknown")
+            doc_type = metadata.get("doc_type", "unknown")
+            content_type = metadata.get("type", "text")
+
+            # Create Document with preserved metadata
+            document = Document(
+                page_content=doc_content,
+                metadata={
+                    "source": source,
+                    "page": page,
+                    "doc_id": doc_id,
+                    "doc_type": doc_type,
+                    "content_type": content_type,
+                    "relevance_score": float(score),
+                    "result_index": idx + 1,  # 1-indexed for prompts
+                }
+            )
+            documents.append(document)
+
+        print(f"✅ Retrieved {len(documents)} documents for query: {query}")
+        return documents
 
     def get_retriever_info(self) -> Dict[str, Any]:
         """
@@ -1,10 +1,14 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 from typing import Optional
 from uuid import UUID
 
 from app.modules.tenderiq.db.schema import Tender
 from app.modules.scraper.db.schema import ScrapedTender
+from app.modules.bidsynopsis.db.schema import BidSynopsisKind, BidSynopsisValue
+
+# PostgreSQL sees no gain from multi-row INSERT batches beyond ~1000 rows
+BULK_INSERT_BATCH_SIZE = 1000
 
 
 class BidSynopsisRepository:
@@ -78,4 +82,60 @@ class BidSynopsisRepository:
             )
             .filter(ScrapedTender.tender_id_str == tender_id_str)
             .first()
-        )
\ No newline at end of file
+        )
+
+    def get_synopsis_values(self, tender_id: str) -> list[BidSynopsisValue]:
+        """
+        Get all saved bid synopsis edits for a tender, across every kind,
+        in a single query.
+        """
+        return (
+            self.db.query(BidSynopsisValue)
+            .filter(BidSynopsisValue.tender_id == tender_id)
+            .order_by(BidSynopsisValue.kind, BidSynopsisValue.ord)
+            .all()
+        )
+
+    def upsert_synopsis_values(
+        self,
+        kind: BidSynopsisKind,
+        tender_id: str,
+        user_id: Optional[UUID],
+        values: dict[int, str],
+    ) -> None:
+        """
+        Upsert position -> value pairs of one kind for a tender.
+
+        Existing rows are fetched in a single query and updated in place;
+        new rows are written with batched multi-row INSERTs instead of one
+        ``db.add`` + SELECT per item. The caller owns the commit.
+        """
+        if not values:
+            return
+
+        existing = {
+            row.ord: row
+            for row in self.db.query(BidSynopsisValue).filter(
+                BidSynopsisValue.tender_id == tender_id,
+                BidSynopsisValue.kind == kind,
+                BidSynopsisValue.ord.in_(list(values.keys()))
+            )
+        }
+
+        new_rows = []
+        for index, value in values.items():
+            row = existing.get(index)
+            if row is not None:
+                row.value = value
+                row.user_id = user_id
+            else:
+                new_rows.append({
+                    'kind': kind,
+                    'tender_id': tender_id,
+                    'user_id': user_id,
+                    'ord': index,
+                    'value': value,
+                })
+
+        for start in range(0, len(new_rows), BULK_INSERT_BATCH_SIZE):
+            self.db.execute(insert(BidSynopsisValue), new_rows[start:start + BULK_INSERT_BATCH_SIZE])
@@ -1,115 +1,57 @@
-import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Integer
+import enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Index, Enum, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.database import Base
 
 
-class BidSynopsisRequirement(Base):
-    """
-    Stores edited requirement data for bid synopsis.
-    Allows users to customize requirement text for each tender.
-    """
-    __tablename__ = 'bid_synopsis_requirements'
-
-    # Primary Keys
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tender_id = Column(String, nullable=False, index=True)  # tender_ref_number
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True, index=True)
-
-    # Requirement Index (position in the requirements array)
-    requirement_index = Column(Integer, nullable=False)
-
-    # Original and edited values
-    original_requirement = Column(Text, nullable=True)  # Original requirement text
-    edited_requirement = Column(Text, nullable=False)   # User-edited requirement text
-
-    # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
-                       onupdate=lambda: datetime.now(timezone.utc), nullable=False)
-
-    def to_dict(self):
-        """Convert SQLAlchemy model to dictionary for API responses."""
-        return {
-            'id': str(self.id),
-            'tender_id': self.tender_id,
-            'user_id': str(self.user_id) if self.user_id else None,
-            'requirement_index': self.requirement_index,
-            'original_requirement': self.original_requirement,
-            'edited_requirement': self.edited_requirement,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class BidSynopsisCeigallData(Base):
-    """
-    Stores CEIGALL company data for bid synopsis.
-    Allows users to enter company-specific values for each requirement.
-    """
-    __tablename__ = 'bid_synopsis_ceigall_data'
-
-    # Primary Keys
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tender_id = Column(String, nullable=False, index=True)  # tender_ref_number
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True, index=True)
-
-    # Data Index (position in the requirements array)
-    data_index = Column(Integer, nullable=False)
-
-    # Ceigall value
-    ceigall_value = Column(Text, nullable=False)
+class BidSynopsisKind(str, enum.Enum):
+    """Which part of the bid synopsis an edited value belongs to."""
+    requirement = "requirement"          # User-edited requirement text
+    ceigall = "ceigall"                  # CEIGALL company data for a requirement
+    extracted_value = "extracted_value"  # User-edited extracted value for a requirement
 
-    # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
-                       onupdate=lambda: datetime.now(timezone.utc), nullable=False)
 
-    def to_dict(self):
-        """Convert SQLAlchemy model to dictionary for API responses."""
-        return {
-            'id': str(self.id),
-            'tender_id': self.tender_id,
-            'user_id': str(self.user_id) if self.user_id else None,
-            'data_index': self.data_index,
-            'ceigall_value': self.ceigall_value,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class BidSynopsisExtractedValue(Base):
+class BidSynopsisValue(Base):
     """
-    Stores edited extracted values for bid synopsis.
-    Allows users to customize extracted numeric values for each requirement.
+    Stores user-edited bid synopsis data for each tender.
+    One row per (tender, kind, position in the requirements array); the table
+    is LIST-partitioned by kind so all edits for a tender load in one query.
     """
-    __tablename__ = 'bid_synopsis_extracted_values'
-
-    # Primary Keys
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tender_id = Column(String, nullable=False, index=True)  # tender_ref_number
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True, index=True)
+    __tablename__ = 'bid_synopsis_values'
+    __table_args__ = (
+        Index('ix_bid_synopsis_values_lookup', 'tender_id', 'kind', 'ord'),  # Per-tender load and per-item upsert lookup
+        {'postgresql_partition_by': 'LIST (kind)'},
+    )
+
+    # Primary Keys (partition key must be part of the primary key)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('uuid_generate_v7()'))  # Time-ordered, generated by PostgreSQL
+    kind = Column(Enum(BidSynopsisKind, name='bidsynopsiskind'), primary_key=True)
+    tender_id = Column(String, nullable=False)  # tender_ref_number
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL', onupdate='CASCADE'),
+                     nullable=True, index=True)
+
+    # Position in the requirements array
+    ord = Column(Integer, nullable=False)
 
-    # Data Index (position in the requirements array)
-    value_index = Column(Integer, nullable=False)
-
-    # Extracted value
-    extracted_value = Column(Text, nullable=False)
+    # Original and edited values
+    original_value = Column(Text, nullable=True)  # Original text (requirements only)
+    value = Column(Text, nullable=False)          # User-edited value
 
-    # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
-                       onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    # Timestamps (set by PostgreSQL: now() defaults + moddatetime trigger on UPDATE)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(),
+                        server_onupdate=FetchedValue(), nullable=False)
 
     def to_dict(self):
         """Convert SQLAlchemy model to dictionary for API responses."""
         return {
             'id': str(self.id),
+            'kind': self.kind.value,
             'tender_id': self.tender_id,
             'user_id': str(self.user_id) if self.user_id else None,
-            'value_index': self.value_index,
-            'extracted_value': self.extracted_value,
+            'ord': self.ord,
+            'original_value': self.original_value,
+            'value': self.value,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
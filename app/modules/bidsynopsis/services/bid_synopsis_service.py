@@ -9,11 +9,7 @@ from app.modules.bidsynopsis.pydantic_models import (
     BidSynopsisResponse,
     SaveBidSynopsisRequest
 )
-from app.modules.bidsynopsis.db.schema import (
-    BidSynopsisRequirement,
-    BidSynopsisCeigallData,
-    BidSynopsisExtractedValue
-)
+from app.modules.bidsynopsis.db.schema import BidSynopsisKind
 from app.modules.analyze.db.schema import TenderAnalysis
 
 
@@ -69,35 +65,20 @@ class BidSynopsisService:
         # Generate bid synopsis using business logic with analysis data
         bid_synopsis = generate_bid_synopsis(tender, scraped_tender, analysis)
 
-        # Load saved edited requirements from database
-        saved_requirements = db.query(BidSynopsisRequirement).filter(
-            BidSynopsisRequirement.tender_id == tender_ref_number
-        ).all()
-
-        # Load saved ceigall data from database
-        saved_ceigall = db.query(BidSynopsisCeigallData).filter(
-            BidSynopsisCeigallData.tender_id == tender_ref_number
-        ).all()
-
-        # Load saved extracted values from database
-        saved_extracted = db.query(BidSynopsisExtractedValue).filter(
-            BidSynopsisExtractedValue.tender_id == tender_ref_number
-        ).all()
-
-        # Merge edited requirements into response
-        for saved_req in saved_requirements:
-            if saved_req.requirement_index < len(bid_synopsis.allRequirements):
-                bid_synopsis.allRequirements[saved_req.requirement_index].requirement = saved_req.edited_requirement
-
-        # Merge ceigall data into response
-        for saved_data in saved_ceigall:
-            if saved_data.data_index < len(bid_synopsis.allRequirements):
-                bid_synopsis.allRequirements[saved_data.data_index].ceigallValue = saved_data.ceigall_value
-
-        # Merge extracted values into response
-        for saved_val in saved_extracted:
-            if saved_val.value_index < len(bid_synopsis.allRequirements):
-                bid_synopsis.allRequirements[saved_val.value_index].extractedValue = saved_val.extracted_value
+        # Load all saved edits (requirements, ceigall data, extracted values) in one query
+        saved_values = repo.get_synopsis_values(tender_ref_number)
+
+        # Merge saved edits into response
+        requirements = bid_synopsis.allRequirements
+        for saved in saved_values:
+            if saved.ord >= len(requirements):
+                continue
+            if saved.kind == BidSynopsisKind.requirement:
+                requirements[saved.ord].requirement = saved.value
+            elif saved.kind == BidSynopsisKind.ceigall:
+                requirements[saved.ord].ceigallValue = saved.value
+            elif saved.kind == BidSynopsisKind.extracted_value:
+                requirements[saved.ord].extractedValue = saved.value
 
         return bid_synopsis
 
@@ -149,71 +130,22 @@ class BidSynopsisService:
                 except ValueError:
                     pass  # If invalid UUID, keep as None
 
+            repo = BidSynopsisRepository(db)
+
             # Save requirement data
-            for index, edited_text in request.requirement_data.items():
-                # Check if record exists
-                existing = db.query(BidSynopsisRequirement).filter(
-                    BidSynopsisRequirement.tender_id == request.tender_id,
-                    BidSynopsisRequirement.requirement_index == index
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.edited_requirement = edited_text
-                    existing.user_id = user_id_uuid
-                else:
-                    # Create new record
-                    new_requirement = BidSynopsisRequirement(
-                        tender_id=request.tender_id,
-                        user_id=user_id_uuid,
-                        requirement_index=index,
-                        edited_requirement=edited_text
-                    )
-                    db.add(new_requirement)
+            repo.upsert_synopsis_values(
+                BidSynopsisKind.requirement, request.tender_id, user_id_uuid, request.requirement_data
+            )
 
             # Save ceigall data
-            for index, value in request.ceigall_data.items():
-                # Check if record exists
-                existing = db.query(BidSynopsisCeigallData).filter(
-                    BidSynopsisCeigallData.tender_id == request.tender_id,
-                    BidSynopsisCeigallData.data_index == index
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.ceigall_value = value
-                    existing.user_id = user_id_uuid
-                else:
-                    # Create new record
-                    new_data = BidSynopsisCeigallData(
-                        tender_id=request.tender_id,
-                        user_id=user_id_uuid,
-                        data_index=index,
-                        ceigall_value=value
-                    )
-                    db.add(new_data)
+            repo.upsert_synopsis_values(
+                BidSynopsisKind.ceigall, request.tender_id, user_id_uuid, request.ceigall_data
+            )
 
             # Save extracted value data
-            for index, value in request.extracted_value_data.items():
-                # Check if record exists
-                existing = db.query(BidSynopsisExtractedValue).filter(
-                    BidSynopsisExtractedValue.tender_id == request.tender_id,
-                    BidSynopsisExtractedValue.value_index == index
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.extracted_value = value
-                    existing.user_id = user_id_uuid
-                else:
-                    # Create new record
-                    new_extracted = BidSynopsisExtractedValue(
-                        tender_id=request.tender_id,
-                        user_id=user_id_uuid,
-                        value_index=index,
-                        extracted_value=value
-                    )
-                    db.add(new_extracted)
+            repo.upsert_synopsis_values(
+                BidSynopsisKind.extracted_value, request.tender_id, user_id_uuid, request.extracted_value_data
+            )
 
             # Commit all changes
             db.commit()
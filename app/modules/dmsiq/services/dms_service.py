@@ -825,7 +825,7 @@ class DmsService:
         2. If not cached → download from source URL → cache → return cached path
         """
         import requests
-        from app.modules.dmsiq.services.file_storage import FileStorageService
+        from app.modules.dmsiq.services.file_storage import FileStorageService, DOWNLOAD_CHUNK_SIZE
 
         # Check if already cached
         if document.is_cached:
@@ -841,16 +841,13 @@ class DmsService:
             )
 
         try:
-            # Download from remote URL
-            response = requests.get(document.source_url, timeout=60)
-            response.raise_for_status()
-            file_content = response.content
-
-            # Cache the file
-            success, result = FileStorageService.save_file(
-                file_content,
-                document.storage_path
-            )
+            # Download from remote URL, streaming it straight into the cache
+            with requests.get(document.source_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                success, result = FileStorageService.save_stream(
+                    response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                    document.storage_path
+                )
 
             if not success:
                 raise HTTPException(
@@ -9,7 +9,7 @@ import shutil
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 import mimetypes
 
 from app.config import settings
@@ -18,6 +18,9 @@ from app.config import settings
 DMS_ROOT = Path(__file__).parent.parent.parent.parent.parent / "dms"
 DMS_ROOT.mkdir(exist_ok=True, parents=True)
 
+# Bytes per read when streaming a remote file to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class FileStorageService:
     """Handles file storage operations for DMS documents."""
@@ -104,6 +107,33 @@ class FileStorageService:
         except Exception as e:
             return False, f"Error saving file: {str(e)}"
 
+    @staticmethod
+    def save_stream(chunks: Iterable[bytes], storage_path: str) -> Tuple[bool, str]:
+        """
+        Save file to disk from an iterable of byte chunks (e.g. a streamed
+        download), so the whole file is never held in memory.
+
+        Args:
+            chunks: File content as successive byte strings
+            storage_path: Relative storage path
+
+        Returns:
+            Tuple of (success, full_path or error_message)
+        """
+        full_path = DMS_ROOT / storage_path
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(full_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+            return True, str(full_path)
+        except Exception as e:
+            # The stream can fail part-way (e.g. a dropped connection); don't leave a truncated file
+            full_path.unlink(missing_ok=True)
+            return False, f"Error saving file: {str(e)}"
+
     @staticmethod
     def read_file(storage_path: str) -> Tuple[bool, Optional[bytes]]:
         """
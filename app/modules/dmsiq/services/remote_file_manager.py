@@ -21,7 +21,7 @@ from datetime import datetime
 import requests
 from sqlalchemy.orm import Session
 
-from app.modules.dmsiq.services.file_storage import FileStorageService, DMS_ROOT
+from app.modules.dmsiq.services.file_storage import FileStorageService, DMS_ROOT, DOWNLOAD_CHUNK_SIZE
 from app.modules.scraper.db.schema import ScrapedTenderFile
 from app.modules.scraper.db.repository import ScraperRepository
 
@@ -161,15 +161,13 @@ class RemoteFileManager:
             Tuple of (success, message)
         """
         try:
-            # Download file from remote
-            response = requests.get(file_record.file_url, timeout=60)
-            response.raise_for_status()
-
-            # Save to local DMS storage
-            success, result = FileStorageService.save_file(
-                response.content,
-                file_record.dms_path
-            )
+            # Download file from remote, streaming it straight to local DMS storage
+            with requests.get(file_record.file_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                success, result = FileStorageService.save_stream(
+                    response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                    file_record.dms_path
+                )
 
             if not success:
                 # Update database with failure
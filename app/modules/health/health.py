@@ -1,13 +1,15 @@
 from fastapi import APIRouter
 from app.modules.health.models.health import HealthResponse
 from app.utils import get_consistent_timestamp
-from app.core.services import pdf_processor
 
 router = APIRouter()
 
 @router.get("/health", response_model=HealthResponse, tags=["Health"])
 def health_check():
     """Health check"""
+    # app.core.services connects Weaviate and Gemini on import; keep it out of
+    # the router import path (app.api.v1.router is loaded without the app)
+    from app.core.services import pdf_processor
     return {
         "status": "healthy",
         "timestamp": get_consistent_timestamp(),
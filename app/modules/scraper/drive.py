@@ -115,8 +115,9 @@ def download_folders(data: HomePageData):
                     if not os.path.exists(file_path):
                         # Download the file
                         print("Downloading file " + file.file_name + " to " + file_path)
-                        with open(file_path, 'wb') as f:
-                            f.write(requests.get(file.file_url).content)
+                        with requests.get(file.file_url, stream=True) as response, open(file_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                                f.write(chunk)
 
                 # Upload the tender folder to Google Drive and get the folder id
                 tender_folder_id = upload_folder_to_drive(service, folder_path, date_folder_id)
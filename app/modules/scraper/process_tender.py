@@ -12,7 +12,7 @@ from app.db.database import SessionLocal
 from app.modules.scraper.db.schema import ScrapedTender
 from app.modules.tenderiq.db.repository import TenderRepository
 from app.modules.tenderiq.models.pydantic_models import ReviewStatusEnum
-from app.modules.analyze.repository import AnalyzeRepository
+from app.modules.analyze.repositories import repository as analyze_repo
 from app.modules.analyze.db.schema import AnalysisStatusEnum
 from app.modules.analyze.models.pydantic_models import OnePagerSchema
 
@@ -43,13 +43,14 @@ def start_tender_processing(tender: TenderDetailPage):
             try:
                 # a. Download the file
                 print(f"  ⬇️  Downloading: {file_info.file_name} from {file_info.file_url}")
-                response = requests.get(file_info.file_url, timeout=60)
-                response.raise_for_status()
-
-                # b. Save to temporary path
                 temp_file_path = os.path.join(temp_dir, file_info.file_name)
-                with open(temp_file_path, 'wb') as f:
-                    f.write(response.content)
+                with requests.get(file_info.file_url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+
+                    # b. Stream to temporary path
+                    with open(temp_file_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            f.write(chunk)
                 print(f"  💾 Saved temporarily to: {temp_file_path}")
 
                 # 2. Text extraction & 3. Chunking
@@ -158,10 +159,9 @@ ANSWER:"""
                 return f"Error during generation: {e}"
 
         # a. Create a TenderAnalysis record
-        analyze_repo = AnalyzeRepository(db)
-        analysis = analyze_repo.create_for_tender(tender_id, user_id=None)
+        analysis = analyze_repo.create_for_tender(db, tender_id, user_id=None)
         
-        analyze_repo.update(analysis, {"status": AnalysisStatusEnum.analyzing, "status_message": "Generating One-Pager..."})
+        analyze_repo.update(db, analysis, {"status": AnalysisStatusEnum.analyzing, "status_message": "Generating One-Pager..."})
 
         # c. Extract data for One-Pager
         print("\n📄 Generating One-Pager...")
@@ -175,13 +175,13 @@ ANSWER:"""
         
         # d. Validate with Pydantic model and save
         one_pager = OnePagerSchema(**one_pager_data)
-        analyze_repo.update(analysis, {"one_pager_json": one_pager.model_dump()})
+        analyze_repo.update(db, analysis, {"one_pager_json": one_pager.model_dump()})
         print("  ✅ One-Pager generated and saved.")
 
         # TODO: Repeat for ScopeOfWorkSchema and DataSheetSchema here
 
         # e. Finalize analysis
-        analyze_repo.update(analysis, {"status": AnalysisStatusEnum.completed, "status_message": "Analysis complete."})
+        analyze_repo.update(db, analysis, {"status": AnalysisStatusEnum.completed, "status_message": "Analysis complete."})
 
         if scraped_tender_orm:
             scraped_tender_orm.analysis_status = "completed"
@@ -195,8 +195,8 @@ ANSWER:"""
     except Exception as e:
         print(f"❌ An error occurred during LLM analysis for tender {tender_id}: {e}")
         traceback.print_exc()
-        if 'analysis' in locals() and analysis and 'analyze_repo' in locals():
-            analyze_repo.update(analysis, {"status": AnalysisStatusEnum.failed, "error_message": str(e)})
+        if 'analysis' in locals() and analysis:
+            analyze_repo.update(db, analysis, {"status": AnalysisStatusEnum.failed, "error_message": str(e)})
         
         if scraped_tender_orm:
             scraped_tender_orm.analysis_status = "failed"
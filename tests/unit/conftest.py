@@ -0,0 +1,55 @@
+"""
+Shared fixtures for unit tests.
+
+- fake_redis / broken_redis: replace a module's get_redis_client with an
+  in-memory client or one whose every command fails
+"""
+
+import pytest
+import redis
+
+
+class FakeRedis:
+    """In-memory stand-in recording setex TTLs."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+class BrokenRedis:
+    """Client whose every command raises a connection error."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("down")
+        return fail
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Call with a module to back its get_redis_client with a new FakeRedis; returns the client."""
+    def install(module):
+        client = FakeRedis()
+        monkeypatch.setattr(module, "get_redis_client", lambda: client)
+        return client
+    return install
+
+
+@pytest.fixture
+def broken_redis(monkeypatch):
+    """Call with a module to make every Redis command it issues fail."""
+    def install(module):
+        monkeypatch.setattr(module, "get_redis_client", lambda: BrokenRedis())
+    return install
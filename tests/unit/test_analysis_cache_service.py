@@ -0,0 +1,43 @@
+"""
+Unit tests for app.modules.analyze.services.analysis_cache_service
+
+Tests for:
+- TTL selection for final vs in-progress analyses
+- Invalidation of every identifier for a tender
+- Redis failures degrading to a cache miss
+"""
+
+import pytest
+
+from app.modules.analyze.services import analysis_cache_service as analysis_cache
+
+
+class TestAnalysisCache:
+    """Test caching of serialized analysis responses."""
+
+    def test_round_trip(self, fake_redis):
+        fake_redis(analysis_cache)
+        analysis_cache.cache_analysis("51655667", '{"status": "completed"}', final=True)
+        assert analysis_cache.get_cached_analysis("51655667") == '{"status": "completed"}'
+
+    @pytest.mark.parametrize("final,ttl", [
+        (True, analysis_cache.FINAL_TTL_SECONDS),
+        (False, analysis_cache.IN_PROGRESS_TTL_SECONDS),
+    ])
+    def test_ttl_depends_on_status(self, fake_redis, final, ttl):
+        client = fake_redis(analysis_cache)
+        analysis_cache.cache_analysis("51655667", "{}", final=final)
+        assert client.ttls["analysis:v1:51655667"] == ttl
+
+    def test_invalidate_drops_all_identifiers(self, fake_redis):
+        client = fake_redis(analysis_cache)
+        analysis_cache.cache_analysis("51655667", "{}", final=True)
+        analysis_cache.cache_analysis("7d0e8b8e-0000-4000-8000-000000000000", "{}", final=True)
+        analysis_cache.invalidate_analysis("51655667", "7d0e8b8e-0000-4000-8000-000000000000", None)
+        assert client.store == {}
+
+    def test_redis_errors_are_a_miss(self, broken_redis):
+        broken_redis(analysis_cache)
+        assert analysis_cache.get_cached_analysis("51655667") is None
+        analysis_cache.cache_analysis("51655667", "{}", final=True)
+        analysis_cache.invalidate_analysis("51655667")
@@ -0,0 +1,57 @@
+"""
+Unit tests for app.core.helpers
+
+Tests for:
+- get_number_from_currency_string unit multipliers and fallbacks
+- parse_currency_series parity with the scalar parser
+- remove_starting_numbers
+"""
+
+import pytest
+
+from app.core.helpers import (
+    get_number_from_currency_string,
+    parse_currency_series,
+    remove_starting_numbers,
+)
+
+
+CURRENCY_CASES = [
+    ("1 Crore", 10000000.0),
+    ("2.5 crore", 25000000.0),
+    ("10 Lakhs", 1000000.0),
+    ("5 Thousand", 5000.0),
+    ("Rs. 12,345.67", 0.0),
+    ("12,345.67", 12345.0),
+    ("", 0.0),
+    ("N/A", 0.0),
+    ("1.2.3 crore", 0.0),
+]
+
+
+class TestGetNumberFromCurrencyString:
+    """Test scalar currency parsing."""
+
+    @pytest.mark.parametrize("value,expected", CURRENCY_CASES)
+    def test_parses_value(self, value, expected):
+        assert get_number_from_currency_string(value) == pytest.approx(expected)
+
+
+class TestParseCurrencySeries:
+    """Test vectorized currency parsing matches the scalar parser."""
+
+    def test_matches_scalar_parser(self):
+        pd = pytest.importorskip("pandas")
+        values = pd.Series([value for value, _ in CURRENCY_CASES])
+        result = parse_currency_series(values)
+        assert list(result) == pytest.approx([expected for _, expected in CURRENCY_CASES])
+
+
+class TestRemoveStartingNumbers:
+    """Test leading-number stripping."""
+
+    def test_strips_leading_number(self):
+        assert remove_starting_numbers("1. This is a string") == " This is a string"
+
+    def test_leaves_other_text(self):
+        assert remove_starting_numbers("This is 1. a string") == "This is 1. a string"
@@ -38,7 +38,7 @@ class TestLangChainConfig:
         """Test that embeddings initialize without errors."""
         embeddings = get_langchain_embeddings()
         assert embeddings is not None
-        assert embeddings.model_name == "all-MiniLM-L6-v2"
+        assert embeddings.model_name.endswith("all-MiniLM-L6-v2")
 
     def test_rag_prompt_template(self):
         """Test that RAG prompt template is properly configured."""
@@ -0,0 +1,33 @@
+"""
+Unit tests for app.modules.analyze.services.llm_result_cache_service
+
+Tests for:
+- Round trip of a cached analysis step
+- Keys depending on both step and context
+- Redis failures degrading to a cache miss
+"""
+
+from app.modules.analyze.services import llm_result_cache_service as llm_cache
+
+
+class TestLLMResultCache:
+    """Test caching of LLM analysis results by tender context."""
+
+    def test_round_trip(self, fake_redis):
+        client = fake_redis(llm_cache)
+        digest = llm_cache.context_digest("Tender ID: 51655667")
+        llm_cache.cache_result("one_pager_json", digest, {"project_overview": "Road widening"})
+        assert llm_cache.get_cached_result("one_pager_json", digest) == {"project_overview": "Road widening"}
+        assert list(client.ttls.values()) == [llm_cache.LLM_CACHE_TTL_SECONDS]
+
+    def test_miss_for_other_step_or_context(self, fake_redis):
+        fake_redis(llm_cache)
+        digest = llm_cache.context_digest("Tender ID: 51655667")
+        llm_cache.cache_result("one_pager_json", digest, {"project_overview": "Road widening"})
+        assert llm_cache.get_cached_result("data_sheet_json", digest) is None
+        assert llm_cache.get_cached_result("one_pager_json", llm_cache.context_digest("Tender ID: 51702878")) is None
+
+    def test_redis_errors_are_a_miss(self, broken_redis):
+        broken_redis(llm_cache)
+        assert llm_cache.get_cached_result("one_pager_json", "abc") is None
+        llm_cache.cache_result("one_pager_json", "abc", {})
@@ -0,0 +1,52 @@
+"""
+Unit tests for app.modules.analyze.services.report_cache_service
+
+Tests for:
+- Version tag derived from the analysis timestamps
+- Round trip of a rendered report
+- Older versions being dropped on write
+"""
+
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.analyze.services import report_cache_service as report_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_cache, "REPORT_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestReportCache:
+    """Test the on-disk report cache."""
+
+    def test_version_follows_updated_at(self):
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        updated = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        assert report_cache.report_version(SimpleNamespace(updated_at=None, created_at=created)) != \
+            report_cache.report_version(SimpleNamespace(updated_at=updated, created_at=created))
+
+    def test_round_trip(self):
+        report_cache.store_report("a1", "100", "pdf", io.BytesIO(b"%PDF-1.4"), "Tender_Analysis_1.pdf")
+        path, filename = report_cache.get_cached_report("a1", "100", "pdf")
+        assert filename == "Tender_Analysis_1.pdf"
+        assert path.read_bytes() == b"%PDF-1.4"
+
+    def test_miss(self):
+        assert report_cache.get_cached_report("a1", "100", "excel") is None
+
+    def test_new_version_replaces_old(self):
+        report_cache.store_report("a1", "100", "pdf", io.BytesIO(b"old"), "r.pdf")
+        report_cache.store_report("a1", "200", "pdf", io.BytesIO(b"new"), "r.pdf")
+        assert report_cache.get_cached_report("a1", "100", "pdf") is None
+        assert report_cache.get_cached_report("a1", "200", "pdf")[0].read_bytes() == b"new"
+
+    def test_source_is_rewound(self):
+        source = io.BytesIO(b"%PDF-1.4")
+        report_cache.store_report("a1", "100", "pdf", source, "r.pdf")
+        assert source.read() == b"%PDF-1.4"
@@ -0,0 +1,96 @@
+"""
+Unit tests for app.db.vector_store.VectorStoreManager
+
+Tests for:
+- Query embedding cache
+- Result deduplication and ordering
+- aquery parity with query
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.db import vector_store
+from app.db.vector_store import VectorStoreManager
+
+
+class FakeEmbeddingModel:
+    """Counts encode calls; returns a fixed unit vector per text."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        if isinstance(texts, str):
+            return np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        return np.tile(np.array([1.0, 0.0, 0.0], dtype=np.float32), (len(texts), 1))
+
+
+def _hit(content, distance, **props):
+    return SimpleNamespace(
+        properties={"content": content, **props},
+        metadata=SimpleNamespace(distance=distance),
+    )
+
+
+class FakeCollection:
+    """Returns canned near_vector hits, nearest first like Weaviate."""
+
+    def __init__(self, hits):
+        self.name = "Chat_test"
+        self.hits = hits
+        self.query = SimpleNamespace(near_vector=self._near_vector)
+        self.last_vector = None
+
+    def _near_vector(self, near_vector, limit, **kwargs):
+        self.last_vector = near_vector
+        return SimpleNamespace(objects=self.hits[:limit])
+
+
+@pytest.fixture
+def manager():
+    vector_store._encode_query.cache_clear()
+    return VectorStoreManager(weaviate_client=object(), embedding_model=FakeEmbeddingModel())
+
+
+class TestQueryEmbeddingCache:
+    """Test that repeated queries skip the encoder."""
+
+    def test_repeated_query_encodes_once(self, manager):
+        collection = FakeCollection([_hit("a", 0.1)])
+        manager.query(collection, "what is the EMD amount?")
+        manager.query(collection, "what is the EMD amount?")
+        assert manager.embedding_model.calls == 1
+
+    def test_cached_vector_is_read_only(self, manager):
+        collection = FakeCollection([_hit("a", 0.1)])
+        manager.query(collection, "scope of work")
+        with pytest.raises(ValueError):
+            collection.last_vector[0] = 0.0
+
+
+class TestQueryResults:
+    """Test dedup and ordering of query results."""
+
+    def test_dedups_on_full_content(self, manager):
+        header = "x" * 150
+        collection = FakeCollection([
+            _hit(header + "first", 0.1),
+            _hit(header + "second", 0.2),
+            _hit(header + "first", 0.3),
+        ])
+        results = manager.query(collection, "q")
+        assert [doc for doc, _, _ in results] == [header + "first", header + "second"]
+
+    def test_keeps_store_order_and_similarity(self, manager):
+        collection = FakeCollection([_hit("a", 0.1), _hit("b", 0.4)])
+        results = manager.query(collection, "q")
+        assert [sim for _, _, sim in results] == pytest.approx([0.9, 0.6])
+
+    def test_aquery_matches_query(self, manager):
+        collection = FakeCollection([_hit("a", 0.1), _hit("b", 0.4)])
+        assert asyncio.run(manager.aquery(collection, "q")) == manager.query(collection, "q")